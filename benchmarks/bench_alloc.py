@@ -0,0 +1,24 @@
+import uuid
+
+import uuid_utils
+
+HEXES = [str(u) for u in uuid_utils.uuid4_many(100)]
+NIL = uuid.UUID(int=0)
+
+
+def stdlib_parse_and_drop() -> None:
+    for value in HEXES:
+        uuid.UUID(value) == NIL  # noqa: B015
+
+
+def uuid_utils_parse_and_drop() -> None:
+    for value in HEXES:
+        uuid_utils.UUID(value) == uuid_utils.NIL  # noqa: B015
+
+
+__benchmarks__ = [
+    (
+        "parse, compare and drop 100 UUIDs",
+        [stdlib_parse_and_drop, uuid_utils_parse_and_drop],
+    ),
+]
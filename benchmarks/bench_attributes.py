@@ -0,0 +1,60 @@
+import uuid
+
+import uuid_utils
+
+HEX = "a8098c1a-f86e-11da-bd1a-00112444be1e"
+STDLIB = uuid.UUID(HEX)
+UUID = uuid_utils.UUID(HEX)
+CACHED = uuid_utils.CachedUUID(HEX)
+
+
+def stdlib_str() -> None:
+    for _ in range(10):
+        str(STDLIB)
+
+
+def uuid_utils_str() -> None:
+    for _ in range(10):
+        str(UUID)
+
+
+def cached_str() -> None:
+    for _ in range(10):
+        str(CACHED)
+
+
+def stdlib_hex() -> None:
+    for _ in range(10):
+        STDLIB.hex  # noqa: B018
+
+
+def uuid_utils_hex() -> None:
+    for _ in range(10):
+        UUID.hex  # noqa: B018
+
+
+def cached_hex() -> None:
+    for _ in range(10):
+        CACHED.hex  # noqa: B018
+
+
+def stdlib_bytes() -> None:
+    for _ in range(10):
+        STDLIB.bytes  # noqa: B018
+
+
+def uuid_utils_bytes() -> None:
+    for _ in range(10):
+        UUID.bytes  # noqa: B018
+
+
+def cached_bytes() -> None:
+    for _ in range(10):
+        CACHED.bytes  # noqa: B018
+
+
+__benchmarks__ = [
+    ("str() 10 times", [stdlib_str, uuid_utils_str, cached_str]),
+    ("hex 10 times", [stdlib_hex, uuid_utils_hex, cached_hex]),
+    ("bytes 10 times", [stdlib_bytes, uuid_utils_bytes, cached_bytes]),
+]
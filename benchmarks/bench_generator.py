@@ -4,6 +4,8 @@ import uuid_utils
 import uuid_utils.compat as uuid_compat
 
 node = uuid.getnode()
+names = [f"user-{i}@python.org" for i in range(100)]
+hasher = uuid_utils.NameHasher(uuid_utils.NAMESPACE_DNS)
 
 
 def stdlib_uuid1() -> None:
@@ -42,6 +44,18 @@ def compat_uuid4() -> None:
     uuid_compat.uuid4()
 
 
+def stdlib_uuid4_many() -> None:
+    [uuid.uuid4() for _ in range(100)]
+
+
+def uuid_utils_uuid4_many() -> None:
+    uuid_utils.uuid4_many(100)
+
+
+def compat_uuid4_many() -> None:
+    uuid_compat.uuid4_many(100)
+
+
 def stdlib_uuid5() -> None:
     uuid.uuid5(namespace=uuid.NAMESPACE_DNS, name="python.org")
 
@@ -54,6 +68,18 @@ def compat_uuid5() -> None:
     uuid_compat.uuid5(namespace=uuid_compat.NAMESPACE_DNS, name="python.org")
 
 
+def stdlib_uuid5_names() -> None:
+    [uuid.uuid5(uuid.NAMESPACE_DNS, name) for name in names]
+
+
+def uuid_utils_uuid5_names() -> None:
+    [uuid_utils.uuid5(uuid_utils.NAMESPACE_DNS, name) for name in names]
+
+
+def name_hasher_uuid5_names() -> None:
+    hasher.many(names)
+
+
 def stdlib_uuid6() -> None:
     uuid.uuid6()  # type: ignore[attr-defined]
 
@@ -82,7 +108,12 @@ __benchmarks__ = [
     ("uuid1()", [stdlib_uuid1, uuid_utils_uuid1, compat_uuid1]),
     ("uuid3()", [stdlib_uuid3, uuid_utils_uuid3, compat_uuid3]),
     ("uuid4()", [stdlib_uuid4, uuid_utils_uuid4, compat_uuid4]),
+    ("100 uuid4()", [stdlib_uuid4_many, uuid_utils_uuid4_many, compat_uuid4_many]),
     ("uuid5()", [stdlib_uuid5, uuid_utils_uuid5, compat_uuid5]),
+    (
+        "uuid5() for 100 names",
+        [stdlib_uuid5_names, uuid_utils_uuid5_names, name_hasher_uuid5_names],
+    ),
     ("uuid6()", [stdlib_uuid6, uuid_utils_uuid6, compat_uuid6]),
     ("uuid7()", [stdlib_uuid7, uuid_utils_uuid7, compat_uuid7]),
 ]
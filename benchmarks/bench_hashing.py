@@ -0,0 +1,41 @@
+import uuid
+
+import uuid_utils
+
+NATIVE = uuid_utils.uuid4_many(100)
+STDLIB = [uuid.UUID(int=u.int) for u in NATIVE]
+NATIVE_KEYS = dict.fromkeys(NATIVE)
+STDLIB_KEYS = dict.fromkeys(STDLIB)
+
+
+def stdlib_set() -> None:
+    set(STDLIB)
+
+
+def uuid_utils_set() -> None:
+    set(NATIVE)
+
+
+def stdlib_dict() -> None:
+    dict.fromkeys(STDLIB)
+
+
+def uuid_utils_dict() -> None:
+    dict.fromkeys(NATIVE)
+
+
+def stdlib_lookup() -> None:
+    for key in STDLIB:
+        STDLIB_KEYS[key]
+
+
+def uuid_utils_lookup_stdlib() -> None:
+    for key in STDLIB:
+        NATIVE_KEYS[key]
+
+
+__benchmarks__ = [
+    ("set of 100 UUIDs", [stdlib_set, uuid_utils_set]),
+    ("dict of 100 UUIDs", [stdlib_dict, uuid_utils_dict]),
+    ("look up 100 stdlib UUIDs", [stdlib_lookup, uuid_utils_lookup_stdlib]),
+]
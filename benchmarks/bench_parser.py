@@ -1,3 +1,4 @@
+import re
 import uuid
 
 import uuid_utils
@@ -6,6 +7,11 @@ HEX = "a8098c1a-f86e-11da-bd1a-00112444be1e"
 BYTES = uuid.UUID(HEX).bytes
 INT = uuid.UUID(HEX).int
 FIELDS = (2819197978, 63598, 4570, 189, 26, 73622928926)
+HEXES = [HEX] * 100
+LOG = f"GET /users/{HEX} 200 12ms\n".encode() * 100
+UUID_PATTERN = re.compile(
+    rb"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
 
 
 def stdlib_from_hex() -> None:
@@ -16,6 +22,22 @@ def uuid_utils_from_hex() -> None:
     uuid_utils.UUID(HEX)
 
 
+def uuid_utils_from_str() -> None:
+    uuid_utils.UUID.from_str(HEX)
+
+
+def stdlib_parse_many() -> None:
+    [uuid.UUID(value) for value in HEXES]
+
+
+def uuid_utils_parse_loop() -> None:
+    [uuid_utils.UUID(value) for value in HEXES]
+
+
+def uuid_utils_parse_many() -> None:
+    uuid_utils.parse_many(HEXES)
+
+
 def stdlib_from_bytes() -> None:
     uuid.UUID(bytes=BYTES)
 
@@ -24,6 +46,10 @@ def uuid_utils_from_bytes() -> None:
     uuid_utils.UUID(bytes=BYTES)
 
 
+def uuid_utils_from_bytes_method() -> None:
+    uuid_utils.UUID.from_bytes(BYTES)
+
+
 def stdlib_from_int() -> None:
     uuid.UUID(int=INT)
 
@@ -40,9 +66,32 @@ def uuid_utils_from_fields() -> None:
     uuid_utils.UUID(fields=FIELDS)
 
 
+def stdlib_regex_scan() -> None:
+    [uuid.UUID(match.group().decode()) for match in UUID_PATTERN.finditer(LOG)]
+
+
+def uuid_utils_regex_scan() -> None:
+    [uuid_utils.UUID(match.group().decode()) for match in UUID_PATTERN.finditer(LOG)]
+
+
+def uuid_utils_scan() -> None:
+    list(uuid_utils.scan(LOG))
+
+
 __benchmarks__ = [
-    ("UUID from hex", [stdlib_from_hex, uuid_utils_from_hex]),
-    ("UUID from bytes", [stdlib_from_bytes, uuid_utils_from_bytes]),
+    ("UUID from hex", [stdlib_from_hex, uuid_utils_from_hex, uuid_utils_from_str]),
+    (
+        "100 UUIDs from hex",
+        [stdlib_parse_many, uuid_utils_parse_loop, uuid_utils_parse_many],
+    ),
+    (
+        "100 UUIDs from a log",
+        [stdlib_regex_scan, uuid_utils_regex_scan, uuid_utils_scan],
+    ),
+    (
+        "UUID from bytes",
+        [stdlib_from_bytes, uuid_utils_from_bytes, uuid_utils_from_bytes_method],
+    ),
     ("UUID from int", [stdlib_from_int, uuid_utils_from_int]),
     ("UUID from fields", [stdlib_from_fields, uuid_utils_from_fields]),
 ]
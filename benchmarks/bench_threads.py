@@ -0,0 +1,69 @@
+"""Multi-threaded uuid7() scaling.
+
+Run directly to print ns/op from 1 to N threads, comparing the shared
+module-level `uuid7()` with one `Generator` per thread. The gap is most
+visible on free-threaded builds such as 3.14t, where threads really do
+generate in parallel:
+
+    python benchmarks/bench_threads.py [max_threads] [ops_per_thread]
+"""
+
+import os
+import sys
+import threading
+import time
+
+import uuid_utils
+
+generator = uuid_utils.Generator()
+
+
+def shared_uuid7() -> None:
+    uuid_utils.uuid7()
+
+
+def generator_uuid7() -> None:
+    generator.uuid7()
+
+
+def run(threads: int, ops: int, per_thread_generator: bool) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        uuid7 = (
+            uuid_utils.Generator().uuid7 if per_thread_generator else uuid_utils.uuid7
+        )
+        barrier.wait()
+        for _ in range(ops):
+            uuid7()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter_ns()
+    for thread in workers:
+        thread.join()
+    return (time.perf_counter_ns() - start) / (threads * ops)
+
+
+def main() -> None:
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    ops = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>8} {'uuid7() ns/op':>15} {'Generator ns/op':>16}")
+    threads = 1
+    while threads <= max_threads:
+        shared = run(threads, ops, per_thread_generator=False)
+        local = run(threads, ops, per_thread_generator=True)
+        print(f"{threads:>8} {shared:>15.1f} {local:>16.1f}")
+        threads *= 2
+
+
+__benchmarks__ = [
+    ("uuid7() vs Generator.uuid7()", [shared_uuid7, generator_uuid7]),
+]
+
+if __name__ == "__main__":
+    main()
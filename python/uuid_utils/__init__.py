@@ -1,5 +1,6 @@
+from __future__ import annotations
+
 import os
-from uuid import SafeUUID
 
 from ._uuid_utils import (
     MAX,
@@ -13,15 +14,47 @@ from ._uuid_utils import (
     RESERVED_NCS,
     RFC_4122,
     UUID,
+    CachedUUID,
+    Generator,
+    NameHasher,
+    SortedUUIDIndex,
+    UUIDSet,
     __version__,
+    format_many,
     getnode,
+    parse_many,
+    scan,
+    set_entropy_pool_size,
+    set_node,
     uuid1,
+    uuid1_bytes,
+    uuid1_into,
+    uuid1_many,
     uuid3,
+    uuid3_bytes,
+    uuid3_many,
     uuid4,
+    uuid4_bytes,
+    uuid4_into,
+    uuid4_many,
     uuid5,
+    uuid5_bytes,
+    uuid5_many,
     uuid6,
+    uuid6_bounds,
+    uuid6_bytes,
+    uuid6_into,
+    uuid6_many,
     uuid7,
+    uuid7_bounds,
+    uuid7_bytes,
+    uuid7_into,
+    uuid7_many,
     uuid8,
+    uuid8_bytes,
+    uuid8_into,
+    uuid8_many,
+    warm_node,
 )
 from ._uuid_utils import (
     _uuid4_int as _uuid4_int,
@@ -33,32 +66,103 @@ from ._uuid_utils import (
     reseed as reseed_rng,
 )
 
+# Only for annotations: importing `typing` would slow down `import uuid_utils`.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
 # Reseed the RNG in the child process after a fork.
 # Otherwise both parent and child processes may generate the same UUIDs for some time.
 if hasattr(os, "fork"):
     os.register_at_fork(after_in_child=reseed_rng)
 
+
+def _node_from_environment(environ: Mapping[str, str]) -> None:
+    # The node for `uuid1()` and `uuid6()` can be given as a MAC address, e.g. to
+    # give each container its own, or found in the background instead of on first use.
+    if "UUID_UTILS_NODE" in environ:
+        node = environ["UUID_UTILS_NODE"]
+        try:
+            set_node(int(node.replace(":", "").replace("-", ""), 16))
+        except ValueError:
+            raise ValueError(
+                f"UUID_UTILS_NODE is not a MAC address: {node!r}"
+            ) from None
+    elif environ.get("UUID_UTILS_WARM_NODE") == "1":
+        warm_node(background=True)
+
+
+_node_from_environment(os.environ)
+
+
+def __getattr__(name: str) -> Any:
+    # The standard library `uuid` module and `uuid_utils.compat` are only
+    # imported when first used, to keep `import uuid_utils` fast.
+    if name == "SafeUUID":
+        from uuid import SafeUUID
+
+        return SafeUUID
+    if name == "compat":
+        from . import compat
+
+        return compat
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
+    "CachedUUID",
+    "Generator",
     "MAX",
     "NAMESPACE_DNS",
     "NAMESPACE_OID",
     "NAMESPACE_URL",
     "NAMESPACE_X500",
     "NIL",
+    "NameHasher",
     "RESERVED_FUTURE",
     "RESERVED_MICROSOFT",
     "RESERVED_NCS",
     "RFC_4122",
-    "UUID",
     "SafeUUID",
+    "SortedUUIDIndex",
+    "UUID",
+    "UUIDSet",
     "__version__",
+    "format_many",
     "getnode",
+    "parse_many",
     "reseed_rng",
+    "scan",
+    "set_entropy_pool_size",
+    "set_node",
     "uuid1",
+    "uuid1_bytes",
+    "uuid1_into",
+    "uuid1_many",
     "uuid3",
+    "uuid3_bytes",
+    "uuid3_many",
     "uuid4",
+    "uuid4_bytes",
+    "uuid4_into",
+    "uuid4_many",
     "uuid5",
+    "uuid5_bytes",
+    "uuid5_many",
     "uuid6",
+    "uuid6_bounds",
+    "uuid6_bytes",
+    "uuid6_into",
+    "uuid6_many",
     "uuid7",
+    "uuid7_bounds",
+    "uuid7_bytes",
+    "uuid7_into",
+    "uuid7_many",
     "uuid8",
+    "uuid8_bytes",
+    "uuid8_into",
+    "uuid8_many",
+    "warm_node",
 ]
@@ -1,12 +1,16 @@
 import builtins
 import sys
-from typing import Final, TypeAlias
+from collections.abc import Callable, Iterable, Iterator
+from typing import Final, Literal, Protocol, TypeAlias, overload
+from uuid import UUID as _StdlibUUID
 from uuid import SafeUUID
 
-from typing_extensions import LiteralString
+from typing_extensions import Buffer, LiteralString
 
 # Because UUID has properties called int and bytes we need to rename these temporarily.
 _FieldsType: TypeAlias = tuple[int, int, int, int, int, int]
+# Namespaces may also be standard library UUIDs, which are read through `.int`.
+_Namespace: TypeAlias = UUID | _StdlibUUID
 
 __version__: str
 
@@ -115,15 +119,228 @@ class UUID:
     def variant(self) -> str: ...
     @property
     def version(self) -> builtins.int | None: ...
+    @staticmethod
+    def from_str(value: str) -> UUID:
+        """Parse a UUID string, like `UUID(value)` without the keyword
+        argument handling of the constructor."""
+        ...
+
+    @staticmethod
+    def from_bytes(value: builtins.bytes, /) -> UUID:
+        """Create a UUID from 16 big-endian bytes, like `UUID(bytes=value)`."""
+        ...
+
+    def write_to(self, buffer: Buffer, offset: builtins.int = 0) -> builtins.int:
+        """Copy the 16 big-endian bytes into a writable buffer at `offset`,
+        returning the offset just after them."""
+        ...
+
+    def __buffer__(self, flags: builtins.int, /) -> memoryview: ...
     def __int__(self) -> builtins.int: ...
     def __hash__(self) -> builtins.int: ...
     def __eq__(self, other: object) -> bool: ...
-    def __lt__(self, other: UUID) -> bool: ...
-    def __le__(self, other: UUID) -> bool: ...
-    def __gt__(self, other: UUID) -> bool: ...
-    def __ge__(self, other: UUID) -> bool: ...
+    def __lt__(self, other: UUID | _StdlibUUID) -> bool: ...
+    def __le__(self, other: UUID | _StdlibUUID) -> bool: ...
+    def __gt__(self, other: UUID | _StdlibUUID) -> bool: ...
+    def __ge__(self, other: UUID | _StdlibUUID) -> bool: ...
+
+class CachedUUID(UUID):
+    """A `UUID` that keeps the objects returned by `str()`, `hex`, `urn`,
+    `bytes` and `bytes_le` once they are first created.
+
+    Repeated access returns the same object instead of formatting and
+    allocating a new one, at the cost of up to about 350 bytes per UUID
+    for the cached objects. It is accepted anywhere a `UUID` is.
+    """
+
+class Generator:
+    """A UUID generator with its own v7 timestamp and counter state,
+    e.g. one per thread instead of the shared state of `uuid7()`.
+
+    'v7_method' chooses how version 7 UUIDs within the same millisecond are
+    kept ordered (RFC 9562, section 6.2):
+
+    - "counter": a 42-bit counter followed by 32 random bits.
+    - "random": 74 random bits, incremented by a random amount each time.
+    - "precision": a 12-bit sub-millisecond fraction followed by a 30-bit
+      counter and 32 random bits.
+
+    If the counter space of a millisecond (or fraction of it) is exhausted,
+    `uuid7()` raises OverflowError rather than moving the timestamp forward.
+
+    'clock' is called with no arguments for the current time in nanoseconds
+    since the epoch, such as `time.time_ns` or a cached or simulated clock.
+    By default the system clock is used.
+
+    'rng' chooses where random bits come from. "secure" uses the same
+    CSPRNG as the module-level functions. "fast" uses a non-cryptographic
+    wyrand generator, which is several times faster but predictable, so it
+    must only be used for IDs that do not need to be unguessable. A fast
+    generator can be given a 'seed' to reproduce the exact same sequence of
+    UUIDs, e.g. in tests. Unseeded fast generators reseed themselves in a
+    forked child when `reseed_rng()` is called, seeded ones do not.
+    """
+
+    def __init__(
+        self,
+        *,
+        v7_method: _V7Method = "counter",
+        clock: Callable[[], int] | None = None,
+        rng: Literal["secure", "fast"] = "secure",
+        seed: int | None = None,
+    ) -> None: ...
+    @property
+    def v7_method(self) -> _V7Method: ...
+    @property
+    def rng(self) -> Literal["secure", "fast"]: ...
+    def uuid4(self) -> UUID:
+        """Generate a random UUID."""
+        ...
+
+    def uuid7(self, *, timestamp: int | None = None) -> UUID:
+        """Generate a UUID from a Unix timestamp in milliseconds and random bits.
+        If 'timestamp' is given, it is used instead of the generator's clock.
+
+        UUIDs from the same generator are strictly increasing.
+        """
+        ...
+
+    def uuid8(self) -> UUID:
+        """Generate a version 8 UUID with pseudo-random blocks."""
+        ...
+
+    def uuid4_many(self, n: int) -> list[UUID]:
+        """Generate a list of `n` random UUIDs in a single call."""
+        ...
+
+    def uuid7_many(self, n: int, *, timestamp: int | None = None) -> list[UUID]:
+        """Generate a list of `n` version 7 UUIDs in a single call,
+        reading the clock once for the whole batch.
+
+        UUIDs from the same generator are strictly increasing.
+        """
+        ...
+
+    def uuid8_many(self, n: int) -> list[UUID]:
+        """Generate a list of `n` version 8 UUIDs with pseudo-random blocks."""
+        ...
+
+class NameHasher:
+    """Derive version 3 or 5 UUIDs for many names in a single namespace.
+
+    The MD5 or SHA-1 state is primed with the namespace once and cloned
+    for each name, so only the name itself is hashed on every call.
+    `hasher(name)` is equal to `uuid5(namespace, name)`, or to
+    `uuid3(namespace, name)` with `version=3`.
+    """
+
+    def __init__(self, namespace: _Namespace, version: Literal[3, 5] = 5) -> None: ...
+    @property
+    def namespace(self) -> UUID: ...
+    @property
+    def version(self) -> Literal[3, 5]: ...
+    def __call__(self, name: str | Buffer) -> UUID:
+        """Generate the UUID for a single name."""
+        ...
+
+    def many(
+        self, names: Iterable[str | Buffer], *, threads: int | None = None
+    ) -> list[UUID]:
+        """Generate the UUIDs for many names in a single call,
+        hashed in parallel as by `uuid5_many`."""
+        ...
+
+_UUIDItem: TypeAlias = UUID | str | bytes
+
+class UUIDSet:
+    """A set of UUIDs stored as 128-bit integers in a flat hash table.
+
+    Items may be `UUID` objects, 16-byte big-endian `bytes` or strings in
+    any form accepted by `UUID()`. Bulk operations also accept packed
+    buffers of big-endian UUIDs, which are read without creating objects.
+    Each UUID takes 22 to 43 bytes, instead of a `UUID` object and its
+    hash table entry, and membership tests do not allocate.
+    Iteration yields `UUID` objects in arbitrary order.
+    """
+
+    def __init__(self, values: Iterable[_UUIDItem] | Buffer | None = None) -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, item: object) -> bool: ...
+    def __iter__(self) -> Iterator[UUID]: ...
+    def add(self, item: _UUIDItem) -> None: ...
+    def discard(self, item: _UUIDItem) -> None: ...
+    def remove(self, item: _UUIDItem) -> None: ...
+    def clear(self) -> None: ...
+    def copy(self) -> UUIDSet: ...
+    def update(self, *others: Iterable[_UUIDItem] | Buffer) -> None: ...
+    def difference(self, other: Iterable[_UUIDItem] | Buffer) -> UUIDSet: ...
+    def difference_update(self, other: Iterable[_UUIDItem] | Buffer) -> None: ...
+    def intersection(self, other: Iterable[_UUIDItem] | Buffer) -> UUIDSet: ...
+    def intersection_update(self, other: Iterable[_UUIDItem] | Buffer) -> None: ...
+    def to_bytes(self) -> bytes:
+        """The UUIDs packed into `16 * n` big-endian bytes, in iteration order."""
+        ...
+
+class SortedUUIDIndex:
+    """A sorted, deduplicated index of version 6 or 7 UUIDs, searchable by time.
+
+    UUIDs of these versions sort in the order of their timestamps, so the
+    UUIDs created in a time window are found by binary search on their
+    128-bit values. Items and bulk loads are accepted as by `UUIDSet`.
+    An index of `version=6` must only hold version 6 UUIDs.
+    """
+
+    def __init__(
+        self,
+        values: Iterable[_UUIDItem] | Buffer | None = None,
+        *,
+        version: Literal[6, 7] = 7,
+    ) -> None: ...
+    @property
+    def version(self) -> Literal[6, 7]: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, item: object) -> bool: ...
+    def __getitem__(self, index: int) -> UUID: ...
+    def __iter__(self) -> Iterator[UUID]: ...
+    def add(self, item: _UUIDItem) -> None:
+        """Insert a single UUID, in `O(n)` time."""
+        ...
+
+    def update(self, *others: Iterable[_UUIDItem] | Buffer) -> None:
+        """Add many UUIDs at once, re-sorting the index once."""
+        ...
+
+    def count(self, start: int | None = None, end: int | None = None) -> int:
+        """The number of UUIDs with timestamps in milliseconds since epoch
+        from `start` up to but not including `end`."""
+        ...
+
+    def range(self, start: int | None = None, end: int | None = None) -> list[UUID]:
+        """The UUIDs with timestamps in milliseconds since epoch
+        from `start` up to but not including `end`, in order."""
+        ...
+
+    def range_bytes(self, start: int | None = None, end: int | None = None) -> bytes:
+        """Like `range`, but packed into `16 * n` big-endian bytes."""
+        ...
+
+    def to_bytes(self) -> bytes:
+        """All the UUIDs packed into `16 * n` big-endian bytes, in order."""
+        ...
 
 def getnode() -> int: ...
+def set_node(node: int | None) -> None:
+    """Use `node` as the host ID of `uuid1()` and `uuid6()` whenever one
+    is not given, and return it from `getnode()`. With `None`, the hardware
+    address is discovered again on next use."""
+    ...
+
+def warm_node(*, background: bool = False) -> int | None:
+    """Discover the hardware address now instead of on the first call to
+    `uuid1()`, `uuid6()` or `getnode()`, and return it. With `background`,
+    discover it on a new thread and return `None` immediately."""
+    ...
+
 def reseed_rng() -> None:
     """
     Reseeds the underlying rng.
@@ -135,19 +352,37 @@ def reseed_rng() -> None:
     """
     ...
 
-def uuid1(node: int | None = None, clock_seq: int | None = None) -> UUID:
+def set_entropy_pool_size(size: int) -> None:
+    """Set the size in bytes of the per-thread entropy pool that `uuid4()`,
+    `uuid7()` and `uuid8()` draw their random bits from.
+
+    The pool is refilled from the CSPRNG in one block whenever it runs out,
+    which amortizes the cost of the RNG over many single-UUID calls. The
+    size must be a multiple of 16, at most 1 MiB. 0 disables the pool.
+    The default is 4096. Pools are discarded by `reseed_rng()`.
+    """
+    ...
+
+def uuid1(
+    node: int | None = None,
+    clock_seq: int | None = None,
+    *,
+    timestamp: int | None = None,
+) -> UUID:
     """Generate a UUID from a host ID, sequence number, and the current time.
     If 'node' is not given, getnode() is used to obtain the hardware
     address.  If 'clock_seq' is given, it is used as the sequence number;
-    otherwise a random 14-bit sequence number is chosen."""
+    otherwise a random 14-bit sequence number is chosen.
+    If 'timestamp' is given in milliseconds since epoch, it is used
+    instead of the current time."""
     ...
 
 if sys.version_info >= (3, 12):
-    def uuid3(namespace: UUID, name: str | bytes) -> UUID:
+    def uuid3(namespace: _Namespace, name: str | bytes) -> UUID:
         """Generate a UUID from the MD5 hash of a namespace UUID and a name."""
         ...
 else:
-    def uuid3(namespace: UUID, name: str) -> UUID:
+    def uuid3(namespace: _Namespace, name: str) -> UUID:
         """Generate a UUID from the MD5 hash of a namespace UUID and a name."""
         ...
 
@@ -156,15 +391,20 @@ def uuid4() -> UUID:
     ...
 
 if sys.version_info >= (3, 12):
-    def uuid5(namespace: UUID, name: str | bytes) -> UUID:
+    def uuid5(namespace: _Namespace, name: str | bytes) -> UUID:
         """Generate a UUID from the SHA-1 hash of a namespace UUID and a name."""
         ...
 else:
-    def uuid5(namespace: UUID, name: str) -> UUID:
+    def uuid5(namespace: _Namespace, name: str) -> UUID:
         """Generate a UUID from the SHA-1 hash of a namespace UUID and a name."""
         ...
 
-def uuid6(node: int | None = None, clock_seq: int | None = None) -> UUID:
+def uuid6(
+    node: int | None = None,
+    clock_seq: int | None = None,
+    *,
+    timestamp: int | None = None,
+) -> UUID:
     """Similar to `uuid1` but where fields are ordered differently
     for improved DB locality.
 
@@ -172,13 +412,40 @@ def uuid6(node: int | None = None, clock_seq: int | None = None) -> UUID:
     for UUIDv6 the first 48 most significant bits are stored first, followed
     by the 4-bit version (same position), followed by the remaining 12 bits
     of the original 60-bit timestamp.
+
+    If 'timestamp' is given in milliseconds since epoch, it is used
+    instead of the current time.
     """
     ...
 
-def uuid7() -> UUID:
+def uuid7(*, timestamp: int | None = None) -> UUID:
     """Generate a UUID from a Unix timestamp in milliseconds and random bits.
 
     UUIDv7 objects feature monotonicity within a millisecond.
+
+    If 'timestamp' is given in milliseconds since epoch, it is used instead
+    of the current time, e.g. to backfill IDs for historical events.
+    Such UUIDs are not ordered with respect to other UUIDs.
+    """
+    ...
+
+def uuid6_bounds(start: int, end: int | None = None) -> tuple[UUID, UUID]:
+    """The smallest and largest version 6 UUIDs with timestamps from
+    `start` to `end` milliseconds since epoch, inclusive.
+
+    Every UUID that `uuid6()` generates in that window sorts between the
+    two, so they can be used as the bounds of a range query on an index
+    of version 6 UUIDs. 'end' defaults to 'start'.
+    """
+    ...
+
+def uuid7_bounds(start: int, end: int | None = None) -> tuple[UUID, UUID]:
+    """The smallest and largest version 7 UUIDs with timestamps from
+    `start` to `end` milliseconds since epoch, inclusive.
+
+    Every UUID that `uuid7()` generates in that window sorts between the
+    two, so they can be used as the bounds of a range query on an index
+    of version 7 UUIDs. 'end' defaults to 'start'.
     """
     ...
 
@@ -193,6 +460,247 @@ def uuid8(a: int | None = None, b: int | None = None, c: int | None = None) -> U
     """
     ...
 
+_V7Method: TypeAlias = Literal["counter", "random", "precision"]
+_Style: TypeAlias = Literal["hyphenated", "simple", "urn", "braced"]
+
+@overload
+def format_many(
+    values: Iterable[UUID] | Buffer,
+    style: _Style = "hyphenated",
+    *,
+    as_bytes: Literal[False] = False,
+) -> list[str]: ...
+@overload
+def format_many(
+    values: Iterable[UUID] | Buffer,
+    style: _Style = "hyphenated",
+    *,
+    as_bytes: Literal[True],
+) -> bytes: ...
+def format_many(
+    values: Iterable[UUID] | Buffer,
+    style: _Style = "hyphenated",
+    *,
+    as_bytes: bool = False,
+) -> list[str] | bytes:
+    """Format many UUIDs in a single call.
+    'values' is either an iterable of UUIDs or a buffer of UUIDs packed
+    in big-endian byte order, as returned by `uuid7_bytes` for example.
+
+    Returns a list of strings, or with as_bytes=True a single bytes object
+    holding the fixed-width ASCII form of every UUID back to back.
+    """
+    ...
+
+@overload
+def parse_many(
+    values: Iterable[str | bytes], *, errors: Literal["raise"] = "raise"
+) -> list[UUID]: ...
+@overload
+def parse_many(
+    values: Iterable[str | bytes], *, errors: Literal["none"]
+) -> list[UUID | None]: ...
+@overload
+def parse_many(
+    values: Iterable[str | bytes], *, errors: Literal["mask"]
+) -> tuple[bytes, bytes]: ...
+def parse_many(
+    values: Iterable[str | bytes], *, errors: Literal["raise", "none", "mask"] = "raise"
+) -> list[UUID] | list[UUID | None] | tuple[bytes, bytes]:
+    """Parse many UUID strings in a single call.
+    Each value may be a str or bytes in the simple, hyphenated, braced or URN form.
+
+    * errors="raise" returns a list of UUIDs and raises ValueError on the first
+      badly formed value;
+    * errors="none" returns a list with None in place of badly formed values;
+    * errors="mask" returns a tuple of the UUIDs packed into `16 * n` big-endian
+      bytes and a validity mask of `n` bytes, 1 for valid and 0 for invalid values.
+      Invalid values are packed as the nil UUID.
+    """
+    ...
+
+class _Readable(Protocol):
+    def read(self, size: int, /) -> bytes | str: ...
+
+@overload
+def scan(
+    source: Buffer | _Readable,
+    *,
+    chunk_size: int = 1048576,
+    packed: Literal[False] = False,
+) -> Iterator[tuple[int, UUID]]: ...
+@overload
+def scan(
+    source: Buffer | _Readable, *, chunk_size: int = 1048576, packed: Literal[True]
+) -> Iterator[bytes]: ...
+def scan(
+    source: Buffer | _Readable, *, chunk_size: int = 1048576, packed: bool = False
+) -> Iterator[tuple[int, UUID]] | Iterator[bytes]:
+    """Find every hyphenated UUID in a buffer or stream.
+
+    'source' is either a bytes-like object such as `bytes` or `mmap`, which is
+    scanned in place without copying, or a file-like object that is read
+    'chunk_size' bytes at a time. UUIDs split across chunks are found, and
+    UUIDs that are part of a longer run of hex digits are not.
+
+    Yields `(offset, UUID)` tuples, where 'offset' is the byte position of the
+    UUID in the input (in UTF-8 bytes for text streams). With packed=True,
+    yields instead one `bytes` object per chunk with the UUIDs found in it
+    packed in big-endian byte order.
+    """
+    ...
+
+def uuid3_many(
+    namespace: _Namespace, names: Iterable[str | Buffer], *, threads: int | None = None
+) -> list[UUID]:
+    """Generate the version 3 UUIDs of many names in one namespace.
+
+    The names are hashed in parallel on up to 'threads' native threads
+    (by default, one per CPU) with the GIL released. The result is in
+    the same order as 'names'.
+    """
+    ...
+
+def uuid5_many(
+    namespace: _Namespace, names: Iterable[str | Buffer], *, threads: int | None = None
+) -> list[UUID]:
+    """Generate the version 5 UUIDs of many names in one namespace.
+
+    The names are hashed in parallel on up to 'threads' native threads
+    (by default, one per CPU) with the GIL released. The result is in
+    the same order as 'names'.
+    """
+    ...
+
+def uuid1_many(
+    n: int,
+    node: int | None = None,
+    clock_seq: int | None = None,
+    *,
+    timestamp: int | None = None,
+) -> list[UUID]:
+    """Generate a list of `n` version 1 UUIDs in a single call.
+    The clock is read once and the timestamp is advanced by one tick
+    per UUID so the batch stays unique. If 'clock_seq' is not given,
+    a random one is chosen for the batch."""
+    ...
+
+def uuid4_many(n: int) -> list[UUID]:
+    """Generate a list of `n` random UUIDs in a single call."""
+    ...
+
+def uuid6_many(
+    n: int,
+    node: int | None = None,
+    clock_seq: int | None = None,
+    *,
+    timestamp: int | None = None,
+) -> list[UUID]:
+    """Generate a list of `n` version 6 UUIDs in a single call.
+    The clock is read once and the timestamp is advanced by one tick
+    per UUID so the batch stays unique. If 'clock_seq' is not given,
+    a random one is chosen for the batch."""
+    ...
+
+def uuid7_many(n: int, *, timestamp: int | None = None) -> list[UUID]:
+    """Generate a list of `n` version 7 UUIDs in a single call,
+    reading the clock once for the whole batch.
+
+    The UUIDs are strictly increasing across the whole batch.
+    If 'timestamp' is given in milliseconds since epoch,
+    it is used instead of the current time.
+    """
+    ...
+
+def uuid8_many(n: int) -> list[UUID]:
+    """Generate a list of `n` version 8 UUIDs with pseudo-random blocks."""
+    ...
+
+def uuid3_bytes(
+    namespace: _Namespace, names: Iterable[str | Buffer], *, threads: int | None = None
+) -> bytes:
+    """Like `uuid3_many`, but packed into `16 * n` big-endian bytes."""
+    ...
+
+def uuid5_bytes(
+    namespace: _Namespace, names: Iterable[str | Buffer], *, threads: int | None = None
+) -> bytes:
+    """Like `uuid5_many`, but packed into `16 * n` big-endian bytes."""
+    ...
+
+def uuid1_bytes(
+    n: int,
+    node: int | None = None,
+    clock_seq: int | None = None,
+    *,
+    timestamp: int | None = None,
+) -> bytes:
+    """Generate `n` version 1 UUIDs packed into `16 * n` big-endian bytes."""
+    ...
+
+def uuid4_bytes(n: int) -> bytes:
+    """Generate `n` random UUIDs packed into `16 * n` big-endian bytes."""
+    ...
+
+def uuid6_bytes(
+    n: int,
+    node: int | None = None,
+    clock_seq: int | None = None,
+    *,
+    timestamp: int | None = None,
+) -> bytes:
+    """Generate `n` version 6 UUIDs packed into `16 * n` big-endian bytes."""
+    ...
+
+def uuid7_bytes(n: int, *, timestamp: int | None = None) -> bytes:
+    """Generate `n` strictly increasing version 7 UUIDs
+    packed into `16 * n` big-endian bytes."""
+    ...
+
+def uuid8_bytes(n: int) -> bytes:
+    """Generate `n` pseudo-random version 8 UUIDs
+    packed into `16 * n` big-endian bytes."""
+    ...
+
+def uuid1_into(
+    buffer: Buffer,
+    node: int | None = None,
+    clock_seq: int | None = None,
+    *,
+    timestamp: int | None = None,
+) -> int:
+    """Fill a writable buffer with version 1 UUIDs in big-endian byte order.
+    The buffer size must be a multiple of 16. Returns the number of UUIDs written."""
+    ...
+
+def uuid4_into(buffer: Buffer) -> int:
+    """Fill a writable buffer with random UUIDs in big-endian byte order.
+    The buffer size must be a multiple of 16. Returns the number of UUIDs written."""
+    ...
+
+def uuid6_into(
+    buffer: Buffer,
+    node: int | None = None,
+    clock_seq: int | None = None,
+    *,
+    timestamp: int | None = None,
+) -> int:
+    """Fill a writable buffer with version 6 UUIDs in big-endian byte order.
+    The buffer size must be a multiple of 16. Returns the number of UUIDs written."""
+    ...
+
+def uuid7_into(buffer: Buffer, *, timestamp: int | None = None) -> int:
+    """Fill a writable buffer with strictly increasing version 7 UUIDs
+    in big-endian byte order.
+    The buffer size must be a multiple of 16. Returns the number of UUIDs written."""
+    ...
+
+def uuid8_into(buffer: Buffer) -> int:
+    """Fill a writable buffer with pseudo-random version 8 UUIDs
+    in big-endian byte order.
+    The buffer size must be a multiple of 16. Returns the number of UUIDs written."""
+    ...
+
 NAMESPACE_DNS: Final[UUID]
 NAMESPACE_URL: Final[UUID]
 NAMESPACE_OID: Final[UUID]
@@ -205,26 +713,58 @@ NIL: Final[UUID]
 MAX: Final[UUID]
 
 __all__ = [
+    "CachedUUID",
+    "Generator",
     "MAX",
     "NAMESPACE_DNS",
     "NAMESPACE_OID",
     "NAMESPACE_URL",
     "NAMESPACE_X500",
     "NIL",
+    "NameHasher",
     "RESERVED_FUTURE",
     "RESERVED_MICROSOFT",
     "RESERVED_NCS",
     "RFC_4122",
-    "UUID",
     "SafeUUID",
+    "SortedUUIDIndex",
+    "UUID",
+    "UUIDSet",
     "__version__",
+    "format_many",
     "getnode",
+    "parse_many",
     "reseed_rng",
+    "scan",
+    "set_entropy_pool_size",
+    "set_node",
     "uuid1",
+    "uuid1_bytes",
+    "uuid1_into",
+    "uuid1_many",
     "uuid3",
+    "uuid3_bytes",
+    "uuid3_many",
     "uuid4",
+    "uuid4_bytes",
+    "uuid4_into",
+    "uuid4_many",
     "uuid5",
+    "uuid5_bytes",
+    "uuid5_many",
     "uuid6",
+    "uuid6_bounds",
+    "uuid6_bytes",
+    "uuid6_into",
+    "uuid6_many",
     "uuid7",
+    "uuid7_bounds",
+    "uuid7_bytes",
+    "uuid7_into",
+    "uuid7_many",
     "uuid8",
+    "uuid8_bytes",
+    "uuid8_into",
+    "uuid8_many",
+    "warm_node",
 ]
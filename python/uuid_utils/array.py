@@ -0,0 +1,172 @@
+"""UUID arrays for NumPy and Arrow.
+
+UUIDs are held as `(N, 16)` `uint8` arrays in big-endian byte order, which is
+the same layout as the packed buffers accepted and returned by `uuid_utils`.
+Arrays are generated and read in place, without creating `UUID` objects.
+
+This module requires `numpy`. The Arrow helpers also require `pyarrow`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+
+import uuid_utils
+from uuid_utils import _uuid_utils
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+UUIDArray = npt.NDArray[np.uint8]
+
+
+def _empty(n: int) -> UUIDArray:
+    return np.empty((n, 16), dtype=np.uint8)
+
+
+def _packed(array: Any) -> UUIDArray:
+    array = np.ascontiguousarray(array)
+    if array.dtype == np.dtype("V16"):
+        array = array.view(np.uint8)
+    if array.dtype != np.uint8 or array.size % 16 != 0:
+        raise ValueError("expected an (N, 16) uint8 or (N,) V16 array of UUIDs")
+    return array.reshape(-1, 16)
+
+
+def uuid1(
+    n: int,
+    node: int | None = None,
+    clock_seq: int | None = None,
+    *,
+    timestamp: int | None = None,
+) -> UUIDArray:
+    """Generate an `(n, 16)` array of version 1 UUIDs."""
+    array = _empty(n)
+    uuid_utils.uuid1_into(array, node, clock_seq, timestamp=timestamp)
+    return array
+
+
+def uuid4(n: int) -> UUIDArray:
+    """Generate an `(n, 16)` array of random UUIDs."""
+    array = _empty(n)
+    uuid_utils.uuid4_into(array)
+    return array
+
+
+def uuid6(
+    n: int,
+    node: int | None = None,
+    clock_seq: int | None = None,
+    *,
+    timestamp: int | None = None,
+) -> UUIDArray:
+    """Generate an `(n, 16)` array of version 6 UUIDs."""
+    array = _empty(n)
+    uuid_utils.uuid6_into(array, node, clock_seq, timestamp=timestamp)
+    return array
+
+
+def uuid7(n: int, *, timestamp: int | None = None) -> UUIDArray:
+    """Generate an `(n, 16)` array of strictly increasing version 7 UUIDs."""
+    array = _empty(n)
+    uuid_utils.uuid7_into(array, timestamp=timestamp)
+    return array
+
+
+def uuid8(n: int) -> UUIDArray:
+    """Generate an `(n, 16)` array of pseudo-random version 8 UUIDs."""
+    array = _empty(n)
+    uuid_utils.uuid8_into(array)
+    return array
+
+
+def as_void(array: Any) -> npt.NDArray[np.void]:
+    """View an array of UUIDs as a one-dimensional `V16` array."""
+    return _packed(array).view("V16").reshape(-1)
+
+
+def version(array: Any) -> npt.NDArray[np.uint8]:
+    """The version number of every UUID, or 0 if the variant is not RFC 4122."""
+    return np.frombuffer(_uuid_utils._versions(_packed(array)), dtype=np.uint8)
+
+
+def time(array: Any) -> npt.NDArray[np.uint64]:
+    """The `time` field of every UUID, as decoded by `UUID.time`."""
+    return np.frombuffer(_uuid_utils._times(_packed(array)), dtype=np.uint64)
+
+
+def timestamp(array: Any) -> npt.NDArray[np.uint64]:
+    """The timestamp of every UUID in milliseconds since epoch.
+    Only works for UUID versions 1, 6 and 7, otherwise raises ValueError."""
+    return np.frombuffer(_uuid_utils._timestamps(_packed(array)), dtype=np.uint64)
+
+
+def to_strings(
+    array: Any, style: Literal["hyphenated", "simple", "urn", "braced"] = "hyphenated"
+) -> npt.NDArray[np.bytes_]:
+    """Format every UUID as a fixed-width ASCII byte string.
+    'style' is one of "hyphenated", "simple", "urn" or "braced"."""
+    packed = _packed(array)
+    data = uuid_utils.format_many(packed, style, as_bytes=True)
+    width = len(data) // len(packed) if len(packed) else 1
+    return np.frombuffer(data, dtype=f"S{width}")
+
+
+def to_hex(array: Any) -> npt.NDArray[np.bytes_]:
+    """Format every UUID as a 32-character hexadecimal byte string."""
+    return to_strings(array, "simple")
+
+
+def to_uuids(array: Any) -> list[uuid_utils.UUID]:
+    """Convert an array of UUIDs to a list of `UUID` objects."""
+    return [uuid_utils.UUID(bytes=row.tobytes()) for row in _packed(array)]
+
+
+def to_arrow(array: Any) -> pa.FixedSizeBinaryArray:
+    """Wrap an array of UUIDs as an Arrow `FixedSizeBinary(16)` array
+    without copying."""
+    import pyarrow as pa
+
+    packed = _packed(array)
+    return pa.FixedSizeBinaryArray.from_buffers(
+        pa.binary(16), len(packed), [None, pa.py_buffer(packed)]
+    )
+
+
+def from_arrow(column: pa.Array | pa.ChunkedArray) -> UUIDArray:
+    """View an Arrow `FixedSizeBinary(16)` array as an `(N, 16)` array.
+    Chunked arrays are combined first, which copies the data."""
+    import pyarrow as pa
+
+    if isinstance(column, pa.ChunkedArray):
+        column = column.combine_chunks()
+    if column.type != pa.binary(16):
+        raise TypeError("expected a FixedSizeBinary(16) array")
+    if column.null_count:
+        raise ValueError("array of UUIDs must not contain nulls")
+    data = column.buffers()[1]
+    return np.frombuffer(
+        data, dtype=np.uint8, count=len(column) * 16, offset=column.offset * 16
+    ).reshape(-1, 16)
+
+
+__all__ = [
+    "UUIDArray",
+    "as_void",
+    "from_arrow",
+    "time",
+    "timestamp",
+    "to_arrow",
+    "to_hex",
+    "to_strings",
+    "to_uuids",
+    "uuid1",
+    "uuid4",
+    "uuid6",
+    "uuid7",
+    "uuid8",
+    "version",
+]
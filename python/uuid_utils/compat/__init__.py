@@ -1,3 +1,4 @@
+from collections import namedtuple
 from uuid import (
     NAMESPACE_DNS,
     NAMESPACE_OID,
@@ -14,6 +15,9 @@ from uuid import (
 
 import uuid_utils
 from uuid_utils import _uuid4_int, _uuid7_int
+from uuid_utils._uuid_utils import _namespace_cache_info
+from uuid_utils._uuid_utils import _stdlib_uuid as _from_int
+from uuid_utils._uuid_utils import _stdlib_uuids as _from_bytes
 
 NIL = UUID("00000000-0000-0000-0000-000000000000")
 MAX = UUID("ffffffff-ffff-ffff-ffff-ffffffffffff")
@@ -21,11 +25,14 @@ MAX = UUID("ffffffff-ffff-ffff-ffff-ffffffffffff")
 __version__ = uuid_utils.__version__
 
 
-def _from_int(n: int) -> UUID:
-    u = object.__new__(UUID)
-    object.__setattr__(u, "int", n)
-    object.__setattr__(u, "is_safe", SafeUUID.unknown)
-    return u
+NamespaceCacheInfo = namedtuple("NamespaceCacheInfo", ["hits", "misses", "maxsize"])
+
+
+def namespace_cache_info():
+    """Report how often standard library namespaces passed to `uuid3` and
+    `uuid5` were found already converted. Each thread keeps up to `maxsize`
+    of them."""
+    return NamespaceCacheInfo(*_namespace_cache_info())
 
 
 def uuid1(node=None, clock_seq=None):
@@ -38,7 +45,6 @@ def uuid1(node=None, clock_seq=None):
 
 def uuid3(namespace, name):
     """Generate a UUID from the MD5 hash of a namespace UUID and a name."""
-    namespace = uuid_utils.UUID(namespace.hex) if namespace else namespace
     return _from_int(uuid_utils.uuid3(namespace, name).int)
 
 
@@ -49,7 +55,6 @@ def uuid4():
 
 def uuid5(namespace, name):
     """Generate a UUID from the SHA-1 hash of a namespace UUID and a name."""
-    namespace = uuid_utils.UUID(namespace.hex) if namespace else namespace
     return _from_int(uuid_utils.uuid5(namespace, name).int)
 
 
@@ -85,6 +90,44 @@ def uuid8(a=None, b=None, c=None):
     return _from_int(uuid_utils.uuid8(a, b, c).int)
 
 
+def uuid1_many(n, node=None, clock_seq=None):
+    """Generate a list of `n` version 1 UUIDs in a single call."""
+    return _from_bytes(uuid_utils.uuid1_bytes(n, node, clock_seq))
+
+
+def uuid3_many(namespace, names, *, threads=None):
+    """Generate the version 3 UUIDs of many names in one namespace."""
+    return _from_bytes(uuid_utils.uuid3_bytes(namespace, names, threads=threads))
+
+
+def uuid4_many(n):
+    """Generate a list of `n` random UUIDs in a single call."""
+    return _from_bytes(uuid_utils.uuid4_bytes(n))
+
+
+def uuid5_many(namespace, names, *, threads=None):
+    """Generate the version 5 UUIDs of many names in one namespace."""
+    return _from_bytes(uuid_utils.uuid5_bytes(namespace, names, threads=threads))
+
+
+def uuid6_many(n, node=None, clock_seq=None):
+    """Generate a list of `n` version 6 UUIDs in a single call."""
+    return _from_bytes(uuid_utils.uuid6_bytes(n, node, clock_seq))
+
+
+def uuid7_many(n):
+    """Generate a list of `n` version 7 UUIDs in a single call.
+
+    The UUIDs are strictly increasing across the whole batch.
+    """
+    return _from_bytes(uuid_utils.uuid7_bytes(n))
+
+
+def uuid8_many(n):
+    """Generate a list of `n` version 8 UUIDs with pseudo-random blocks."""
+    return _from_bytes(uuid_utils.uuid8_bytes(n))
+
+
 __all__ = [
     "MAX",
     "NAMESPACE_DNS",
@@ -92,18 +135,28 @@ __all__ = [
     "NAMESPACE_URL",
     "NAMESPACE_X500",
     "NIL",
+    "NamespaceCacheInfo",
     "RESERVED_FUTURE",
     "RESERVED_MICROSOFT",
     "RESERVED_NCS",
     "RFC_4122",
+    "SafeUUID",
     "UUID",
     "__version__",
     "getnode",
+    "namespace_cache_info",
     "uuid1",
+    "uuid1_many",
     "uuid3",
+    "uuid3_many",
     "uuid4",
+    "uuid4_many",
     "uuid5",
+    "uuid5_many",
     "uuid6",
+    "uuid6_many",
     "uuid7",
+    "uuid7_many",
     "uuid8",
+    "uuid8_many",
 ]
@@ -1,5 +1,6 @@
 import sys
-from typing import Final
+from collections.abc import Iterable
+from typing import Final, NamedTuple
 from uuid import (
     NAMESPACE_DNS,
     NAMESPACE_OID,
@@ -14,6 +15,17 @@ from uuid import (
     getnode,
 )
 
+class NamespaceCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+
+def namespace_cache_info() -> NamespaceCacheInfo:
+    """Report how often standard library namespaces passed to `uuid3` and
+    `uuid5` were found already converted. Each thread keeps up to `maxsize`
+    of them."""
+    ...
+
 def uuid1(node: int | None = None, clock_seq: int | None = None) -> UUID:
     """Generate a UUID from a host ID, sequence number, and the current time.
     If 'node' is not given, getnode() is used to obtain the hardware
@@ -73,6 +85,45 @@ def uuid8(a: int | None = None, b: int | None = None, c: int | None = None) -> U
     """
     ...
 
+def uuid1_many(
+    n: int, node: int | None = None, clock_seq: int | None = None
+) -> list[UUID]:
+    """Generate a list of `n` version 1 UUIDs in a single call."""
+    ...
+
+def uuid3_many(
+    namespace: UUID, names: Iterable[str | bytes], *, threads: int | None = None
+) -> list[UUID]:
+    """Generate the version 3 UUIDs of many names in one namespace."""
+    ...
+
+def uuid4_many(n: int) -> list[UUID]:
+    """Generate a list of `n` random UUIDs in a single call."""
+    ...
+
+def uuid5_many(
+    namespace: UUID, names: Iterable[str | bytes], *, threads: int | None = None
+) -> list[UUID]:
+    """Generate the version 5 UUIDs of many names in one namespace."""
+    ...
+
+def uuid6_many(
+    n: int, node: int | None = None, clock_seq: int | None = None
+) -> list[UUID]:
+    """Generate a list of `n` version 6 UUIDs in a single call."""
+    ...
+
+def uuid7_many(n: int) -> list[UUID]:
+    """Generate a list of `n` version 7 UUIDs in a single call.
+
+    The UUIDs are strictly increasing across the whole batch.
+    """
+    ...
+
+def uuid8_many(n: int) -> list[UUID]:
+    """Generate a list of `n` version 8 UUIDs with pseudo-random blocks."""
+    ...
+
 NIL: Final[UUID]
 MAX: Final[UUID]
 __version__: str
@@ -84,19 +135,28 @@ __all__ = [
     "NAMESPACE_URL",
     "NAMESPACE_X500",
     "NIL",
+    "NamespaceCacheInfo",
     "RESERVED_FUTURE",
     "RESERVED_MICROSOFT",
     "RESERVED_NCS",
     "RFC_4122",
-    "UUID",
     "SafeUUID",
+    "UUID",
     "__version__",
     "getnode",
+    "namespace_cache_info",
     "uuid1",
+    "uuid1_many",
     "uuid3",
+    "uuid3_many",
     "uuid4",
+    "uuid4_many",
     "uuid5",
+    "uuid5_many",
     "uuid6",
+    "uuid6_many",
     "uuid7",
+    "uuid7_many",
     "uuid8",
+    "uuid8_many",
 ]
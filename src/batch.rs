@@ -0,0 +1,297 @@
+use crate::{
+    UUID,
+    buffer::write_packed,
+    generator::{V7Method, V7State, shared_v7},
+    gregorian_start, node_bytes, unix_nanos,
+};
+use pyo3::{
+    exceptions::PyOverflowError,
+    prelude::*,
+    types::{PyBytes, PyList},
+};
+use uuid::{Builder, Uuid};
+
+pub(crate) fn batch_len(n: usize) -> PyResult<usize> {
+    n.checked_mul(16)
+        .ok_or_else(|| PyOverflowError::new_err("too many UUIDs requested"))
+}
+
+/// Fill `out` with random bytes in one go and stamp the version and
+/// variant bits onto every 16-byte chunk.
+fn fill_random(out: &mut [u8], version: u8) {
+    rand::fill(out);
+    stamp_version(out, version);
+}
+
+/// Set the version and variant bits of every 16-byte chunk of `out`.
+pub(crate) fn stamp_version(out: &mut [u8], version: u8) {
+    for chunk in out.chunks_exact_mut(16) {
+        chunk[6] = (chunk[6] & 0x0f) | (version << 4);
+        chunk[8] = (chunk[8] & 0x3f) | 0x80;
+    }
+}
+
+fn fill_from(out: &mut [u8], uuids: impl Iterator<Item = Uuid>) -> PyResult<()> {
+    for (chunk, uuid) in out.chunks_exact_mut(16).zip(uuids) {
+        chunk.copy_from_slice(uuid.as_bytes());
+    }
+    Ok(())
+}
+
+fn uuid1_iter(
+    n: usize,
+    node: Option<u64>,
+    clock_seq: Option<u64>,
+    timestamp: Option<u64>,
+) -> PyResult<impl Iterator<Item = Uuid>> {
+    let node = node_bytes(node);
+    // The clock is read once per batch, so advance the timestamp by one
+    // tick per UUID to keep the batch unique.
+    let (ticks, clock_seq) = gregorian_start(n, clock_seq, timestamp)?;
+    Ok((0..)
+        .map(move |i| Builder::from_gregorian_timestamp(ticks + i, clock_seq, &node).into_uuid()))
+}
+
+fn uuid6_iter(
+    n: usize,
+    node: Option<u64>,
+    clock_seq: Option<u64>,
+    timestamp: Option<u64>,
+) -> PyResult<impl Iterator<Item = Uuid>> {
+    let node = node_bytes(node);
+    let (ticks, clock_seq) = gregorian_start(n, clock_seq, timestamp)?;
+    Ok((0..).map(move |i| {
+        Builder::from_sorted_gregorian_timestamp(ticks + i, clock_seq, &node).into_uuid()
+    }))
+}
+
+/// Generate `n` strictly increasing v7 UUIDs from a single clock reading,
+/// or at `timestamp` in milliseconds, passing each one to `f`.
+fn uuid7_each(n: usize, timestamp: Option<u64>, mut f: impl FnMut(Uuid)) -> PyResult<()> {
+    let nanos = unix_nanos(timestamp)?;
+    let mut local;
+    let mut shared;
+    let state: &mut V7State = match timestamp {
+        // Backfilled UUIDs stay out of the shared state, which would
+        // otherwise hold them at the latest timestamp generated so far.
+        Some(_) => {
+            local = V7State::new(V7Method::Counter);
+            &mut local
+        }
+        None => {
+            shared = shared_v7();
+            &mut shared
+        }
+    };
+    for _ in 0..n {
+        f(state.next_or_raise(nanos, rand::random())?);
+    }
+    Ok(())
+}
+
+fn uuid7_fill(out: &mut [u8], timestamp: Option<u64>) -> PyResult<()> {
+    let mut chunks = out.chunks_exact_mut(16);
+    uuid7_each(chunks.len(), timestamp, |uuid| {
+        chunks.next().unwrap().copy_from_slice(uuid.as_bytes())
+    })
+}
+
+pub(crate) fn uuid_list(py: Python<'_>, bytes: &[u8]) -> PyResult<Bound<'_, PyList>> {
+    PyList::new(
+        py,
+        bytes.chunks_exact(16).map(|chunk| UUID {
+            uuid: Uuid::from_bytes(chunk.try_into().unwrap()),
+        }),
+    )
+}
+
+fn new_bytes(
+    py: Python<'_>,
+    n: usize,
+    fill: impl FnOnce(&mut [u8]) -> PyResult<()>,
+) -> PyResult<Bound<'_, PyBytes>> {
+    PyBytes::new_with(py, batch_len(n)?, fill)
+}
+
+fn fill_buffer(
+    buffer: &Bound<'_, PyAny>,
+    fill: impl FnOnce(&mut [u8]) -> PyResult<()>,
+) -> PyResult<usize> {
+    write_packed(buffer, |out| {
+        fill(out)?;
+        Ok(out.len() / 16)
+    })?
+}
+
+#[pyfunction]
+#[pyo3(signature = (n, node=None, clock_seq=None, *, timestamp=None))]
+fn uuid1_many(
+    py: Python<'_>,
+    n: usize,
+    node: Option<u64>,
+    clock_seq: Option<u64>,
+    timestamp: Option<u64>,
+) -> PyResult<Bound<'_, PyList>> {
+    PyList::new(
+        py,
+        uuid1_iter(n, node, clock_seq, timestamp)?
+            .take(n)
+            .map(|uuid| UUID { uuid }),
+    )
+}
+
+#[pyfunction]
+fn uuid4_many(py: Python<'_>, n: usize) -> PyResult<Bound<'_, PyList>> {
+    let mut bytes = vec![0u8; batch_len(n)?];
+    fill_random(&mut bytes, 4);
+    uuid_list(py, &bytes)
+}
+
+#[pyfunction]
+#[pyo3(signature = (n, node=None, clock_seq=None, *, timestamp=None))]
+fn uuid6_many(
+    py: Python<'_>,
+    n: usize,
+    node: Option<u64>,
+    clock_seq: Option<u64>,
+    timestamp: Option<u64>,
+) -> PyResult<Bound<'_, PyList>> {
+    PyList::new(
+        py,
+        uuid6_iter(n, node, clock_seq, timestamp)?
+            .take(n)
+            .map(|uuid| UUID { uuid }),
+    )
+}
+
+#[pyfunction]
+#[pyo3(signature = (n, *, timestamp=None))]
+fn uuid7_many(py: Python<'_>, n: usize, timestamp: Option<u64>) -> PyResult<Bound<'_, PyList>> {
+    let mut uuids = Vec::with_capacity(n);
+    uuid7_each(n, timestamp, |uuid| uuids.push(UUID { uuid }))?;
+    PyList::new(py, uuids)
+}
+
+#[pyfunction]
+fn uuid8_many(py: Python<'_>, n: usize) -> PyResult<Bound<'_, PyList>> {
+    let mut bytes = vec![0u8; batch_len(n)?];
+    fill_random(&mut bytes, 8);
+    uuid_list(py, &bytes)
+}
+
+#[pyfunction]
+#[pyo3(signature = (n, node=None, clock_seq=None, *, timestamp=None))]
+fn uuid1_bytes(
+    py: Python<'_>,
+    n: usize,
+    node: Option<u64>,
+    clock_seq: Option<u64>,
+    timestamp: Option<u64>,
+) -> PyResult<Bound<'_, PyBytes>> {
+    let uuids = uuid1_iter(n, node, clock_seq, timestamp)?;
+    new_bytes(py, n, |out| fill_from(out, uuids))
+}
+
+#[pyfunction]
+fn uuid4_bytes(py: Python<'_>, n: usize) -> PyResult<Bound<'_, PyBytes>> {
+    new_bytes(py, n, |out| {
+        fill_random(out, 4);
+        Ok(())
+    })
+}
+
+#[pyfunction]
+#[pyo3(signature = (n, node=None, clock_seq=None, *, timestamp=None))]
+fn uuid6_bytes(
+    py: Python<'_>,
+    n: usize,
+    node: Option<u64>,
+    clock_seq: Option<u64>,
+    timestamp: Option<u64>,
+) -> PyResult<Bound<'_, PyBytes>> {
+    let uuids = uuid6_iter(n, node, clock_seq, timestamp)?;
+    new_bytes(py, n, |out| fill_from(out, uuids))
+}
+
+#[pyfunction]
+#[pyo3(signature = (n, *, timestamp=None))]
+fn uuid7_bytes(py: Python<'_>, n: usize, timestamp: Option<u64>) -> PyResult<Bound<'_, PyBytes>> {
+    new_bytes(py, n, |out| uuid7_fill(out, timestamp))
+}
+
+#[pyfunction]
+fn uuid8_bytes(py: Python<'_>, n: usize) -> PyResult<Bound<'_, PyBytes>> {
+    new_bytes(py, n, |out| {
+        fill_random(out, 8);
+        Ok(())
+    })
+}
+
+#[pyfunction]
+#[pyo3(signature = (buffer, node=None, clock_seq=None, *, timestamp=None))]
+fn uuid1_into(
+    buffer: &Bound<'_, PyAny>,
+    node: Option<u64>,
+    clock_seq: Option<u64>,
+    timestamp: Option<u64>,
+) -> PyResult<usize> {
+    fill_buffer(buffer, |out| {
+        let uuids = uuid1_iter(out.len() / 16, node, clock_seq, timestamp)?;
+        fill_from(out, uuids)
+    })
+}
+
+#[pyfunction]
+fn uuid4_into(buffer: &Bound<'_, PyAny>) -> PyResult<usize> {
+    fill_buffer(buffer, |out| {
+        fill_random(out, 4);
+        Ok(())
+    })
+}
+
+#[pyfunction]
+#[pyo3(signature = (buffer, node=None, clock_seq=None, *, timestamp=None))]
+fn uuid6_into(
+    buffer: &Bound<'_, PyAny>,
+    node: Option<u64>,
+    clock_seq: Option<u64>,
+    timestamp: Option<u64>,
+) -> PyResult<usize> {
+    fill_buffer(buffer, |out| {
+        let uuids = uuid6_iter(out.len() / 16, node, clock_seq, timestamp)?;
+        fill_from(out, uuids)
+    })
+}
+
+#[pyfunction]
+#[pyo3(signature = (buffer, *, timestamp=None))]
+fn uuid7_into(buffer: &Bound<'_, PyAny>, timestamp: Option<u64>) -> PyResult<usize> {
+    fill_buffer(buffer, |out| uuid7_fill(out, timestamp))
+}
+
+#[pyfunction]
+fn uuid8_into(buffer: &Bound<'_, PyAny>) -> PyResult<usize> {
+    fill_buffer(buffer, |out| {
+        fill_random(out, 8);
+        Ok(())
+    })
+}
+
+pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(uuid1_many, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid4_many, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid6_many, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid7_many, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid8_many, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid1_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid4_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid6_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid7_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid8_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid1_into, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid4_into, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid6_into, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid7_into, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid8_into, m)?)?;
+    Ok(())
+}
@@ -0,0 +1,82 @@
+use pyo3::{
+    buffer::PyBuffer,
+    exceptions::{PyTypeError, PyValueError},
+    prelude::*,
+};
+use uuid::Uuid;
+
+/// Iterate over the UUIDs packed in big-endian byte order in `data`.
+pub(crate) fn packed_uuids(data: &[u8]) -> impl ExactSizeIterator<Item = Uuid> + '_ {
+    data.chunks_exact(16)
+        .map(|chunk| Uuid::from_bytes(chunk.try_into().unwrap()))
+}
+
+/// Get a C-contiguous byte buffer whose size is a multiple of 16,
+/// holding packed big-endian UUIDs.
+fn packed_buffer(obj: &Bound<'_, PyAny>) -> PyResult<PyBuffer<u8>> {
+    let buffer = PyBuffer::<u8>::get(obj)?;
+    if !buffer.is_c_contiguous() {
+        return Err(PyValueError::new_err("buffer must be C-contiguous"));
+    }
+    if buffer.len_bytes() % 16 != 0 {
+        return Err(PyValueError::new_err(
+            "buffer size must be a multiple of 16 bytes",
+        ));
+    }
+    Ok(buffer)
+}
+
+/// Run `f` over the contents of a packed UUID buffer without copying it.
+pub(crate) fn read_packed<R>(obj: &Bound<'_, PyAny>, f: impl FnOnce(&[u8]) -> R) -> PyResult<R> {
+    let buffer = packed_buffer(obj)?;
+    // SAFETY: the buffer is contiguous and `len_bytes` long,
+    // and `buffer` keeps the exporter alive until we return.
+    let data =
+        unsafe { std::slice::from_raw_parts(buffer.buf_ptr() as *const u8, buffer.len_bytes()) };
+    Ok(f(data))
+}
+
+/// Run `f` directly over the memory of a writable packed UUID buffer.
+pub(crate) fn write_packed<R>(
+    obj: &Bound<'_, PyAny>,
+    f: impl FnOnce(&mut [u8]) -> R,
+) -> PyResult<R> {
+    let buffer = packed_buffer(obj)?;
+    if buffer.readonly() {
+        return Err(PyTypeError::new_err("buffer must be writable"));
+    }
+    // SAFETY: as above, and the exporter reported the buffer as writable.
+    let data =
+        unsafe { std::slice::from_raw_parts_mut(buffer.buf_ptr() as *mut u8, buffer.len_bytes()) };
+    Ok(f(data))
+}
+
+/// Copy `data` into a writable C-contiguous buffer of any size at `offset`.
+pub(crate) fn write_at(obj: &Bound<'_, PyAny>, offset: usize, data: &[u8]) -> PyResult<()> {
+    let buffer = PyBuffer::<u8>::get(obj)?;
+    if !buffer.is_c_contiguous() {
+        return Err(PyValueError::new_err("buffer must be C-contiguous"));
+    }
+    if buffer.readonly() {
+        return Err(PyTypeError::new_err("buffer must be writable"));
+    }
+    if offset
+        .checked_add(data.len())
+        .is_none_or(|end| end > buffer.len_bytes())
+    {
+        return Err(PyValueError::new_err(format!(
+            "buffer is too small to write {} bytes at offset {offset}",
+            data.len()
+        )));
+    }
+    // SAFETY: the buffer is writable and holds at least `offset + data.len()`
+    // bytes, and `buffer` keeps the exporter alive until we return.
+    unsafe {
+        std::ptr::copy_nonoverlapping(
+            data.as_ptr(),
+            (buffer.buf_ptr() as *mut u8).add(offset),
+            data.len(),
+        )
+    };
+    Ok(())
+}
@@ -0,0 +1,104 @@
+use crate::UUID;
+use pyo3::{
+    prelude::*,
+    sync::PyOnceLock,
+    types::{PyBytes, PyDict, PyString},
+};
+use uuid::Uuid;
+
+/// A `UUID` that keeps the objects returned by `str()`, `hex`, `urn`, `bytes`
+/// and `bytes_le` after they are first created, and returns the same objects
+/// afterwards.
+#[pyclass(extends = UUID, module = "uuid_utils")]
+pub(crate) struct CachedUUID {
+    str: PyOnceLock<Py<PyString>>,
+    hex: PyOnceLock<Py<PyString>>,
+    urn: PyOnceLock<Py<PyString>>,
+    bytes: PyOnceLock<Py<PyBytes>>,
+    bytes_le: PyOnceLock<Py<PyBytes>>,
+}
+
+#[pymethods]
+impl CachedUUID {
+    #[new]
+    #[pyo3(signature = (hex=None, bytes=None, bytes_le=None, fields=None, int=None, version=None))]
+    fn new(
+        hex: Option<&str>,
+        bytes: Option<&Bound<'_, PyBytes>>,
+        bytes_le: Option<&Bound<'_, PyBytes>>,
+        fields: Option<(u32, u16, u16, u8, u8, u64)>,
+        int: Option<u128>,
+        version: Option<u8>,
+    ) -> PyResult<(Self, UUID)> {
+        let uuid = UUID::new(hex, bytes, bytes_le, fields, int, version)?;
+        let cached = Self {
+            str: PyOnceLock::new(),
+            hex: PyOnceLock::new(),
+            urn: PyOnceLock::new(),
+            bytes: PyOnceLock::new(),
+            bytes_le: PyOnceLock::new(),
+        };
+        Ok((cached, uuid))
+    }
+
+    fn __str__(slf: PyRef<'_, Self>, py: Python<'_>) -> Py<PyString> {
+        slf.str
+            .get_or_init(py, || {
+                let uuid = slf.as_super().uuid;
+                PyString::new(
+                    py,
+                    uuid.hyphenated().encode_lower(&mut Uuid::encode_buffer()),
+                )
+                .unbind()
+            })
+            .clone_ref(py)
+    }
+
+    #[getter]
+    fn hex(slf: PyRef<'_, Self>, py: Python<'_>) -> Py<PyString> {
+        slf.hex
+            .get_or_init(py, || {
+                let uuid = slf.as_super().uuid;
+                PyString::new(py, uuid.simple().encode_lower(&mut Uuid::encode_buffer())).unbind()
+            })
+            .clone_ref(py)
+    }
+
+    #[getter]
+    fn urn(slf: PyRef<'_, Self>, py: Python<'_>) -> Py<PyString> {
+        slf.urn
+            .get_or_init(py, || {
+                let uuid = slf.as_super().uuid;
+                PyString::new(py, uuid.urn().encode_lower(&mut Uuid::encode_buffer())).unbind()
+            })
+            .clone_ref(py)
+    }
+
+    #[getter]
+    fn bytes(slf: PyRef<'_, Self>, py: Python<'_>) -> Py<PyBytes> {
+        slf.bytes
+            .get_or_init(py, || {
+                PyBytes::new(py, slf.as_super().uuid.as_bytes()).unbind()
+            })
+            .clone_ref(py)
+    }
+
+    #[getter]
+    fn bytes_le(slf: PyRef<'_, Self>, py: Python<'_>) -> Py<PyBytes> {
+        slf.bytes_le
+            .get_or_init(py, || {
+                PyBytes::new(py, &slf.as_super().uuid.to_bytes_le()).unbind()
+            })
+            .clone_ref(py)
+    }
+
+    /// Instances are immutable, so a deep copy is the object itself.
+    fn __deepcopy__<'py>(slf: Bound<'py, Self>, _memo: &Bound<'py, PyDict>) -> Bound<'py, Self> {
+        slf
+    }
+}
+
+pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<CachedUUID>()?;
+    Ok(())
+}
@@ -0,0 +1,99 @@
+use crate::buffer::{packed_uuids, read_packed};
+use pyo3::{
+    ffi, intern,
+    prelude::*,
+    sync::PyOnceLock,
+    types::{PyDict, PyList, PyType},
+};
+
+/// The standard library `uuid.UUID` type and `SafeUUID.unknown`.
+static STDLIB: PyOnceLock<(Py<PyType>, Py<PyAny>)> = PyOnceLock::new();
+
+/// `sys.modules`, to tell whether `uuid` has been imported yet.
+static SYS_MODULES: PyOnceLock<Py<PyDict>> = PyOnceLock::new();
+
+fn stdlib(py: Python<'_>) -> PyResult<&(Py<PyType>, Py<PyAny>)> {
+    STDLIB.get_or_try_init(py, || {
+        let uuid = py.import("uuid")?;
+        let uuid_type = uuid.getattr("UUID")?.cast_into::<PyType>()?.unbind();
+        let safe_unknown = uuid.getattr("SafeUUID")?.getattr("unknown")?.unbind();
+        Ok((uuid_type, safe_unknown))
+    })
+}
+
+/// `SafeUUID.unknown`, the `is_safe` of every UUID created here. The `uuid`
+/// module is only imported when this is first needed.
+pub(crate) fn safe_uuid_unknown(py: Python<'_>) -> PyResult<Bound<'_, PyAny>> {
+    Ok(stdlib(py)?.1.bind(py).clone())
+}
+
+/// Whether `obj` is exactly a standard library `uuid.UUID`.
+pub(crate) fn is_stdlib_uuid(obj: &Bound<'_, PyAny>) -> PyResult<bool> {
+    let py = obj.py();
+    let uuid_type = match STDLIB.get(py) {
+        Some((uuid_type, _)) => uuid_type,
+        None => {
+            // Nothing is a `uuid.UUID` before the `uuid` module is imported,
+            // and this should not import it just to find that out.
+            let modules = SYS_MODULES.get_or_try_init(py, || {
+                let modules = py.import("sys")?.getattr("modules")?;
+                PyResult::Ok(modules.cast_into::<PyDict>()?.unbind())
+            })?;
+            if !modules.bind(py).contains(intern!(py, "uuid"))? {
+                return Ok(false);
+            }
+            &stdlib(py)?.0
+        }
+    };
+    Ok(obj.get_type().as_ptr() == uuid_type.as_ptr())
+}
+
+/// Create a standard library `uuid.UUID` for `value` without running its
+/// `__init__`, filling in the `int` and `is_safe` slots directly.
+fn stdlib_uuid(py: Python<'_>, value: u128) -> PyResult<Bound<'_, PyAny>> {
+    let (uuid_type, safe_unknown) = stdlib(py)?;
+    let int = value.into_pyobject(py)?;
+    // SAFETY: this is what `object.__new__(UUID)` followed by two calls to
+    // `object.__setattr__` does, which bypasses `UUID.__setattr__` raising.
+    unsafe {
+        let tp = uuid_type.as_ptr() as *mut ffi::PyTypeObject;
+        let alloc = (*tp).tp_alloc.unwrap_or(ffi::PyType_GenericAlloc);
+        let uuid = Bound::from_owned_ptr_or_err(py, alloc(tp, 0))?;
+        for (name, value) in [
+            (intern!(py, "int"), int.as_ptr()),
+            (intern!(py, "is_safe"), safe_unknown.as_ptr()),
+        ] {
+            if ffi::PyObject_GenericSetAttr(uuid.as_ptr(), name.as_ptr(), value) == -1 {
+                return Err(PyErr::fetch(py));
+            }
+        }
+        Ok(uuid)
+    }
+}
+
+#[pyfunction]
+#[pyo3(name = "_stdlib_uuid")]
+fn stdlib_uuid_from_int(py: Python<'_>, int: u128) -> PyResult<Bound<'_, PyAny>> {
+    stdlib_uuid(py, int)
+}
+
+/// Convert a packed buffer of big-endian UUIDs to standard library UUIDs.
+#[pyfunction]
+#[pyo3(name = "_stdlib_uuids")]
+fn stdlib_uuids_from_bytes<'py>(
+    py: Python<'py>,
+    values: &Bound<'py, PyAny>,
+) -> PyResult<Bound<'py, PyList>> {
+    let uuids = read_packed(values, |data| {
+        packed_uuids(data)
+            .map(|uuid| stdlib_uuid(py, uuid.as_u128()))
+            .collect::<PyResult<Vec<_>>>()
+    })??;
+    PyList::new(py, uuids)
+}
+
+pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(stdlib_uuid_from_int, m)?)?;
+    m.add_function(wrap_pyfunction!(stdlib_uuids_from_bytes, m)?)?;
+    Ok(())
+}
@@ -0,0 +1,55 @@
+use crate::{
+    buffer::{packed_uuids, read_packed},
+    uuid_time, uuid_timestamp, uuid_version,
+};
+use pyo3::{exceptions::PyValueError, prelude::*, types::PyBytes};
+use uuid::Uuid;
+
+/// Collect one native-endian `u64` per packed UUID into a bytes object.
+fn u64_bytes<'py>(
+    py: Python<'py>,
+    buffer: &Bound<'py, PyAny>,
+    field: impl Fn(&Uuid) -> PyResult<u64>,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let values = read_packed(buffer, |data| {
+        let mut values = Vec::with_capacity(data.len() / 2);
+        for uuid in packed_uuids(data) {
+            values.extend_from_slice(&field(&uuid)?.to_ne_bytes());
+        }
+        Ok::<_, PyErr>(values)
+    })??;
+    Ok(PyBytes::new(py, &values))
+}
+
+#[pyfunction]
+#[pyo3(name = "_versions")]
+fn versions<'py>(py: Python<'py>, buffer: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyBytes>> {
+    let versions = read_packed(buffer, |data| {
+        packed_uuids(data)
+            .map(|uuid| uuid_version(&uuid).unwrap_or(0) as u8)
+            .collect::<Vec<u8>>()
+    })?;
+    Ok(PyBytes::new(py, &versions))
+}
+
+#[pyfunction]
+#[pyo3(name = "_times")]
+fn times<'py>(py: Python<'py>, buffer: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyBytes>> {
+    u64_bytes(py, buffer, |uuid| Ok(uuid_time(uuid)))
+}
+
+#[pyfunction]
+#[pyo3(name = "_timestamps")]
+fn timestamps<'py>(py: Python<'py>, buffer: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyBytes>> {
+    u64_bytes(py, buffer, |uuid| {
+        uuid_timestamp(uuid)
+            .ok_or_else(|| PyValueError::new_err("UUID version should be one of (v1, v6 or v7)."))
+    })
+}
+
+pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(versions, m)?)?;
+    m.add_function(wrap_pyfunction!(times, m)?)?;
+    m.add_function(wrap_pyfunction!(timestamps, m)?)?;
+    Ok(())
+}
@@ -0,0 +1,107 @@
+use crate::{
+    UUID,
+    buffer::{packed_uuids, read_packed},
+};
+use pyo3::{
+    IntoPyObjectExt,
+    buffer::PyBuffer,
+    exceptions::PyValueError,
+    prelude::*,
+    types::{PyBytes, PyList, PyString},
+};
+use uuid::{
+    Uuid,
+    fmt::{Braced, Hyphenated, Simple, Urn},
+};
+
+#[derive(Clone, Copy)]
+enum Style {
+    Hyphenated,
+    Simple,
+    Urn,
+    Braced,
+}
+
+impl Style {
+    fn parse(style: &str) -> PyResult<Self> {
+        match style {
+            "hyphenated" => Ok(Style::Hyphenated),
+            "simple" => Ok(Style::Simple),
+            "urn" => Ok(Style::Urn),
+            "braced" => Ok(Style::Braced),
+            _ => Err(PyValueError::new_err(
+                "style must be one of 'hyphenated', 'simple', 'urn' or 'braced'",
+            )),
+        }
+    }
+
+    fn width(self) -> usize {
+        match self {
+            Style::Hyphenated => Hyphenated::LENGTH,
+            Style::Simple => Simple::LENGTH,
+            Style::Urn => Urn::LENGTH,
+            Style::Braced => Braced::LENGTH,
+        }
+    }
+
+    /// Write the lowercase ASCII form of `uuid` into the start of `buf`.
+    fn encode(self, uuid: Uuid, buf: &mut [u8]) -> &mut str {
+        match self {
+            Style::Hyphenated => uuid.hyphenated().encode_lower(buf),
+            Style::Simple => uuid.simple().encode_lower(buf),
+            Style::Urn => uuid.urn().encode_lower(buf),
+            Style::Braced => uuid.braced().encode_lower(buf),
+        }
+    }
+}
+
+fn format_into(
+    py: Python<'_>,
+    uuids: impl ExactSizeIterator<Item = Uuid>,
+    style: Style,
+    as_bytes: bool,
+) -> PyResult<Py<PyAny>> {
+    if as_bytes {
+        let width = style.width();
+        PyBytes::new_with(py, uuids.len() * width, |out| {
+            for (chunk, uuid) in out.chunks_exact_mut(width).zip(uuids) {
+                style.encode(uuid, chunk);
+            }
+            Ok(())
+        })?
+        .into_py_any(py)
+    } else {
+        let mut buf = [0u8; Urn::LENGTH];
+        PyList::new(
+            py,
+            uuids.map(|uuid| PyString::new(py, style.encode(uuid, &mut buf))),
+        )?
+        .into_py_any(py)
+    }
+}
+
+#[pyfunction]
+#[pyo3(signature = (values, style="hyphenated", *, as_bytes=false))]
+fn format_many(
+    py: Python<'_>,
+    values: &Bound<'_, PyAny>,
+    style: &str,
+    as_bytes: bool,
+) -> PyResult<Py<PyAny>> {
+    let style = Style::parse(style)?;
+    if PyBuffer::<u8>::get(values).is_ok() {
+        return read_packed(values, |data| {
+            format_into(py, packed_uuids(data), style, as_bytes)
+        })?;
+    }
+    let mut uuids = Vec::new();
+    for item in values.try_iter()? {
+        uuids.push(item?.cast::<UUID>()?.borrow().uuid);
+    }
+    format_into(py, uuids.into_iter(), style, as_bytes)
+}
+
+pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(format_many, m)?)?;
+    Ok(())
+}
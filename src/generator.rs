@@ -0,0 +1,348 @@
+use crate::{
+    UUID,
+    batch::{batch_len, stamp_version, uuid_list},
+    rng::{WyRand, fork_epoch, random_u128},
+    unix_nanos,
+};
+use pyo3::{
+    exceptions::{PyOverflowError, PyValueError},
+    prelude::*,
+    types::PyList,
+};
+use std::sync::{Mutex, MutexGuard, PoisonError};
+use uuid::{Builder, Uuid};
+
+const NANOS_PER_MILLI: u64 = 1_000_000;
+
+/// How the 74 `rand_a` and `rand_b` bits of a v7 UUID keep UUIDs generated
+/// within the same millisecond ordered (RFC 9562, section 6.2).
+#[derive(Clone, Copy, PartialEq, Eq)]
+pub(crate) enum V7Method {
+    /// Method 1: a 42-bit counter over `rand_a` and the top of `rand_b`,
+    /// followed by 32 random bits.
+    Counter,
+    /// Method 2: all 74 bits are random, and each UUID within the same
+    /// millisecond adds a random 32-bit increment to the previous one.
+    Random,
+    /// Method 3: `rand_a` holds a 12-bit fraction of the millisecond,
+    /// followed by a 30-bit counter and 32 random bits.
+    Precision,
+}
+
+impl V7Method {
+    pub(crate) fn parse(method: &str) -> PyResult<Self> {
+        match method {
+            "counter" => Ok(V7Method::Counter),
+            "random" => Ok(V7Method::Random),
+            "precision" => Ok(V7Method::Precision),
+            _ => Err(PyValueError::new_err(
+                "v7_method must be one of 'counter', 'random' or 'precision'",
+            )),
+        }
+    }
+
+    fn name(self) -> &'static str {
+        match self {
+            V7Method::Counter => "counter",
+            V7Method::Random => "random",
+            V7Method::Precision => "precision",
+        }
+    }
+
+    /// Width of the monotonic part of the 74 random bits.
+    fn counter_bits(self) -> u32 {
+        match self {
+            V7Method::Counter => 42,
+            V7Method::Random => 74,
+            V7Method::Precision => 30,
+        }
+    }
+}
+
+/// Timestamp and counter state for monotonic v7 UUIDs.
+pub(crate) struct V7State {
+    method: V7Method,
+    /// Milliseconds, followed by the 12-bit fraction with `Precision`.
+    tick: u64,
+    counter: u128,
+}
+
+impl V7State {
+    pub(crate) const fn new(method: V7Method) -> Self {
+        V7State {
+            method,
+            tick: 0,
+            counter: 0,
+        }
+    }
+
+    /// Produce the next UUID for the clock reading `nanos`, drawing the
+    /// counter seed, increment and trailing bits from `random`.
+    ///
+    /// Returns `None` once the counter for the current tick is exhausted,
+    /// rather than moving the timestamp into the future.
+    pub(crate) fn next(&mut self, nanos: u64, random: u128) -> Option<Uuid> {
+        let millis = nanos / NANOS_PER_MILLI;
+        let tick = match self.method {
+            V7Method::Precision => {
+                let fraction = (nanos % NANOS_PER_MILLI) * 4096 / NANOS_PER_MILLI;
+                millis << 12 | fraction
+            }
+            _ => millis,
+        };
+        let counter_max = (1u128 << self.method.counter_bits()) - 1;
+
+        if tick > self.tick {
+            self.tick = tick;
+            // Leave the top bit clear so the counter has room to grow.
+            self.counter = random & (counter_max >> 1);
+        } else {
+            // Same tick, or the clock went backwards: keep counting from
+            // the last UUID so the order holds.
+            let increment = match self.method {
+                V7Method::Random => (random >> 74 & 0xffff_ffff) + 1,
+                _ => 1,
+            };
+            if self.counter + increment > counter_max {
+                return None;
+            }
+            self.counter += increment;
+        }
+
+        let random = random >> 42 & 0xffff_ffff;
+        let (unix_ts, rand) = match self.method {
+            V7Method::Counter => (self.tick, self.counter << 32 | random),
+            V7Method::Random => (self.tick, self.counter),
+            V7Method::Precision => (
+                self.tick >> 12,
+                ((self.tick & 0xfff) as u128) << 62 | self.counter << 32 | random,
+            ),
+        };
+        let int = ((unix_ts & 0xffff_ffff_ffff) as u128) << 80
+            | 0x7 << 76
+            | (rand >> 62) << 64
+            | 0b10 << 62
+            | (rand & 0x3fff_ffff_ffff_ffff);
+        Some(Uuid::from_u128(int))
+    }
+
+    pub(crate) fn next_or_raise(&mut self, nanos: u64, random: u128) -> PyResult<Uuid> {
+        self.next(nanos, random).ok_or_else(|| {
+            PyOverflowError::new_err(format!(
+                "v7 counter overflow: more UUIDs requested within one tick than the '{}' \
+                 method can keep ordered",
+                self.method.name()
+            ))
+        })
+    }
+}
+
+/// The v7 state behind module-level `uuid7()` and its batch variants.
+static SHARED_V7: Mutex<V7State> = Mutex::new(V7State::new(V7Method::Counter));
+
+pub(crate) fn shared_v7() -> MutexGuard<'static, V7State> {
+    SHARED_V7.lock().unwrap_or_else(PoisonError::into_inner)
+}
+
+/// A UUID generator with its own v7 timestamp and counter state,
+/// e.g. one per thread instead of the shared state of `uuid7()`.
+#[pyclass(module = "uuid_utils")]
+pub(crate) struct Generator {
+    state: Mutex<State>,
+    /// Called for the current time in nanoseconds, instead of the system clock.
+    clock: Option<Py<PyAny>>,
+}
+
+struct State {
+    v7: V7State,
+    rng: Source,
+}
+
+/// Where a generator draws its random bits from.
+enum Source {
+    /// The thread-local CSPRNG and entropy pool shared with module-level
+    /// functions.
+    Secure,
+    /// A private wyrand state, seeded either by the caller or from the
+    /// CSPRNG. Unseeded states are reseeded after `reseed_rng()`, so a
+    /// forked child does not repeat its parent's UUIDs.
+    Fast {
+        rng: WyRand,
+        seeded: bool,
+        epoch: u64,
+    },
+}
+
+impl Source {
+    fn parse(rng: &str, seed: Option<u64>) -> PyResult<Self> {
+        match (rng, seed) {
+            ("secure", None) => Ok(Source::Secure),
+            ("secure", Some(_)) => Err(PyValueError::new_err("seed requires rng='fast'")),
+            ("fast", _) => Ok(Source::Fast {
+                rng: WyRand::new(seed.unwrap_or_else(rand::random)),
+                seeded: seed.is_some(),
+                epoch: fork_epoch(),
+            }),
+            _ => Err(PyValueError::new_err(
+                "rng must be one of 'secure' or 'fast'",
+            )),
+        }
+    }
+
+    fn name(&self) -> &'static str {
+        match self {
+            Source::Secure => "secure",
+            Source::Fast { .. } => "fast",
+        }
+    }
+
+    fn fast<'a>(rng: &'a mut WyRand, seeded: bool, epoch: &mut u64) -> &'a mut WyRand {
+        let current = fork_epoch();
+        if !seeded && *epoch != current {
+            *rng = WyRand::new(rand::random());
+            *epoch = current;
+        }
+        rng
+    }
+
+    fn next_u128(&mut self) -> u128 {
+        match self {
+            Source::Secure => random_u128(),
+            Source::Fast { rng, seeded, epoch } => Self::fast(rng, *seeded, epoch).next_u128(),
+        }
+    }
+
+    fn fill(&mut self, out: &mut [u8]) {
+        match self {
+            Source::Secure => rand::fill(out),
+            Source::Fast { rng, seeded, epoch } => Self::fast(rng, *seeded, epoch).fill(out),
+        }
+    }
+}
+
+impl Generator {
+    fn state(&self) -> MutexGuard<'_, State> {
+        self.state.lock().unwrap_or_else(PoisonError::into_inner)
+    }
+
+    /// Nanoseconds since the Unix epoch for `timestamp` in milliseconds,
+    /// or the current time of this generator's clock.
+    fn nanos(&self, py: Python<'_>, timestamp: Option<u64>) -> PyResult<u64> {
+        match (timestamp, &self.clock) {
+            (None, Some(clock)) => clock.bind(py).call0()?.extract(),
+            _ => unix_nanos(timestamp),
+        }
+    }
+
+    fn random_list<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        version: u8,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut bytes = vec![0u8; batch_len(n)?];
+        self.state().rng.fill(&mut bytes);
+        stamp_version(&mut bytes, version);
+        uuid_list(py, &bytes)
+    }
+}
+
+#[pymethods]
+impl Generator {
+    #[new]
+    #[pyo3(signature = (*, v7_method="counter", clock=None, rng="secure", seed=None))]
+    fn new(
+        v7_method: &str,
+        clock: Option<Py<PyAny>>,
+        rng: &str,
+        seed: Option<u64>,
+    ) -> PyResult<Self> {
+        let state = State {
+            v7: V7State::new(V7Method::parse(v7_method)?),
+            rng: Source::parse(rng, seed)?,
+        };
+        Ok(Generator {
+            state: Mutex::new(state),
+            clock,
+        })
+    }
+
+    #[getter]
+    fn v7_method(&self) -> &'static str {
+        self.state().v7.method.name()
+    }
+
+    #[getter]
+    fn rng(&self) -> &'static str {
+        self.state().rng.name()
+    }
+
+    fn uuid4(&self) -> UUID {
+        let random = self.state().rng.next_u128();
+        UUID {
+            uuid: Builder::from_random_bytes(random.to_le_bytes()).into_uuid(),
+        }
+    }
+
+    #[pyo3(signature = (*, timestamp=None))]
+    fn uuid7(&self, py: Python<'_>, timestamp: Option<u64>) -> PyResult<UUID> {
+        let nanos = self.nanos(py, timestamp)?;
+        let mut state = self.state();
+        let random = state.rng.next_u128();
+        let uuid = match timestamp {
+            Some(_) => V7State::new(state.v7.method).next_or_raise(nanos, random)?,
+            None => state.v7.next_or_raise(nanos, random)?,
+        };
+        Ok(UUID { uuid })
+    }
+
+    fn uuid8(&self) -> UUID {
+        let random = self.state().rng.next_u128();
+        UUID {
+            uuid: Uuid::new_v8(random.to_le_bytes()),
+        }
+    }
+
+    fn uuid4_many<'py>(&self, py: Python<'py>, n: usize) -> PyResult<Bound<'py, PyList>> {
+        self.random_list(py, n, 4)
+    }
+
+    #[pyo3(signature = (n, *, timestamp=None))]
+    fn uuid7_many<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        timestamp: Option<u64>,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let nanos = self.nanos(py, timestamp)?;
+        let mut state = self.state();
+        let State { v7, rng } = &mut *state;
+        let mut local;
+        let v7 = match timestamp {
+            // Backfilled UUIDs stay out of the generator's state, which would
+            // otherwise ignore older timestamps and hold later calls at newer ones.
+            Some(_) => {
+                local = V7State::new(v7.method);
+                &mut local
+            }
+            None => v7,
+        };
+        let uuids = (0..n)
+            .map(|_| {
+                let uuid = v7.next_or_raise(nanos, rng.next_u128())?;
+                Ok(UUID { uuid })
+            })
+            .collect::<PyResult<Vec<UUID>>>()?;
+        drop(state);
+        PyList::new(py, uuids)
+    }
+
+    fn uuid8_many<'py>(&self, py: Python<'py>, n: usize) -> PyResult<Bound<'py, PyList>> {
+        self.random_list(py, n, 8)
+    }
+}
+
+pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<Generator>()?;
+    Ok(())
+}
@@ -0,0 +1,350 @@
+use crate::{
+    UUID,
+    batch::{batch_len, uuid_list},
+    compat,
+};
+use md5::{Digest, Md5};
+use pyo3::{
+    buffer::PyBuffer,
+    exceptions::{PyTypeError, PyValueError},
+    intern,
+    prelude::*,
+    types::{PyBytes, PyList, PyString},
+};
+use sha1_smol::Sha1;
+use std::{
+    borrow::Cow,
+    cell::RefCell,
+    num::NonZero,
+    sync::atomic::{AtomicU64, Ordering},
+    thread,
+};
+use uuid::{Builder, Uuid};
+
+/// The most standard library namespaces each thread remembers.
+const NAMESPACE_CACHE_SIZE: usize = 8;
+
+static NAMESPACE_HITS: AtomicU64 = AtomicU64::new(0);
+static NAMESPACE_MISSES: AtomicU64 = AtomicU64::new(0);
+
+thread_local! {
+    /// Standard library namespaces recently read through `.int`, by identity.
+    /// They are kept alive while cached, so their addresses are not reused.
+    static NAMESPACES: RefCell<Vec<(Py<PyAny>, Uuid)>> = const { RefCell::new(Vec::new()) };
+}
+
+/// Read a namespace from a `UUID`, or from any object with a 128-bit
+/// `int` attribute such as a standard library `uuid.UUID`.
+pub(crate) fn namespace_uuid(namespace: &Bound<'_, PyAny>) -> PyResult<Uuid> {
+    if let Ok(namespace) = namespace.cast::<UUID>() {
+        return Ok(namespace.borrow().uuid);
+    }
+    // Standard library UUIDs are immutable, so the same few namespaces
+    // passed on every call only need to be converted once.
+    let cacheable = compat::is_stdlib_uuid(namespace)?;
+    if cacheable {
+        let ptr = namespace.as_ptr();
+        let cached = NAMESPACES.with_borrow(|cache| {
+            cache
+                .iter()
+                .find(|(obj, _)| obj.as_ptr() == ptr)
+                .map(|&(_, uuid)| uuid)
+        });
+        if let Some(uuid) = cached {
+            NAMESPACE_HITS.fetch_add(1, Ordering::Relaxed);
+            return Ok(uuid);
+        }
+        NAMESPACE_MISSES.fetch_add(1, Ordering::Relaxed);
+    }
+    let uuid = match namespace.getattr(intern!(namespace.py(), "int")) {
+        Ok(int) => Uuid::from_u128(int.extract()?),
+        Err(_) => return Err(PyTypeError::new_err("namespace must be a UUID")),
+    };
+    if cacheable {
+        let evicted = NAMESPACES.with_borrow_mut(|cache| {
+            let entry = (namespace.clone().unbind(), uuid);
+            if cache.len() < NAMESPACE_CACHE_SIZE {
+                cache.push(entry);
+                None
+            } else {
+                Some(std::mem::replace(
+                    &mut cache[uuid.as_u128() as usize % NAMESPACE_CACHE_SIZE],
+                    entry,
+                ))
+            }
+        });
+        // Dropped outside the borrow, in case that runs Python code.
+        drop(evicted);
+    }
+    Ok(uuid)
+}
+
+/// Hits and misses of the namespace cache across all threads,
+/// and the number of namespaces each thread keeps.
+#[pyfunction]
+#[pyo3(name = "_namespace_cache_info")]
+fn namespace_cache_info() -> (u64, u64, usize) {
+    (
+        NAMESPACE_HITS.load(Ordering::Relaxed),
+        NAMESPACE_MISSES.load(Ordering::Relaxed),
+        NAMESPACE_CACHE_SIZE,
+    )
+}
+
+/// Borrow the UTF-8 form of a `str` name, or the contents of a `bytes`
+/// name, without copying it. Other bytes-like names, such as `bytearray`
+/// or `memoryview`, are mutable, so their contents are copied.
+pub(crate) fn name_bytes<'a>(name: &'a Bound<'_, PyAny>) -> PyResult<Cow<'a, [u8]>> {
+    if let Ok(name) = name.cast::<PyString>() {
+        return Ok(Cow::Borrowed(name.to_str()?.as_bytes()));
+    }
+    if let Ok(name) = name.cast::<PyBytes>() {
+        return Ok(Cow::Borrowed(name.as_bytes()));
+    }
+    if let Ok(buffer) = PyBuffer::<u8>::get(name) {
+        return Ok(Cow::Owned(buffer.to_vec(name.py())?));
+    }
+    Err(PyTypeError::new_err(
+        "name must be str or a bytes-like object",
+    ))
+}
+
+/// A hash state that has already consumed the namespace bytes.
+enum Primed {
+    Md5(Md5),
+    Sha1(Sha1),
+}
+
+impl Primed {
+    fn new(namespace: &Uuid, version: u8) -> PyResult<Self> {
+        let bytes = namespace.as_bytes();
+        match version {
+            3 => Ok(Primed::Md5(Md5::new_with_prefix(bytes))),
+            5 => Ok(Primed::Sha1(Sha1::from(bytes))),
+            _ => Err(PyValueError::new_err("version must be 3 or 5")),
+        }
+    }
+
+    fn hash(&self, name: &[u8]) -> Uuid {
+        match self {
+            Primed::Md5(state) => {
+                let mut state = state.clone();
+                state.update(name);
+                let digest = state.finalize();
+                Builder::from_md5_bytes(digest[..].try_into().unwrap()).into_uuid()
+            }
+            Primed::Sha1(state) => {
+                let mut state = state.clone();
+                state.update(name);
+                let digest = state.digest().bytes();
+                Builder::from_sha1_bytes(digest[..16].try_into().unwrap()).into_uuid()
+            }
+        }
+    }
+}
+
+/// Derive version 3 or 5 UUIDs for many names in a single namespace.
+///
+/// The hash state is primed with the namespace once and cloned per name,
+/// so only the name itself is hashed on each call.
+#[pyclass(module = "uuid_utils", frozen)]
+pub(crate) struct NameHasher {
+    namespace: Uuid,
+    state: Primed,
+}
+
+#[pymethods]
+impl NameHasher {
+    #[new]
+    #[pyo3(signature = (namespace, version=5))]
+    fn new(namespace: &Bound<'_, PyAny>, version: u8) -> PyResult<Self> {
+        let namespace = namespace_uuid(namespace)?;
+        Ok(NameHasher {
+            namespace,
+            state: Primed::new(&namespace, version)?,
+        })
+    }
+
+    #[getter]
+    fn namespace(&self) -> UUID {
+        UUID {
+            uuid: self.namespace,
+        }
+    }
+
+    #[getter]
+    fn version(&self) -> u8 {
+        match self.state {
+            Primed::Md5(_) => 3,
+            Primed::Sha1(_) => 5,
+        }
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "NameHasher(UUID('{}'), version={})",
+            self.namespace.hyphenated(),
+            self.version()
+        )
+    }
+
+    fn __call__(&self, name: &Bound<'_, PyAny>) -> PyResult<UUID> {
+        Ok(UUID {
+            uuid: self.state.hash(&name_bytes(name)?),
+        })
+    }
+
+    #[pyo3(signature = (names, *, threads=None))]
+    fn many<'py>(
+        &self,
+        py: Python<'py>,
+        names: &Bound<'py, PyAny>,
+        threads: Option<usize>,
+    ) -> PyResult<Bound<'py, PyList>> {
+        hash_list(py, &self.state, names, threads)
+    }
+}
+
+/// Batches smaller than this per thread are not worth spawning a thread for.
+const MIN_NAMES_PER_THREAD: usize = 4096;
+
+fn thread_count(threads: Option<usize>) -> PyResult<usize> {
+    match threads {
+        Some(0) => Err(PyValueError::new_err("threads must be at least 1")),
+        _ if cfg!(target_arch = "wasm32") => Ok(1),
+        Some(threads) => Ok(threads),
+        None => Ok(thread::available_parallelism().map_or(1, NonZero::get)),
+    }
+}
+
+/// Hash every name into consecutive 16-byte chunks of `out`,
+/// splitting the work across up to `threads` native threads.
+fn hash_into(state: &Primed, names: &[Cow<'_, [u8]>], out: &mut [u8], threads: usize) {
+    let per_thread = names.len().div_ceil(threads).max(MIN_NAMES_PER_THREAD);
+    let chunks = names
+        .chunks(per_thread)
+        .zip(out.chunks_mut(per_thread * 16));
+    let hash_chunk = |(names, out): (&[Cow<'_, [u8]>], &mut [u8])| {
+        for (name, chunk) in names.iter().zip(out.chunks_exact_mut(16)) {
+            chunk.copy_from_slice(state.hash(name).as_bytes());
+        }
+    };
+    if per_thread >= names.len() {
+        chunks.for_each(hash_chunk);
+    } else {
+        thread::scope(|scope| {
+            for chunk in chunks {
+                scope.spawn(move || hash_chunk(chunk));
+            }
+        });
+    }
+}
+
+/// Collect the names up front, so they can be hashed with the GIL
+/// detached while borrowing their `str` or `bytes` buffers in place.
+fn collect_names<'py>(names: &Bound<'py, PyAny>) -> PyResult<Vec<Bound<'py, PyAny>>> {
+    names.try_iter()?.collect()
+}
+
+fn hash_list<'py>(
+    py: Python<'py>,
+    state: &Primed,
+    names: &Bound<'py, PyAny>,
+    threads: Option<usize>,
+) -> PyResult<Bound<'py, PyList>> {
+    let threads = thread_count(threads)?;
+    let items = collect_names(names)?;
+    let names = items.iter().map(name_bytes).collect::<PyResult<Vec<_>>>()?;
+    let mut out = vec![0u8; batch_len(names.len())?];
+    py.detach(|| hash_into(state, &names, &mut out, threads));
+    uuid_list(py, &out)
+}
+
+fn hash_bytes<'py>(
+    py: Python<'py>,
+    state: &Primed,
+    names: &Bound<'py, PyAny>,
+    threads: Option<usize>,
+) -> PyResult<Bound<'py, PyBytes>> {
+    let threads = thread_count(threads)?;
+    let items = collect_names(names)?;
+    let names = items.iter().map(name_bytes).collect::<PyResult<Vec<_>>>()?;
+    PyBytes::new_with(py, batch_len(names.len())?, |out| {
+        py.detach(|| hash_into(state, &names, out, threads));
+        Ok(())
+    })
+}
+
+#[pyfunction]
+#[pyo3(signature = (namespace, names, *, threads=None))]
+fn uuid3_many<'py>(
+    py: Python<'py>,
+    namespace: &Bound<'_, PyAny>,
+    names: &Bound<'py, PyAny>,
+    threads: Option<usize>,
+) -> PyResult<Bound<'py, PyList>> {
+    hash_list(
+        py,
+        &Primed::new(&namespace_uuid(namespace)?, 3)?,
+        names,
+        threads,
+    )
+}
+
+#[pyfunction]
+#[pyo3(signature = (namespace, names, *, threads=None))]
+fn uuid5_many<'py>(
+    py: Python<'py>,
+    namespace: &Bound<'_, PyAny>,
+    names: &Bound<'py, PyAny>,
+    threads: Option<usize>,
+) -> PyResult<Bound<'py, PyList>> {
+    hash_list(
+        py,
+        &Primed::new(&namespace_uuid(namespace)?, 5)?,
+        names,
+        threads,
+    )
+}
+
+#[pyfunction]
+#[pyo3(signature = (namespace, names, *, threads=None))]
+fn uuid3_bytes<'py>(
+    py: Python<'py>,
+    namespace: &Bound<'_, PyAny>,
+    names: &Bound<'py, PyAny>,
+    threads: Option<usize>,
+) -> PyResult<Bound<'py, PyBytes>> {
+    hash_bytes(
+        py,
+        &Primed::new(&namespace_uuid(namespace)?, 3)?,
+        names,
+        threads,
+    )
+}
+
+#[pyfunction]
+#[pyo3(signature = (namespace, names, *, threads=None))]
+fn uuid5_bytes<'py>(
+    py: Python<'py>,
+    namespace: &Bound<'_, PyAny>,
+    names: &Bound<'py, PyAny>,
+    threads: Option<usize>,
+) -> PyResult<Bound<'py, PyBytes>> {
+    hash_bytes(
+        py,
+        &Primed::new(&namespace_uuid(namespace)?, 5)?,
+        names,
+        threads,
+    )
+}
+
+pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<NameHasher>()?;
+    m.add_function(wrap_pyfunction!(uuid3_many, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid5_many, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid3_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid5_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(namespace_cache_info, m)?)?;
+    Ok(())
+}
@@ -0,0 +1,307 @@
+use crate::{
+    UUID, gregorian_ticks, unix_nanos,
+    uuidset::{for_each_uuid, require_uuid, uuid_item},
+};
+use pyo3::{
+    exceptions::{PyIndexError, PyOverflowError, PyRuntimeError, PyValueError},
+    prelude::*,
+    types::{PyBytes, PyTuple},
+};
+use uuid::Uuid;
+
+/// The RFC 4122 variant bits, and the largest value of the bits after them.
+const VARIANT: u128 = 0b10 << 62;
+const LOW_MAX: u128 = VARIANT | ((1 << 62) - 1);
+
+/// The timestamp bits of a UUID of `version` (6 or 7) created at `millis`,
+/// with the version set and all other bits zero. With `last`, the bits for
+/// the last instant in that millisecond that the version can represent.
+fn time_bits(version: u8, millis: u64, last: bool) -> PyResult<u128> {
+    match version {
+        7 if millis < 1 << 48 => {
+            let fraction = if last { 0xfff } else { 0 };
+            Ok((millis as u128) << 80 | 7 << 76 | fraction << 64)
+        }
+        6 => {
+            let ticks = gregorian_ticks(unix_nanos(Some(millis))?) + if last { 9_999 } else { 0 };
+            if ticks >= 1 << 60 {
+                return Err(PyOverflowError::new_err("timestamp is too large"));
+            }
+            let ticks = ticks as u128;
+            Ok((ticks >> 12) << 80 | 6 << 76 | (ticks & 0xfff) << 64)
+        }
+        7 => Err(PyOverflowError::new_err("timestamp is too large")),
+        _ => Err(PyValueError::new_err("version must be 6 or 7")),
+    }
+}
+
+/// The smallest UUID of `version` whose timestamp is at least `millis`,
+/// ignoring the variant. UUIDs of that version sort by time, so this is
+/// where the UUIDs from `millis` onwards start in sorted order.
+pub(crate) fn time_floor(version: u8, millis: u64) -> PyResult<u128> {
+    time_bits(version, millis, false)
+}
+
+/// The smallest and largest valid UUIDs of `version` with timestamps
+/// from `start` to `end` milliseconds, inclusive.
+fn time_bounds(version: u8, start: u64, end: Option<u64>) -> PyResult<(UUID, UUID)> {
+    let end = end.unwrap_or(start);
+    if end < start {
+        return Err(PyValueError::new_err("end must not be before start"));
+    }
+    let lo = time_bits(version, start, false)? | VARIANT;
+    let hi = time_bits(version, end, true)? | LOW_MAX;
+    Ok((
+        UUID {
+            uuid: Uuid::from_u128(lo),
+        },
+        UUID {
+            uuid: Uuid::from_u128(hi),
+        },
+    ))
+}
+
+#[pyfunction]
+#[pyo3(signature = (start, end=None))]
+fn uuid6_bounds(start: u64, end: Option<u64>) -> PyResult<(UUID, UUID)> {
+    time_bounds(6, start, end)
+}
+
+#[pyfunction]
+#[pyo3(signature = (start, end=None))]
+fn uuid7_bounds(start: u64, end: Option<u64>) -> PyResult<(UUID, UUID)> {
+    time_bounds(7, start, end)
+}
+
+/// Sorted, deduplicated UUIDs of version 6 or 7, searchable by time.
+#[pyclass(module = "uuid_utils")]
+pub(crate) struct SortedUUIDIndex {
+    values: Vec<u128>,
+    version: u8,
+    /// Bumped whenever the index changes, to detect mutation while iterating.
+    generation: u64,
+}
+
+impl SortedUUIDIndex {
+    /// The positions of the UUIDs with timestamps in `[start, end)`.
+    fn span(&self, start: Option<u64>, end: Option<u64>) -> PyResult<(usize, usize)> {
+        let position = |millis: Option<u64>, default: usize| -> PyResult<usize> {
+            match millis {
+                Some(millis) => {
+                    let floor = time_floor(self.version, millis)?;
+                    Ok(self.values.partition_point(|&value| value < floor))
+                }
+                None => Ok(default),
+            }
+        };
+        let lo = position(start, 0)?;
+        let hi = position(end, self.values.len())?;
+        Ok((lo, hi.max(lo)))
+    }
+
+    /// Add `values` and restore the order.
+    fn merge(&mut self, values: Vec<u128>) {
+        let len = self.values.len();
+        self.values.extend(values);
+        // Bulk loads are usually already in order, which this detects quickly.
+        self.values.sort_unstable();
+        self.values.dedup();
+        if self.values.len() != len {
+            self.generation += 1;
+        }
+    }
+}
+
+/// UUIDs of any version but `version` do not sort by time, and would make
+/// the results of `count` and `range` wrong.
+fn check_version(version: u8, value: u128) -> PyResult<()> {
+    let actual = Uuid::from_u128(value).get_version_num();
+    if actual != version as usize {
+        return Err(PyValueError::new_err(format!(
+            "expected a version {version} UUID, got version {actual}"
+        )));
+    }
+    Ok(())
+}
+
+/// All the UUIDs in `other`, checked to be of `version`. They are read
+/// before the index is borrowed, since iterating `other` runs Python code
+/// that may use the index.
+fn read_values(version: u8, other: &Bound<'_, PyAny>) -> PyResult<Vec<u128>> {
+    if let Ok(other) = other.cast::<SortedUUIDIndex>() {
+        let other = other.borrow();
+        if other.version != version {
+            return Err(PyValueError::new_err(format!(
+                "expected a version {version} index, got version {}",
+                other.version
+            )));
+        }
+        return Ok(other.values.clone());
+    }
+    let mut values = Vec::new();
+    for_each_uuid(other, |value| values.push(value))?;
+    for &value in &values {
+        check_version(version, value)?;
+    }
+    Ok(values)
+}
+
+#[pymethods]
+impl SortedUUIDIndex {
+    #[new]
+    #[pyo3(signature = (values=None, *, version=7))]
+    fn new(values: Option<&Bound<'_, PyAny>>, version: u8) -> PyResult<Self> {
+        if version != 6 && version != 7 {
+            return Err(PyValueError::new_err("version must be 6 or 7"));
+        }
+        let mut index = Self {
+            values: Vec::new(),
+            version,
+            generation: 0,
+        };
+        if let Some(values) = values {
+            index.merge(read_values(version, values)?);
+        }
+        Ok(index)
+    }
+
+    #[getter]
+    fn version(&self) -> u8 {
+        self.version
+    }
+
+    fn __len__(&self) -> usize {
+        self.values.len()
+    }
+
+    fn __contains__(&self, item: &Bound<'_, PyAny>) -> bool {
+        match uuid_item(item) {
+            Ok(Some(uuid)) => self.values.binary_search(&uuid.as_u128()).is_ok(),
+            _ => false,
+        }
+    }
+
+    fn __getitem__(&self, index: isize) -> PyResult<UUID> {
+        let len = self.values.len() as isize;
+        let index = if index < 0 { index + len } else { index };
+        if !(0..len).contains(&index) {
+            return Err(PyIndexError::new_err("index out of range"));
+        }
+        Ok(UUID {
+            uuid: Uuid::from_u128(self.values[index as usize]),
+        })
+    }
+
+    fn __iter__(slf: Bound<'_, Self>) -> SortedUUIDIndexIterator {
+        let generation = slf.borrow().generation;
+        SortedUUIDIndexIterator {
+            index: slf.unbind(),
+            generation,
+            position: 0,
+        }
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "SortedUUIDIndex(<{} UUIDs>, version={})",
+            self.values.len(),
+            self.version
+        )
+    }
+
+    fn add(&mut self, item: &Bound<'_, PyAny>) -> PyResult<()> {
+        let value = require_uuid(item)?.as_u128();
+        check_version(self.version, value)?;
+        if let Err(position) = self.values.binary_search(&value) {
+            self.values.insert(position, value);
+            self.generation += 1;
+        }
+        Ok(())
+    }
+
+    #[pyo3(signature = (*others))]
+    fn update(slf: &Bound<'_, Self>, others: &Bound<'_, PyTuple>) -> PyResult<()> {
+        for other in others {
+            if other.as_ptr() != slf.as_ptr() {
+                let values = read_values(slf.borrow().version, &other)?;
+                slf.borrow_mut().merge(values);
+            }
+        }
+        Ok(())
+    }
+
+    /// The number of UUIDs with timestamps in `[start, end)`.
+    #[pyo3(signature = (start=None, end=None))]
+    fn count(&self, start: Option<u64>, end: Option<u64>) -> PyResult<usize> {
+        let (lo, hi) = self.span(start, end)?;
+        Ok(hi - lo)
+    }
+
+    /// The UUIDs with timestamps in `[start, end)`, in order.
+    #[pyo3(signature = (start=None, end=None))]
+    fn range(&self, start: Option<u64>, end: Option<u64>) -> PyResult<Vec<UUID>> {
+        let (lo, hi) = self.span(start, end)?;
+        Ok(self.values[lo..hi]
+            .iter()
+            .map(|&value| UUID {
+                uuid: Uuid::from_u128(value),
+            })
+            .collect())
+    }
+
+    /// Like `range`, but packed into `16 * n` big-endian bytes.
+    #[pyo3(signature = (start=None, end=None))]
+    fn range_bytes<'py>(
+        &self,
+        py: Python<'py>,
+        start: Option<u64>,
+        end: Option<u64>,
+    ) -> PyResult<Bound<'py, PyBytes>> {
+        let (lo, hi) = self.span(start, end)?;
+        PyBytes::new_with(py, (hi - lo) * 16, |out| {
+            for (chunk, value) in out.chunks_exact_mut(16).zip(&self.values[lo..hi]) {
+                chunk.copy_from_slice(&value.to_be_bytes());
+            }
+            Ok(())
+        })
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.range_bytes(py, None, None)
+    }
+}
+
+/// Iterator over the UUIDs in a `SortedUUIDIndex`, in order.
+#[pyclass(module = "uuid_utils")]
+pub(crate) struct SortedUUIDIndexIterator {
+    index: Py<SortedUUIDIndex>,
+    generation: u64,
+    position: usize,
+}
+
+#[pymethods]
+impl SortedUUIDIndexIterator {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python<'_>) -> PyResult<Option<UUID>> {
+        let changed = || PyRuntimeError::new_err("SortedUUIDIndex changed size during iteration");
+        let index = self.index.try_borrow(py).map_err(|_| changed())?;
+        if index.generation != self.generation {
+            return Err(changed());
+        }
+        let value = index.values.get(self.position);
+        self.position += value.is_some() as usize;
+        Ok(value.map(|&value| UUID {
+            uuid: Uuid::from_u128(value),
+        }))
+    }
+}
+
+pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<SortedUUIDIndex>()?;
+    m.add_function(wrap_pyfunction!(uuid6_bounds, m)?)?;
+    m.add_function(wrap_pyfunction!(uuid7_bounds, m)?)?;
+    Ok(())
+}
@@ -2,39 +2,112 @@
 use mac_address::MacAddressIterator;
 use pyo3::{
     IntoPyObjectExt,
-    exceptions::{PyOSError, PyTypeError, PyValueError},
+    exceptions::{PyOSError, PyOverflowError, PyTypeError, PyValueError},
+    ffi, intern,
     prelude::*,
     pyclass::CompareOp,
     types::{PyBytes, PyDict},
 };
 use std::{
+    ffi::{c_int, c_void},
     sync::atomic::{AtomicU64, Ordering},
+    thread,
     time::SystemTime,
 };
 use uuid::{Builder, Bytes, Timestamp, Uuid, Variant, Version};
 
+mod batch;
+mod buffer;
+mod cached;
+mod compat;
+mod fields;
+mod format;
+mod generator;
+mod hasher;
+mod index;
+mod parse;
+mod rng;
+mod scan;
+mod uuidset;
+
+/// The node used when none is given, with `NODE_SET` marking it as known.
+/// Zero means it has not been set or discovered yet.
 static NODE: AtomicU64 = AtomicU64::new(0);
+const NODE_SET: u64 = 1 << 63;
 
 #[cfg(target_pointer_width = "64")]
-const HASH_MODULUS: u128 = (1u128 << 61) - 1;
+const HASH_BITS: u32 = 61;
 
 #[cfg(not(target_pointer_width = "64"))]
-const HASH_MODULUS: u128 = (1u128 << 31) - 1;
+const HASH_BITS: u32 = 31;
+
+const HASH_MODULUS: u128 = (1 << HASH_BITS) - 1;
+
+/// Python's hash of `value` as an `int`, which is also the hash of a standard
+/// library `uuid.UUID`: `value` modulo `HASH_MODULUS`. Since `2**HASH_BITS`
+/// is 1 modulo `HASH_MODULUS`, this sums `HASH_BITS` bits at a time instead
+/// of dividing.
+fn int_hash(value: u128) -> isize {
+    let mut value = value;
+    let mut sum = 0;
+    while value != 0 {
+        sum += value & HASH_MODULUS;
+        value >>= HASH_BITS;
+    }
+    while sum > HASH_MODULUS {
+        sum = (sum & HASH_MODULUS) + (sum >> HASH_BITS);
+    }
+    if sum == HASH_MODULUS { 0 } else { sum as isize }
+}
 
 pub const RESERVED_NCS: &str = "reserved for NCS compatibility";
 pub const RFC_4122: &str = "specified in RFC 4122";
 pub const RESERVED_MICROSOFT: &str = "reserved for Microsoft compatibility";
 pub const RESERVED_FUTURE: &str = "reserved for future definition";
 
-#[derive(FromPyObject)]
-enum StringOrBytes {
-    #[pyo3(transparent, annotation = "str")]
-    String(String),
-    #[pyo3(transparent, annotation = "bytes")]
-    Bytes(Vec<u8>),
+fn uuid_version(uuid: &Uuid) -> Option<usize> {
+    (uuid.get_variant() == Variant::RFC4122).then(|| uuid.get_version_num())
+}
+
+fn uuid_time(uuid: &Uuid) -> u64 {
+    let int = uuid.as_u128();
+    match uuid_version(uuid) {
+        Some(6) => {
+            let time_hi = int.wrapping_shr(96) as u64;
+            let time_mid = (int.wrapping_shr(80) & 0xffff) as u64;
+            let time_lo = (int.wrapping_shr(64) & 0x0fff) as u64;
+            time_hi << 28 | time_mid << 12 | time_lo
+        }
+        Some(7) => int.wrapping_shr(80) as u64,
+        _ => {
+            let time_hi = (int.wrapping_shr(64) & 0x0fff) as u64;
+            let time_mid = (int.wrapping_shr(80) & 0xffff) as u64;
+            let time_low = int.wrapping_shr(96) as u64;
+            time_hi << 48 | time_mid << 32 | time_low
+        }
+    }
+}
+
+/// Milliseconds since the Unix epoch for v1, v6 and v7 UUIDs.
+fn uuid_timestamp(uuid: &Uuid) -> Option<u64> {
+    uuid.get_timestamp().map(|timestamp| {
+        let (secs, nanos) = timestamp.to_unix();
+        secs * 1_000 + nanos as u64 / 1_000 / 1_000
+    })
+}
+
+/// Read the 16 bytes of a UUID straight from the `bytes` object,
+/// rather than extracting them one by one as a sequence.
+fn borrow_bytes(bytes: &Bound<'_, PyBytes>, name: &str) -> PyResult<Bytes> {
+    bytes
+        .as_bytes()
+        .try_into()
+        .map_err(|_| PyValueError::new_err(format!("{name} is not a 16-char string")))
 }
 
-#[pyclass(subclass, module = "uuid_utils", from_py_object)]
+// Recycle the memory of dropped UUIDs, which are often created and
+// discarded in large numbers.
+#[pyclass(freelist = 1024, subclass, module = "uuid_utils", from_py_object)]
 #[derive(Clone, Debug)]
 struct UUID {
     uuid: Uuid,
@@ -94,12 +167,29 @@ impl UUID {
         format!("UUID('{}')", self.uuid.hyphenated())
     }
 
-    fn __richcmp__(&self, other: UUID, op: CompareOp) -> PyResult<bool> {
-        Ok(op.matches(self.uuid.cmp(&other.uuid)))
+    /// Compares with other `UUID`s, and with standard library UUIDs through
+    /// their `int` attribute, so that either can be used as a dict key for
+    /// the other.
+    fn __richcmp__(
+        slf: PyRef<'_, Self>,
+        other: &Bound<'_, PyAny>,
+        op: CompareOp,
+    ) -> PyResult<Py<PyAny>> {
+        let py = other.py();
+        let other = if other.as_ptr() == slf.as_ptr() {
+            slf.uuid
+        } else if let Ok(other) = other.cast::<UUID>() {
+            other.borrow().uuid
+        } else if compat::is_stdlib_uuid(other)? {
+            Uuid::from_u128(other.getattr(intern!(py, "int"))?.extract()?)
+        } else {
+            return py.NotImplemented().into_py_any(py);
+        };
+        op.matches(slf.uuid.cmp(&other)).into_py_any(py)
     }
 
     fn __hash__(&self) -> PyResult<isize> {
-        Ok((self.uuid.as_u128() % HASH_MODULUS) as isize)
+        Ok(int_hash(self.uuid.as_u128()))
     }
 
     fn set_version(&self, version: u8) -> PyResult<UUID> {
@@ -127,6 +217,34 @@ impl UUID {
         Err(PyTypeError::new_err("UUID objects are immutable"))
     }
 
+    /// Expose the 16 big-endian bytes as a read-only buffer, so that
+    /// `memoryview(uuid)` and `bytes(uuid)` do not go through `.bytes`.
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        let data = slf.borrow().uuid.as_bytes().as_ptr();
+        // SAFETY: UUIDs never change after creation, and the view keeps a
+        // reference to `slf`, so `data` stays valid for its lifetime.
+        // Requests for a writable buffer fail with `BufferError`.
+        let result = unsafe {
+            ffi::PyBuffer_FillInfo(view, slf.as_ptr(), data as *mut c_void, 16, 1, flags)
+        };
+        if result == -1 {
+            return Err(PyErr::fetch(slf.py()));
+        }
+        Ok(())
+    }
+
+    /// Copy the 16 big-endian bytes into a writable buffer at `offset`,
+    /// returning the offset just after them.
+    #[pyo3(signature = (buffer, offset=0))]
+    fn write_to(&self, buffer: &Bound<'_, PyAny>, offset: usize) -> PyResult<usize> {
+        crate::buffer::write_at(buffer, offset, self.uuid.as_bytes())?;
+        Ok(offset + 16)
+    }
+
     fn __getnewargs__(&self) -> (String,) {
         (self.__str__(),)
     }
@@ -162,7 +280,7 @@ impl UUID {
 
     #[getter]
     fn version(&self) -> Option<usize> {
-        (self.uuid.get_variant() == Variant::RFC4122).then(|| self.uuid.get_version_num())
+        uuid_version(&self.uuid)
     }
 
     #[getter]
@@ -214,32 +332,14 @@ impl UUID {
 
     #[getter]
     fn time(&self) -> u64 {
-        match self.version() {
-            Some(6) => {
-                let time_hi = self.int().wrapping_shr(96) as u64;
-                let time_lo = (self.int().wrapping_shr(64) & 0x0fff) as u64;
-                time_hi << 28 | (self.time_mid() as u64) << 12 | time_lo
-            }
-            Some(7) => self.int().wrapping_shr(80) as u64,
-            _ => {
-                let time_hi = self.time_hi_version() as u64 & 0x0fff;
-                let mid = self.time_mid() as u64;
-                time_hi << 48 | mid << 32 | self.time_low() as u64
-            }
-        }
+        uuid_time(&self.uuid)
     }
 
     #[getter]
     fn timestamp(&self) -> PyResult<u64> {
-        match self.uuid.get_timestamp() {
-            Some(timestamp) => {
-                let (secs, nanos) = timestamp.to_unix();
-                Ok(secs * 1_000 + nanos as u64 / 1_000 / 1_000)
-            }
-            _ => Err(PyErr::new::<PyValueError, &str>(
-                "UUID version should be one of (v1, v6 or v7).",
-            )),
-        }
+        uuid_timestamp(&self.uuid).ok_or_else(|| {
+            PyErr::new::<PyValueError, &str>("UUID version should be one of (v1, v6 or v7).")
+        })
     }
 
     #[getter]
@@ -265,19 +365,24 @@ impl UUID {
         }
     }
 
+    /// Parse a string, without the keyword handling of the constructor.
     #[staticmethod]
+    fn from_str(value: &str) -> PyResult<UUID> {
+        Self::from_hex(value)
+    }
+
+    #[staticmethod]
+    #[pyo3(signature = (bytes, /))]
     fn from_bytes(bytes: &Bound<'_, PyBytes>) -> PyResult<UUID> {
-        let bytes: Bytes = bytes.extract()?;
         Ok(UUID {
-            uuid: Uuid::from_bytes(bytes),
+            uuid: Uuid::from_bytes(borrow_bytes(bytes, "bytes")?),
         })
     }
 
     #[staticmethod]
     fn from_bytes_le(bytes: &Bound<'_, PyBytes>) -> PyResult<UUID> {
-        let bytes: Bytes = bytes.extract()?;
         Ok(UUID {
-            uuid: Uuid::from_bytes_le(bytes),
+            uuid: Uuid::from_bytes_le(borrow_bytes(bytes, "bytes_le")?),
         })
     }
 
@@ -312,49 +417,37 @@ impl UUID {
     }
 
     #[getter]
-    fn is_safe<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyAny>> {
-        slf.get_type().getattr("_safe_uuid_unknown")
+    fn is_safe<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        compat::safe_uuid_unknown(py)
     }
 }
 
 #[pyfunction]
-#[pyo3(signature = (node=None, clock_seq=None))]
-fn uuid1(node: Option<u64>, clock_seq: Option<u64>) -> PyResult<UUID> {
-    let node = match node {
-        Some(node) => node.to_be_bytes(),
-        None => _getnode().to_be_bytes(),
-    };
-    let node: &[u8; 6] = node[2..8].try_into().unwrap();
-    let uuid = match clock_seq {
-        Some(clock_seq) => {
-            let dur = SystemTime::now()
-                .duration_since(SystemTime::UNIX_EPOCH)
-                .unwrap();
-            let timestamp =
-                Timestamp::from_unix_time(dur.as_secs(), dur.subsec_nanos(), clock_seq as u128, 14);
-            Uuid::new_v1(timestamp, node)
-        }
-        None => Uuid::now_v1(node),
-    };
-    Ok(UUID { uuid })
+#[pyo3(signature = (node=None, clock_seq=None, *, timestamp=None))]
+fn uuid1(node: Option<u64>, clock_seq: Option<u64>, timestamp: Option<u64>) -> PyResult<UUID> {
+    let node = &node_bytes(node);
+    let (ticks, clock_seq) = gregorian_start(1, clock_seq, timestamp)?;
+    Ok(UUID {
+        uuid: Builder::from_gregorian_timestamp(ticks, clock_seq, node).into_uuid(),
+    })
 }
 
 #[pyfunction]
-fn uuid3(namespace: &UUID, name: StringOrBytes) -> PyResult<UUID> {
-    match name {
-        StringOrBytes::String(name) => Ok(UUID {
-            uuid: Uuid::new_v3(&namespace.uuid, name.as_bytes()),
-        }),
-        StringOrBytes::Bytes(name) => Ok(UUID {
-            uuid: Uuid::new_v3(&namespace.uuid, &name),
-        }),
-    }
+fn uuid3(namespace: &Bound<'_, PyAny>, name: &Bound<'_, PyAny>) -> PyResult<UUID> {
+    Ok(UUID {
+        uuid: Uuid::new_v3(
+            &hasher::namespace_uuid(namespace)?,
+            &hasher::name_bytes(name)?,
+        ),
+    })
 }
 
 #[pyfunction]
 #[pyo3(name = "_uuid4_int")]
 fn uuid4_int() -> u128 {
-    Uuid::new_v4().as_u128()
+    Builder::from_random_bytes(rng::random_bytes())
+        .into_uuid()
+        .as_u128()
 }
 
 #[pyfunction]
@@ -365,72 +458,137 @@ fn uuid4() -> PyResult<UUID> {
 }
 
 #[pyfunction]
-fn uuid5(namespace: &UUID, name: StringOrBytes) -> PyResult<UUID> {
-    match name {
-        StringOrBytes::String(name) => Ok(UUID {
-            uuid: Uuid::new_v5(&namespace.uuid, name.as_bytes()),
-        }),
-        StringOrBytes::Bytes(name) => Ok(UUID {
-            uuid: Uuid::new_v5(&namespace.uuid, &name),
-        }),
-    }
+fn uuid5(namespace: &Bound<'_, PyAny>, name: &Bound<'_, PyAny>) -> PyResult<UUID> {
+    Ok(UUID {
+        uuid: Uuid::new_v5(
+            &hasher::namespace_uuid(namespace)?,
+            &hasher::name_bytes(name)?,
+        ),
+    })
 }
 
 #[pyfunction]
-#[pyo3(signature = (node=None, clock_seq=None))]
-fn uuid6(node: Option<u64>, clock_seq: Option<u64>) -> PyResult<UUID> {
-    let node = match node {
-        Some(node) => node.to_be_bytes(),
-        None => _getnode().to_be_bytes(),
-    };
-    let node: &[u8; 6] = node[2..8].try_into().unwrap();
-
-    let uuid = match clock_seq {
-        Some(clock_seq) => {
-            let dur = SystemTime::now()
-                .duration_since(SystemTime::UNIX_EPOCH)
-                .unwrap();
-            let timestamp =
-                Timestamp::from_unix_time(dur.as_secs(), dur.subsec_nanos(), clock_seq as u128, 14);
-            Uuid::new_v6(timestamp, node)
-        }
-        None => Uuid::now_v6(node),
-    };
-    Ok(UUID { uuid })
+#[pyo3(signature = (node=None, clock_seq=None, *, timestamp=None))]
+fn uuid6(node: Option<u64>, clock_seq: Option<u64>, timestamp: Option<u64>) -> PyResult<UUID> {
+    let node = &node_bytes(node);
+    let (ticks, clock_seq) = gregorian_start(1, clock_seq, timestamp)?;
+    Ok(UUID {
+        uuid: Builder::from_sorted_gregorian_timestamp(ticks, clock_seq, node).into_uuid(),
+    })
 }
 
 #[pyfunction]
 #[pyo3(name = "_uuid7_int")]
-fn uuid7_int() -> u128 {
-    Uuid::now_v7().as_u128()
+fn uuid7_int() -> PyResult<u128> {
+    let uuid = generator::shared_v7().next_or_raise(unix_nanos_now(), rng::random_u128())?;
+    Ok(uuid.as_u128())
 }
 
 #[pyfunction]
-fn uuid7() -> UUID {
-    UUID {
-        uuid: Uuid::from_u128(uuid7_int()),
-    }
+#[pyo3(signature = (*, timestamp=None))]
+fn uuid7(timestamp: Option<u64>) -> PyResult<UUID> {
+    let uuid = match timestamp {
+        None => Uuid::from_u128(uuid7_int()?),
+        Some(_) => {
+            let millis = unix_nanos(timestamp)? / 1_000_000;
+            Builder::from_unix_timestamp_millis(millis, &rand::random()).into_uuid()
+        }
+    };
+    Ok(UUID { uuid })
 }
 
 #[pyfunction]
 #[pyo3(signature = (a=None, b=None, c=None))]
 fn uuid8(a: Option<u64>, b: Option<u64>, c: Option<u64>) -> UUID {
-    let a = (a.unwrap_or_else(rand::random) as u128) & 0xffff_ffff_ffff;
-    let b = (b.unwrap_or_else(rand::random) as u128) & 0xfff;
-    let c = (c.unwrap_or_else(rand::random) as u128) & 0x3fff_ffff_ffff_ffff;
+    let random = rng::random_u128();
+    let a = a.map_or(random >> 80, u128::from) & 0xffff_ffff_ffff;
+    let b = b.map_or(random >> 64, u128::from) & 0xfff;
+    let c = c.map_or(random, u128::from) & 0x3fff_ffff_ffff_ffff;
     let int = a << 80 | b << 64 | c;
     UUID {
         uuid: Uuid::new_v8(int.to_be_bytes()),
     }
 }
 
+fn node_bytes(node: Option<u64>) -> [u8; 6] {
+    let node = node.unwrap_or_else(_getnode).to_be_bytes();
+    node[2..8].try_into().unwrap()
+}
+
+fn unix_nanos_now() -> u64 {
+    SystemTime::now()
+        .duration_since(SystemTime::UNIX_EPOCH)
+        .unwrap()
+        .as_nanos() as u64
+}
+
+/// Nanoseconds since the Unix epoch for `timestamp` in milliseconds,
+/// or for the current time if it is not given.
+fn unix_nanos(timestamp: Option<u64>) -> PyResult<u64> {
+    match timestamp {
+        Some(millis) => millis
+            .checked_mul(1_000_000)
+            .ok_or_else(|| PyOverflowError::new_err("timestamp is too large")),
+        None => Ok(unix_nanos_now()),
+    }
+}
+
+fn gregorian_ticks(nanos: u64) -> u64 {
+    let (secs, nanos) = (nanos / 1_000_000_000, nanos % 1_000_000_000);
+    Timestamp::from_unix_time(secs, nanos as u32, 0, 0)
+        .to_gregorian()
+        .0
+}
+
+/// The last Gregorian timestamp handed out for v1 and v6 UUIDs of the current time.
+static LAST_TICKS: AtomicU64 = AtomicU64::new(0);
+
+/// The Gregorian timestamp of the first of `n` v1 or v6 UUIDs generated at
+/// `timestamp` (or now), with the given clock sequence or a random one.
+/// Batches take one tick per UUID, so ticks of the current time are
+/// reserved: the next call starts after them even if a batch ran ahead of
+/// the clock, and no two UUIDs with the same node and clock sequence collide.
+fn gregorian_start(
+    n: usize,
+    clock_seq: Option<u64>,
+    timestamp: Option<u64>,
+) -> PyResult<(u64, u16)> {
+    let ticks = gregorian_ticks(unix_nanos(timestamp)?);
+    let ticks = match timestamp {
+        Some(_) => ticks,
+        None => {
+            let n = n.max(1) as u64;
+            let last = LAST_TICKS
+                .fetch_update(Ordering::Relaxed, Ordering::Relaxed, |last| {
+                    Some(ticks.max(last + 1) + n - 1)
+                })
+                .unwrap();
+            ticks.max(last + 1)
+        }
+    };
+    let clock_seq = clock_seq.map_or_else(rand::random, |clock_seq| clock_seq as u16);
+    Ok((ticks, clock_seq))
+}
+
 fn _getnode() -> u64 {
     let cached = NODE.load(Ordering::Relaxed);
 
     if cached != 0 {
-        return cached;
+        return cached & !NODE_SET;
     }
 
+    // Unless `set_node()` was called while discovering, keep the first node
+    // found, so that concurrent callers all end up using the same one.
+    let node = discover_node();
+    match NODE.compare_exchange(0, node | NODE_SET, Ordering::Relaxed, Ordering::Relaxed) {
+        Ok(_) => node,
+        Err(current) => current & !NODE_SET,
+    }
+}
+
+/// Find the hardware address of a network interface, preferring universally
+/// administered ones, or make up a random multicast address if there are none.
+fn discover_node() -> u64 {
     fn _is_universal(mac: u64) -> bool {
         (mac & (1 << 41)) == 0
     }
@@ -450,7 +608,6 @@ fn _getnode() -> u64 {
                 }
 
                 if _is_universal(node) {
-                    NODE.store(node, Ordering::Relaxed);
                     return node;
                 } else if first_local_mac.is_none() {
                     first_local_mac = Some(node);
@@ -458,19 +615,15 @@ fn _getnode() -> u64 {
             }
         }
         if let Some(node) = first_local_mac {
-            NODE.store(node, Ordering::Relaxed);
             return node;
         }
     }
 
     let mut bytes = rand::random::<[u8; 6]>();
     bytes[0] |= 0x01;
-    let node = u64::from_be_bytes([
+    u64::from_be_bytes([
         0, 0, bytes[0], bytes[1], bytes[2], bytes[3], bytes[4], bytes[5],
-    ]);
-
-    NODE.store(node, Ordering::Relaxed);
-    node
+    ])
 }
 
 #[pyfunction]
@@ -478,8 +631,42 @@ fn getnode() -> PyResult<u64> {
     Ok(_getnode())
 }
 
+/// Use `node` whenever a node is not given, or with `None`, discover it
+/// again on next use.
+#[pyfunction]
+#[pyo3(signature = (node))]
+fn set_node(node: Option<u64>) -> PyResult<()> {
+    let value = match node {
+        Some(node) if node >= 1 << 48 => {
+            return Err(PyValueError::new_err("node must be a 48-bit integer"));
+        }
+        Some(node) => node | NODE_SET,
+        None => 0,
+    };
+    NODE.store(value, Ordering::Relaxed);
+    Ok(())
+}
+
+/// Discover the node now rather than on first use. With `background`, do it
+/// on a new thread and return `None` straight away.
+#[pyfunction]
+#[pyo3(signature = (*, background=false))]
+fn warm_node(py: Python<'_>, background: bool) -> Option<u64> {
+    if background {
+        let spawned = thread::Builder::new()
+            .name("uuid_utils-getnode".into())
+            .spawn(_getnode);
+        // Platforms without threads discover it on the calling thread instead.
+        if spawned.is_ok() {
+            return None;
+        }
+    }
+    Some(py.detach(_getnode))
+}
+
 #[pyfunction]
 fn reseed() -> PyResult<()> {
+    rng::bump_fork_epoch();
     rand::rng()
         .reseed()
         .map_err(|err| PyOSError::new_err(err.to_string()))
@@ -489,11 +676,6 @@ fn reseed() -> PyResult<()> {
 fn _uuid_utils(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
     m.add_class::<UUID>()?;
-    let safe_uuid_unknown = PyModule::import(m.py(), "uuid")?
-        .getattr("SafeUUID")?
-        .getattr("unknown")?;
-    m.getattr("UUID")?
-        .setattr("_safe_uuid_unknown", safe_uuid_unknown)?;
     m.add_function(wrap_pyfunction!(uuid1, m)?)?;
     m.add_function(wrap_pyfunction!(uuid3, m)?)?;
     m.add_function(wrap_pyfunction!(uuid4_int, m)?)?;
@@ -503,7 +685,21 @@ fn _uuid_utils(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(uuid7, m)?)?;
     m.add_function(wrap_pyfunction!(uuid7_int, m)?)?;
     m.add_function(wrap_pyfunction!(uuid8, m)?)?;
+    batch::register(m)?;
+    cached::register(m)?;
+    compat::register(m)?;
+    fields::register(m)?;
+    format::register(m)?;
+    generator::register(m)?;
+    hasher::register(m)?;
+    index::register(m)?;
+    parse::register(m)?;
+    rng::register(m)?;
+    scan::register(m)?;
+    uuidset::register(m)?;
     m.add_function(wrap_pyfunction!(getnode, m)?)?;
+    m.add_function(wrap_pyfunction!(set_node, m)?)?;
+    m.add_function(wrap_pyfunction!(warm_node, m)?)?;
     m.add_function(wrap_pyfunction!(reseed, m)?)?;
     m.add("NAMESPACE_DNS", UUID::NAMESPACE_DNS)?;
     m.add("NAMESPACE_URL", UUID::NAMESPACE_URL)?;
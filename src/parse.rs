@@ -0,0 +1,69 @@
+use crate::UUID;
+use pyo3::{
+    IntoPyObjectExt,
+    exceptions::{PyTypeError, PyValueError},
+    prelude::*,
+    types::{PyBytes, PyList, PyString},
+};
+use uuid::Uuid;
+
+/// Parse a single `str` or `bytes` item in any of the simple, hyphenated,
+/// braced or URN forms, returning `None` when it is badly formed.
+fn parse_item(item: &Bound<'_, PyAny>) -> PyResult<Option<Uuid>> {
+    if let Ok(value) = item.cast::<PyString>() {
+        return Ok(Uuid::parse_str(value.to_str()?).ok());
+    }
+    if let Ok(value) = item.cast::<PyBytes>() {
+        return Ok(Uuid::try_parse_ascii(value.as_bytes()).ok());
+    }
+    Err(PyTypeError::new_err(format!(
+        "expected str or bytes, got {}",
+        item.get_type().name()?
+    )))
+}
+
+#[pyfunction]
+#[pyo3(signature = (values, *, errors="raise"))]
+fn parse_many(py: Python<'_>, values: &Bound<'_, PyAny>, errors: &str) -> PyResult<Py<PyAny>> {
+    match errors {
+        "raise" => {
+            let mut uuids = Vec::new();
+            for (index, item) in values.try_iter()?.enumerate() {
+                match parse_item(&item?)? {
+                    Some(uuid) => uuids.push(UUID { uuid }),
+                    None => {
+                        return Err(PyValueError::new_err(format!(
+                            "badly formed hexadecimal UUID string at index {index}"
+                        )));
+                    }
+                }
+            }
+            PyList::new(py, uuids)?.into_py_any(py)
+        }
+        "none" => {
+            let mut uuids = Vec::new();
+            for item in values.try_iter()? {
+                uuids.push(parse_item(&item?)?.map(|uuid| UUID { uuid }));
+            }
+            PyList::new(py, uuids)?.into_py_any(py)
+        }
+        "mask" => {
+            let mut packed = Vec::new();
+            let mut mask = Vec::new();
+            for item in values.try_iter()? {
+                let uuid = parse_item(&item?)?;
+                packed.extend_from_slice(uuid.unwrap_or_default().as_bytes());
+                mask.push(uuid.is_some() as u8);
+            }
+            (PyBytes::new(py, &packed), PyBytes::new(py, &mask)).into_py_any(py)
+        }
+        _ => Err(PyValueError::new_err(
+            "errors must be one of 'raise', 'none' or 'mask'",
+        )),
+    }
+}
+
+pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(parse_many, m)?)?;
+    Ok(())
+}
@@ -0,0 +1,119 @@
+use pyo3::{exceptions::PyValueError, prelude::*};
+use std::{
+    cell::RefCell,
+    sync::atomic::{AtomicU64, AtomicUsize, Ordering},
+};
+
+const DEFAULT_POOL_SIZE: usize = 4096;
+const MAX_POOL_SIZE: usize = 1 << 20;
+
+/// Bumped by `reseed()`, so generators holding their own RNG state can tell
+/// that they are running in a forked child and should reseed too.
+static FORK_EPOCH: AtomicU64 = AtomicU64::new(0);
+
+pub(crate) fn fork_epoch() -> u64 {
+    FORK_EPOCH.load(Ordering::Relaxed)
+}
+
+pub(crate) fn bump_fork_epoch() {
+    FORK_EPOCH.fetch_add(1, Ordering::Relaxed);
+}
+
+static POOL_SIZE: AtomicUsize = AtomicUsize::new(DEFAULT_POOL_SIZE);
+
+/// Random bytes drawn from the thread-local CSPRNG in large blocks, so that
+/// single UUIDs do not pay for a separate RNG call each.
+struct Pool {
+    buf: Vec<u8>,
+    pos: usize,
+    epoch: u64,
+}
+
+thread_local! {
+    static POOL: RefCell<Pool> = const {
+        RefCell::new(Pool {
+            buf: Vec::new(),
+            pos: 0,
+            epoch: 0,
+        })
+    };
+}
+
+/// 16 random bytes from the current thread's entropy pool.
+pub(crate) fn random_bytes() -> [u8; 16] {
+    let size = POOL_SIZE.load(Ordering::Relaxed);
+    if size == 0 {
+        return rand::random();
+    }
+    POOL.with_borrow_mut(|pool| {
+        let epoch = fork_epoch();
+        // Refill when exhausted, resized, or inherited from the parent of a
+        // forked process, which would otherwise hand out the same bytes.
+        if pool.pos + 16 > pool.buf.len() || pool.buf.len() != size || pool.epoch != epoch {
+            pool.buf.resize(size, 0);
+            rand::fill(&mut pool.buf[..]);
+            pool.pos = 0;
+            pool.epoch = epoch;
+        }
+        let chunk = &mut pool.buf[pool.pos..pool.pos + 16];
+        let bytes = chunk.try_into().unwrap();
+        // Don't keep bytes that were already handed out.
+        chunk.fill(0);
+        pool.pos += 16;
+        bytes
+    })
+}
+
+pub(crate) fn random_u128() -> u128 {
+    u128::from_ne_bytes(random_bytes())
+}
+
+#[pyfunction]
+fn set_entropy_pool_size(size: usize) -> PyResult<()> {
+    if size % 16 != 0 || size > MAX_POOL_SIZE {
+        return Err(PyValueError::new_err(format!(
+            "entropy pool size must be a multiple of 16 between 0 and {MAX_POOL_SIZE}"
+        )));
+    }
+    POOL_SIZE.store(size, Ordering::Relaxed);
+    Ok(())
+}
+
+pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(set_entropy_pool_size, m)?)?;
+    Ok(())
+}
+
+/// wyrand, a small and fast non-cryptographic PRNG.
+///
+/// Its output is predictable from a few samples, so it must only be used
+/// where UUIDs do not need to be unguessable.
+pub(crate) struct WyRand(u64);
+
+impl WyRand {
+    pub(crate) const fn new(seed: u64) -> Self {
+        WyRand(seed)
+    }
+
+    pub(crate) fn next_u64(&mut self) -> u64 {
+        self.0 = self.0.wrapping_add(0xa076_1d64_78bd_642f);
+        let t = (self.0 as u128).wrapping_mul((self.0 ^ 0xe703_7ed1_a0b4_28db) as u128);
+        (t >> 64) as u64 ^ t as u64
+    }
+
+    pub(crate) fn next_u128(&mut self) -> u128 {
+        (self.next_u64() as u128) << 64 | self.next_u64() as u128
+    }
+
+    pub(crate) fn fill(&mut self, out: &mut [u8]) {
+        let mut chunks = out.chunks_exact_mut(8);
+        for chunk in &mut chunks {
+            chunk.copy_from_slice(&self.next_u64().to_le_bytes());
+        }
+        let rest = chunks.into_remainder();
+        if !rest.is_empty() {
+            let len = rest.len();
+            rest.copy_from_slice(&self.next_u64().to_le_bytes()[..len]);
+        }
+    }
+}
@@ -0,0 +1,200 @@
+use crate::UUID;
+use memchr::memchr_iter;
+use pyo3::{
+    IntoPyObjectExt,
+    buffer::PyBuffer,
+    exceptions::{PyTypeError, PyValueError},
+    prelude::*,
+    types::{PyBytes, PyString},
+};
+use std::collections::VecDeque;
+use uuid::{Uuid, fmt::Hyphenated};
+
+const LENGTH: usize = Hyphenated::LENGTH;
+
+/// Find hyphenated UUIDs starting in `data[lo..hi]` that are not part of a
+/// longer run of hex digits, calling `f` with the position of each one.
+///
+/// Matches may extend past `hi`. Unless `data` ends at the end of the input,
+/// it must hold the byte following any UUID that could start before `hi`.
+fn find_uuids(data: &[u8], lo: usize, hi: usize, mut f: impl FnMut(usize, Uuid)) {
+    // Every UUID has a hyphen 8 bytes in, so only look where one is.
+    let end = (hi + 8).min(data.len());
+    if lo + 8 >= end {
+        return;
+    }
+    let mut next = lo;
+    for offset in memchr_iter(b'-', &data[lo + 8..end]) {
+        let start = lo + offset;
+        if start < next {
+            continue;
+        }
+        let Some(candidate) = data.get(start..start + LENGTH) else {
+            break;
+        };
+        if start > 0 && data[start - 1].is_ascii_hexdigit()
+            || data.get(start + LENGTH).is_some_and(u8::is_ascii_hexdigit)
+            || candidate[13] != b'-'
+            || candidate[18] != b'-'
+            || candidate[23] != b'-'
+        {
+            continue;
+        }
+        if let Ok(uuid) = Uuid::try_parse_ascii(candidate) {
+            f(start, uuid);
+            next = start + LENGTH;
+        }
+    }
+}
+
+enum Source {
+    /// An object supporting the buffer protocol, scanned in place.
+    Buffer { buffer: PyBuffer<u8>, pos: usize },
+    /// A file-like object, read `chunk_size` bytes at a time. The end of
+    /// the previous chunk is kept in `buf` for UUIDs split between chunks.
+    Stream {
+        read: Py<PyAny>,
+        buf: Vec<u8>,
+        /// Offset of `buf[0]` in the stream.
+        base: usize,
+        /// Where the next scan starts in `buf`.
+        lo: usize,
+        eof: bool,
+    },
+}
+
+/// Iterator over the UUIDs found by `scan()`.
+#[pyclass(module = "uuid_utils")]
+pub(crate) struct Scanner {
+    source: Source,
+    chunk_size: usize,
+    packed: bool,
+    pending: VecDeque<(usize, Uuid)>,
+}
+
+impl Scanner {
+    /// Scan chunks until at least one UUID is found.
+    /// Returns false once the input is exhausted.
+    fn fill(&mut self, py: Python<'_>) -> PyResult<bool> {
+        let pending = &mut self.pending;
+        match &mut self.source {
+            Source::Buffer { buffer, pos } => {
+                let len = buffer.len_bytes();
+                // SAFETY: the buffer is contiguous and `len_bytes` long,
+                // and `buffer` keeps the exporter alive.
+                let data =
+                    unsafe { std::slice::from_raw_parts(buffer.buf_ptr() as *const u8, len) };
+                while *pos < len && pending.is_empty() {
+                    let hi = (*pos + self.chunk_size).min(len);
+                    find_uuids(data, *pos, hi, |start, uuid| {
+                        pending.push_back((start, uuid))
+                    });
+                    *pos = hi;
+                }
+            }
+            Source::Stream {
+                read,
+                buf,
+                base,
+                lo,
+                eof,
+            } => {
+                while !*eof && pending.is_empty() {
+                    let chunk = read.bind(py).call1((self.chunk_size,))?;
+                    let before = buf.len();
+                    if let Ok(chunk) = chunk.cast::<PyBytes>() {
+                        buf.extend_from_slice(chunk.as_bytes());
+                    } else if let Ok(chunk) = chunk.cast::<PyString>() {
+                        buf.extend_from_slice(chunk.to_str()?.as_bytes());
+                    } else {
+                        let chunk = PyBuffer::<u8>::get(&chunk)?;
+                        buf.extend(chunk.to_vec(py)?);
+                    }
+                    *eof = buf.len() == before;
+
+                    // Until the end of the stream, hold back anything that
+                    // could be the start of a UUID continuing in the next chunk.
+                    let hi = if *eof {
+                        buf.len()
+                    } else {
+                        buf.len().saturating_sub(LENGTH)
+                    };
+                    if hi <= *lo {
+                        continue;
+                    }
+                    find_uuids(buf, *lo, hi, |start, uuid| {
+                        pending.push_back((*base + start, uuid))
+                    });
+                    // Keep one byte before `hi` to check the boundary.
+                    let keep = hi - 1;
+                    buf.drain(..keep);
+                    *base += keep;
+                    *lo = hi - keep;
+                }
+            }
+        }
+        Ok(!pending.is_empty())
+    }
+}
+
+#[pymethods]
+impl Scanner {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python<'_>) -> PyResult<Option<Py<PyAny>>> {
+        if self.pending.is_empty() && !self.fill(py)? {
+            return Ok(None);
+        }
+        if self.packed {
+            let pending = &mut self.pending;
+            let bytes = PyBytes::new_with(py, pending.len() * 16, |out| {
+                for (chunk, (_, uuid)) in out.chunks_exact_mut(16).zip(pending.drain(..)) {
+                    chunk.copy_from_slice(uuid.as_bytes());
+                }
+                Ok(())
+            })?;
+            return Ok(Some(bytes.into_any().unbind()));
+        }
+        let (offset, uuid) = self.pending.pop_front().unwrap();
+        Ok(Some((offset, UUID { uuid }).into_py_any(py)?))
+    }
+}
+
+#[pyfunction]
+#[pyo3(signature = (source, *, chunk_size=1 << 20, packed=false))]
+fn scan(source: &Bound<'_, PyAny>, chunk_size: usize, packed: bool) -> PyResult<Scanner> {
+    if chunk_size == 0 {
+        return Err(PyValueError::new_err("chunk_size must be at least 1"));
+    }
+    let source = if let Ok(buffer) = PyBuffer::<u8>::get(source) {
+        if !buffer.is_c_contiguous() {
+            return Err(PyValueError::new_err("buffer must be C-contiguous"));
+        }
+        Source::Buffer { buffer, pos: 0 }
+    } else if let Ok(read) = source.getattr("read") {
+        Source::Stream {
+            read: read.unbind(),
+            buf: Vec::new(),
+            base: 0,
+            lo: 0,
+            eof: false,
+        }
+    } else {
+        return Err(PyTypeError::new_err(
+            "source must be a bytes-like object or have a read() method",
+        ));
+    };
+    Ok(Scanner {
+        source,
+        chunk_size,
+        packed,
+        pending: VecDeque::new(),
+    })
+}
+
+pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(scan, m)?)?;
+    Ok(())
+}
@@ -0,0 +1,457 @@
+use crate::{UUID, buffer::read_packed};
+use pyo3::{
+    buffer::PyBuffer,
+    exceptions::{PyKeyError, PyRuntimeError, PyTypeError, PyValueError},
+    prelude::*,
+    types::{PyBytes, PyString, PyTuple},
+};
+use uuid::Uuid;
+
+/// Convert a `UUID`, a 16-byte big-endian `bytes` or a string in any of the
+/// forms accepted by `UUID()` to a `Uuid`. Returns `None` for other types.
+pub(crate) fn uuid_item(item: &Bound<'_, PyAny>) -> PyResult<Option<Uuid>> {
+    if let Ok(value) = item.cast::<UUID>() {
+        return Ok(Some(value.borrow().uuid));
+    }
+    let parsed = if let Ok(value) = item.cast::<PyString>() {
+        Uuid::parse_str(value.to_str()?)
+    } else if let Ok(value) = item.cast::<PyBytes>() {
+        match value.as_bytes().try_into() {
+            Ok(bytes) => return Ok(Some(Uuid::from_bytes(bytes))),
+            Err(_) => Uuid::try_parse_ascii(value.as_bytes()),
+        }
+    } else {
+        return Ok(None);
+    };
+    parsed
+        .map(Some)
+        .map_err(|_| PyValueError::new_err("badly formed hexadecimal UUID string"))
+}
+
+pub(crate) fn require_uuid(item: &Bound<'_, PyAny>) -> PyResult<Uuid> {
+    uuid_item(item)?.ok_or_else(|| {
+        PyTypeError::new_err(format!(
+            "expected UUID, str or bytes, got {}",
+            item.get_type()
+                .name()
+                .map(|name| name.to_string())
+                .unwrap_or_default()
+        ))
+    })
+}
+
+/// Call `f` with every UUID in `other`, which is a `UUIDSet`, a packed
+/// buffer of big-endian UUIDs or an iterable of items accepted by `uuid_item`.
+/// The UUIDs in `other`, read up front so that no borrow of a set is held
+/// while iterating `other` runs Python code, which may use the set. Also
+/// returns the error that stopped the read, if any.
+fn read_uuids(other: &Bound<'_, PyAny>) -> (Vec<u128>, PyResult<()>) {
+    let mut values = Vec::new();
+    let result = for_each_uuid(other, |value| values.push(value));
+    (values, result)
+}
+
+pub(crate) fn for_each_uuid(other: &Bound<'_, PyAny>, mut f: impl FnMut(u128)) -> PyResult<()> {
+    if let Ok(set) = other.cast::<UUIDSet>() {
+        set.borrow().table.iter().for_each(f);
+        return Ok(());
+    }
+    if PyBuffer::<u8>::get(other).is_ok() {
+        return read_packed(other, |data| {
+            for chunk in data.chunks_exact(16) {
+                f(u128::from_be_bytes(chunk.try_into().unwrap()));
+            }
+        });
+    }
+    for item in other.try_iter()? {
+        f(require_uuid(&item?)?.as_u128());
+    }
+    Ok(())
+}
+
+/// Spread the 128 bits of a UUID over a 64-bit hash. Fibonacci hashing
+/// then takes the top bits, so time-ordered UUIDs still spread out.
+#[inline]
+fn hash(value: u128) -> u64 {
+    ((value >> 64) as u64 ^ value as u64).wrapping_mul(0x9e37_79b9_7f4a_7c15)
+}
+
+const MIN_CAPACITY: usize = 8;
+
+/// A set of 128-bit values in a flat open-addressing table with linear
+/// probing. Zero marks an empty slot, so the nil UUID is tracked separately.
+#[derive(Clone, Default)]
+pub(crate) struct Table {
+    slots: Vec<u128>,
+    /// Number of non-zero values in `slots`.
+    len: usize,
+    has_zero: bool,
+}
+
+impl Table {
+    pub(crate) fn len(&self) -> usize {
+        self.len + self.has_zero as usize
+    }
+
+    #[inline]
+    fn home(&self, value: u128) -> usize {
+        // `slots.len()` is a power of two of at least `MIN_CAPACITY`.
+        (hash(value) >> (64 - self.slots.len().trailing_zeros())) as usize
+    }
+
+    /// The slot holding `value`, or the empty slot where it would go.
+    #[inline]
+    fn find(&self, value: u128) -> Result<usize, usize> {
+        let mask = self.slots.len() - 1;
+        let mut index = self.home(value);
+        loop {
+            match self.slots[index] {
+                0 => return Err(index),
+                slot if slot == value => return Ok(index),
+                _ => index = (index + 1) & mask,
+            }
+        }
+    }
+
+    pub(crate) fn contains(&self, value: u128) -> bool {
+        if value == 0 {
+            self.has_zero
+        } else {
+            !self.slots.is_empty() && self.find(value).is_ok()
+        }
+    }
+
+    /// Whether `additional` more values fit while keeping the load under 3/4.
+    #[inline]
+    fn fits(&self, additional: usize) -> bool {
+        (self.len + additional) * 4 < self.slots.len() * 3
+    }
+
+    /// Make room for `additional` more values, keeping the load under 3/4.
+    pub(crate) fn reserve(&mut self, additional: usize) {
+        if self.fits(additional) {
+            return;
+        }
+        let needed = self.len + additional;
+        let capacity = (needed * 4 / 3 + 1).next_power_of_two().max(MIN_CAPACITY);
+        let old = std::mem::replace(&mut self.slots, vec![0; capacity]);
+        for value in old.into_iter().filter(|&value| value != 0) {
+            let Err(index) = self.find(value) else {
+                unreachable!()
+            };
+            self.slots[index] = value;
+        }
+    }
+
+    /// Add `value`, returning false if it was already present.
+    pub(crate) fn insert(&mut self, value: u128) -> bool {
+        if value == 0 {
+            return !std::mem::replace(&mut self.has_zero, true);
+        }
+        // Look the value up before growing, so that adding a value that is
+        // already present never moves the others to different slots.
+        let index = if self.slots.is_empty() {
+            None
+        } else {
+            match self.find(value) {
+                Ok(_) => return false,
+                Err(index) => self.fits(1).then_some(index),
+            }
+        };
+        let index = index.unwrap_or_else(|| {
+            self.reserve(1);
+            let Err(index) = self.find(value) else {
+                unreachable!()
+            };
+            index
+        });
+        self.slots[index] = value;
+        self.len += 1;
+        true
+    }
+
+    /// Remove `value`, returning false if it was not present.
+    pub(crate) fn remove(&mut self, value: u128) -> bool {
+        if value == 0 {
+            return std::mem::replace(&mut self.has_zero, false);
+        }
+        if self.slots.is_empty() {
+            return false;
+        }
+        let Ok(mut hole) = self.find(value) else {
+            return false;
+        };
+        // Shift later entries of the probe run back into the hole, so that
+        // lookups never need tombstones.
+        let mask = self.slots.len() - 1;
+        let mut index = hole;
+        loop {
+            index = (index + 1) & mask;
+            let value = self.slots[index];
+            if value == 0 {
+                break;
+            }
+            let home = self.home(value);
+            if (index.wrapping_sub(home) & mask) >= (index.wrapping_sub(hole) & mask) {
+                self.slots[hole] = value;
+                hole = index;
+            }
+        }
+        self.slots[hole] = 0;
+        self.len -= 1;
+        true
+    }
+
+    pub(crate) fn clear(&mut self) {
+        *self = Self::default();
+    }
+
+    /// The first value stored at or after `position`, where position 0 is
+    /// the nil UUID and `i + 1` is slot `i`, with the position following it.
+    pub(crate) fn next_from(&self, position: usize) -> Option<(u128, usize)> {
+        if position == 0 && self.has_zero {
+            return Some((0, 1));
+        }
+        let start = position.max(1) - 1;
+        self.slots[start.min(self.slots.len())..]
+            .iter()
+            .position(|&value| value != 0)
+            .map(|offset| (self.slots[start + offset], start + offset + 2))
+    }
+
+    pub(crate) fn iter(&self) -> impl Iterator<Item = u128> + '_ {
+        self.has_zero
+            .then_some(0)
+            .into_iter()
+            .chain(self.slots.iter().copied().filter(|&value| value != 0))
+    }
+}
+
+/// A set of UUIDs stored as 128-bit integers in a flat hash table.
+#[pyclass(module = "uuid_utils")]
+#[derive(Default)]
+pub(crate) struct UUIDSet {
+    table: Table,
+    /// Bumped whenever the table changes, to detect mutation while iterating.
+    generation: u64,
+}
+
+impl UUIDSet {
+    fn from_table(table: Table) -> Self {
+        Self {
+            table,
+            generation: 0,
+        }
+    }
+
+    fn changed(&mut self, changed: bool) {
+        self.generation += changed as u64;
+    }
+}
+
+#[pymethods]
+impl UUIDSet {
+    #[new]
+    #[pyo3(signature = (values=None))]
+    fn new(values: Option<&Bound<'_, PyAny>>) -> PyResult<Self> {
+        let mut table = Table::default();
+        if let Some(values) = values {
+            for_each_uuid(values, |value| {
+                table.insert(value);
+            })?;
+        }
+        Ok(Self::from_table(table))
+    }
+
+    fn __len__(&self) -> usize {
+        self.table.len()
+    }
+
+    fn __contains__(&self, item: &Bound<'_, PyAny>) -> bool {
+        match uuid_item(item) {
+            Ok(Some(uuid)) => self.table.contains(uuid.as_u128()),
+            _ => false,
+        }
+    }
+
+    fn __iter__(slf: Bound<'_, Self>) -> UUIDSetIterator {
+        let generation = slf.borrow().generation;
+        UUIDSetIterator {
+            set: slf.unbind(),
+            generation,
+            position: 0,
+        }
+    }
+
+    fn __repr__(&self) -> String {
+        format!("UUIDSet(<{} UUIDs>)", self.table.len())
+    }
+
+    fn add(&mut self, item: &Bound<'_, PyAny>) -> PyResult<()> {
+        let changed = self.table.insert(require_uuid(item)?.as_u128());
+        self.changed(changed);
+        Ok(())
+    }
+
+    fn discard(&mut self, item: &Bound<'_, PyAny>) -> PyResult<()> {
+        let changed = self.table.remove(require_uuid(item)?.as_u128());
+        self.changed(changed);
+        Ok(())
+    }
+
+    fn remove(&mut self, item: &Bound<'_, PyAny>) -> PyResult<()> {
+        if !self.table.remove(require_uuid(item)?.as_u128()) {
+            return Err(PyKeyError::new_err(item.clone().unbind()));
+        }
+        self.changed(true);
+        Ok(())
+    }
+
+    fn clear(&mut self) {
+        let changed = self.table.len() > 0;
+        self.table.clear();
+        self.changed(changed);
+    }
+
+    fn copy(&self) -> Self {
+        Self::from_table(self.table.clone())
+    }
+
+    #[pyo3(signature = (*others))]
+    fn update(slf: &Bound<'_, Self>, others: &Bound<'_, PyTuple>) -> PyResult<()> {
+        for other in others {
+            if other.as_ptr() == slf.as_ptr() {
+                continue;
+            }
+            let (values, result) = read_uuids(&other);
+            let mut this = slf.borrow_mut();
+            let mut changed = false;
+            for value in values {
+                changed |= this.table.insert(value);
+            }
+            // Values added before an error are kept, as with `set.update()`.
+            this.changed(changed);
+            result?;
+        }
+        Ok(())
+    }
+
+    fn difference(&self, other: &Bound<'_, PyAny>) -> PyResult<Self> {
+        let mut table = self.table.clone();
+        for_each_uuid(other, |value| {
+            table.remove(value);
+        })?;
+        Ok(Self::from_table(table))
+    }
+
+    fn difference_update(slf: &Bound<'_, Self>, other: &Bound<'_, PyAny>) -> PyResult<()> {
+        if other.as_ptr() == slf.as_ptr() {
+            slf.borrow_mut().clear();
+            return Ok(());
+        }
+        let (values, result) = read_uuids(other);
+        let mut this = slf.borrow_mut();
+        let mut changed = false;
+        for value in values {
+            changed |= this.table.remove(value);
+        }
+        this.changed(changed);
+        result
+    }
+
+    fn intersection(&self, other: &Bound<'_, PyAny>) -> PyResult<Self> {
+        let mut table = Table::default();
+        if let Ok(other) = other.cast::<UUIDSet>() {
+            let other = &other.borrow().table;
+            let (small, large) = if self.table.len() <= other.len() {
+                (&self.table, other)
+            } else {
+                (other, &self.table)
+            };
+            for value in small.iter().filter(|&value| large.contains(value)) {
+                table.insert(value);
+            }
+        } else {
+            for_each_uuid(other, |value| {
+                if self.table.contains(value) {
+                    table.insert(value);
+                }
+            })?;
+        }
+        Ok(Self::from_table(table))
+    }
+
+    fn intersection_update(slf: &Bound<'_, Self>, other: &Bound<'_, PyAny>) -> PyResult<()> {
+        if other.as_ptr() == slf.as_ptr() {
+            return Ok(());
+        }
+        let table = match other.cast::<UUIDSet>() {
+            Ok(_) => slf.borrow().intersection(other)?.table,
+            Err(_) => {
+                let (values, result) = read_uuids(other);
+                result?;
+                let this = slf.borrow();
+                let mut table = Table::default();
+                for value in values
+                    .into_iter()
+                    .filter(|&value| this.table.contains(value))
+                {
+                    table.insert(value);
+                }
+                table
+            }
+        };
+        let mut this = slf.borrow_mut();
+        // Otherwise it holds the same UUIDs, and keeping the table as it is
+        // keeps any iterators over it valid.
+        if table.len() != this.table.len() {
+            this.table = table;
+            this.changed(true);
+        }
+        Ok(())
+    }
+
+    /// The UUIDs packed as 16-byte big-endian values, in iteration order.
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        PyBytes::new_with(py, self.table.len() * 16, |out| {
+            for (chunk, value) in out.chunks_exact_mut(16).zip(self.table.iter()) {
+                chunk.copy_from_slice(&value.to_be_bytes());
+            }
+            Ok(())
+        })
+    }
+}
+
+/// Iterator over the UUIDs in a `UUIDSet`.
+#[pyclass(module = "uuid_utils")]
+pub(crate) struct UUIDSetIterator {
+    set: Py<UUIDSet>,
+    generation: u64,
+    position: usize,
+}
+
+#[pymethods]
+impl UUIDSetIterator {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python<'_>) -> PyResult<Option<UUID>> {
+        let changed = || PyRuntimeError::new_err("UUIDSet changed size during iteration");
+        let set = self.set.try_borrow(py).map_err(|_| changed())?;
+        if set.generation != self.generation {
+            return Err(changed());
+        }
+        Ok(set.table.next_from(self.position).map(|(value, next)| {
+            self.position = next;
+            UUID {
+                uuid: Uuid::from_u128(value),
+            }
+        }))
+    }
+}
+
+pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<UUIDSet>()?;
+    Ok(())
+}
@@ -0,0 +1,59 @@
+import uuid
+
+import pytest
+import uuid_utils
+
+np = pytest.importorskip("numpy")
+uuid_array = pytest.importorskip("uuid_utils.array")
+
+
+@pytest.mark.parametrize("version", [1, 4, 6, 7, 8])
+def test_generate(version: int) -> None:
+    array = getattr(uuid_array, f"uuid{version}")(100)
+    assert array.shape == (100, 16)
+    assert array.dtype == np.uint8
+    assert (uuid_array.version(array) == version).all()
+    assert len({row.tobytes() for row in array}) == 100
+
+
+def test_uuid7_is_sorted() -> None:
+    void = uuid_array.as_void(uuid_array.uuid7(1000))
+    assert void.shape == (1000,)
+    assert (np.sort(void) == void).all()
+
+
+def test_fields_match_uuid() -> None:
+    values = [
+        "a8098c1a-f86e-11da-bd1a-00112444be1e",  # v1
+        "1ec9414c-232a-6b00-b3c8-9e6bdeced846",  # v6
+        "017f22e2-79b0-7cc3-98c4-dc0c0c07398f",  # v7
+    ]
+    uuids = [uuid_utils.UUID(value) for value in values]
+    array = np.frombuffer(b"".join(u.bytes for u in uuids), dtype=np.uint8)
+
+    assert uuid_array.version(array).tolist() == [u.version for u in uuids]
+    assert uuid_array.time(array).tolist() == [u.time for u in uuids]
+    assert uuid_array.timestamp(array).tolist() == [u.timestamp for u in uuids]
+    assert uuid_array.to_hex(array).tolist() == [u.hex.encode() for u in uuids]
+    assert uuid_array.to_strings(array).tolist() == [value.encode() for value in values]
+    assert uuid_array.to_uuids(array) == uuids
+
+
+def test_timestamp_invalid_version() -> None:
+    with pytest.raises(ValueError):
+        uuid_array.timestamp(uuid_array.uuid4(1))
+
+
+def test_invalid_array() -> None:
+    with pytest.raises(ValueError):
+        uuid_array.version(np.zeros(17, dtype=np.uint8))
+
+
+def test_arrow_round_trip() -> None:
+    pa = pytest.importorskip("pyarrow")
+    array = uuid_array.uuid4(10)
+    column = uuid_array.to_arrow(array)
+    assert column.type == pa.binary(16)
+    assert column.to_pylist() == [uuid.UUID(bytes=row.tobytes()).bytes for row in array]
+    assert (uuid_array.from_arrow(column) == array).all()
+    assert (uuid_array.from_arrow(column.slice(2, 3)) == array[2:5]).all()
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 import uuid_utils
 import uuid_utils.compat as uuid_compat
@@ -5,11 +8,24 @@ import uuid_utils.compat as uuid_compat
 pytest.importorskip("pytest_codspeed")
 
 
+def test_import(benchmark) -> None:  # type: ignore[no-untyped-def]
+    command = [sys.executable, "-c", "import uuid_utils"]
+    benchmark(lambda: subprocess.run(command, check=True))
+
+
 @pytest.mark.benchmark
 def test_getnode() -> None:
     uuid_utils.getnode()
 
 
+def test_warm_node(benchmark) -> None:  # type: ignore[no-untyped-def]
+    def discover() -> None:
+        uuid_utils.set_node(None)
+        uuid_utils.warm_node()
+
+    benchmark(discover)
+
+
 @pytest.mark.benchmark
 def test_uuid1_() -> None:
     uuid_utils.uuid1()
@@ -30,6 +46,25 @@ def test_uuid5() -> None:
     uuid_utils.uuid5(namespace=uuid_utils.NAMESPACE_DNS, name="python.org")
 
 
+def test_name_hasher(benchmark) -> None:  # type: ignore[no-untyped-def]
+    hasher = uuid_utils.NameHasher(uuid_utils.NAMESPACE_DNS)
+    benchmark(lambda: hasher("python.org"))
+
+
+@pytest.mark.parametrize("threads", [1, None])
+def test_uuid5_many(benchmark, threads) -> None:  # type: ignore[no-untyped-def]
+    names = [f"user-{i}@python.org" for i in range(100_000)]
+    benchmark(
+        lambda: uuid_utils.uuid5_bytes(uuid_utils.NAMESPACE_DNS, names, threads=threads)
+    )
+
+
+def test_name_hasher_many(benchmark) -> None:  # type: ignore[no-untyped-def]
+    hasher = uuid_utils.NameHasher(uuid_utils.NAMESPACE_DNS)
+    names = [f"user-{i}@python.org" for i in range(1000)]
+    benchmark(lambda: hasher.many(names))
+
+
 @pytest.mark.benchmark
 def test_uuid6() -> None:
     uuid_utils.uuid6()
@@ -40,16 +75,146 @@ def test_uuid7() -> None:
     uuid_utils.uuid7()
 
 
+@pytest.mark.parametrize("v7_method", ["counter", "random", "precision"])
+def test_generator_uuid7(benchmark, v7_method) -> None:  # type: ignore[no-untyped-def]
+    generator = uuid_utils.Generator(v7_method=v7_method)
+    benchmark(lambda: generator.uuid7())
+
+
+@pytest.mark.parametrize("size", [0, 4096, 65536])
+def test_uuid4_entropy_pool(benchmark, size) -> None:  # type: ignore[no-untyped-def]
+    uuid_utils.set_entropy_pool_size(size)
+    try:
+        benchmark(lambda: uuid_utils.uuid4())
+    finally:
+        uuid_utils.set_entropy_pool_size(4096)
+
+
+@pytest.mark.parametrize("rng", ["secure", "fast"])
+def test_generator_uuid4(benchmark, rng) -> None:  # type: ignore[no-untyped-def]
+    generator = uuid_utils.Generator(rng=rng)
+    benchmark(lambda: generator.uuid4())
+
+
+@pytest.mark.parametrize("rng", ["secure", "fast"])
+def test_generator_uuid4_many(benchmark, rng) -> None:  # type: ignore[no-untyped-def]
+    generator = uuid_utils.Generator(rng=rng)
+    benchmark(lambda: generator.uuid4_many(1000))
+
+
+@pytest.mark.parametrize("v7_method", ["counter", "random", "precision"])
+def test_generator_uuid7_many(benchmark, v7_method) -> None:  # type: ignore[no-untyped-def]
+    generator = uuid_utils.Generator(v7_method=v7_method)
+    benchmark(lambda: generator.uuid7_many(1000))
+
+
 @pytest.mark.benchmark
 def test_uuid8() -> None:
     uuid_utils.uuid8(0x123456789ABC, 0xDEF, 0x3FFFFFFFFFFFFFFF)
 
 
+@pytest.mark.benchmark
+def test_uuid4_many() -> None:
+    uuid_utils.uuid4_many(1000)
+
+
+@pytest.mark.benchmark
+def test_uuid7_many() -> None:
+    uuid_utils.uuid7_many(1000)
+
+
+@pytest.mark.benchmark
+def test_uuid4_bytes() -> None:
+    uuid_utils.uuid4_bytes(1000)
+
+
+@pytest.mark.benchmark
+def test_uuid7_bytes() -> None:
+    uuid_utils.uuid7_bytes(1000)
+
+
 @pytest.mark.benchmark
 def test_uuid_from_hex() -> None:
     uuid_utils.UUID("a8098c1a-f86e-11da-bd1a-00112444be1e")
 
 
+@pytest.mark.benchmark
+def test_uuid_from_str() -> None:
+    uuid_utils.UUID.from_str("a8098c1a-f86e-11da-bd1a-00112444be1e")
+
+
+def test_uuid_create_and_drop(benchmark) -> None:  # type: ignore[no-untyped-def]
+    values = ["a8098c1a-f86e-11da-bd1a-00112444be1e"] * 1000
+    benchmark(lambda: [uuid_utils.UUID(value) == uuid_utils.NIL for value in values])
+
+
+def test_uuid_write_to(benchmark) -> None:  # type: ignore[no-untyped-def]
+    uuids = uuid_utils.uuid4_many(1000)
+    buffer = bytearray(16 * len(uuids))
+
+    def pack() -> None:
+        offset = 0
+        for uuid in uuids:
+            offset = uuid.write_to(buffer, offset)
+
+    benchmark(pack)
+
+
+def test_parse_many(benchmark) -> None:  # type: ignore[no-untyped-def]
+    values = ["a8098c1a-f86e-11da-bd1a-00112444be1e"] * 1000
+    benchmark(lambda: uuid_utils.parse_many(values))
+
+
+def test_scan(benchmark) -> None:  # type: ignore[no-untyped-def]
+    line = b"GET /users/a8098c1a-f86e-11da-bd1a-00112444be1e 200 12ms\n"
+    log = line * 10_000
+    benchmark(lambda: list(uuid_utils.scan(log)))
+
+
+def test_uuid_set_contains(benchmark) -> None:  # type: ignore[no-untyped-def]
+    uuids = uuid_utils.uuid4_many(1000)
+    uuid_set = uuid_utils.UUIDSet(uuids)
+    benchmark(lambda: [u in uuid_set for u in uuids])
+
+
+def test_uuid_set_update(benchmark) -> None:  # type: ignore[no-untyped-def]
+    packed = uuid_utils.uuid7_bytes(100_000)
+    benchmark(lambda: uuid_utils.UUIDSet(packed))
+
+
+def test_sorted_uuid_index_range(benchmark) -> None:  # type: ignore[no-untyped-def]
+    index = uuid_utils.SortedUUIDIndex(uuid_utils.uuid7_bytes(100_000))
+    start = index[50_000].timestamp
+    benchmark(lambda: index.count(start, start + 1))
+
+
+def test_uuid_str_repeated(benchmark) -> None:  # type: ignore[no-untyped-def]
+    uuid = uuid_utils.uuid4()
+    benchmark(lambda: [str(uuid) for _ in range(10)])
+
+
+def test_cached_uuid_str_repeated(benchmark) -> None:  # type: ignore[no-untyped-def]
+    uuid = uuid_utils.CachedUUID(int=uuid_utils.uuid4().int)
+    benchmark(lambda: [str(uuid) for _ in range(10)])
+
+
+def test_uuid_set_build(benchmark) -> None:  # type: ignore[no-untyped-def]
+    uuids = uuid_utils.uuid4_many(10_000)
+    benchmark(lambda: set(uuids))
+
+
+def test_uuid_dict_lookup_stdlib(benchmark) -> None:  # type: ignore[no-untyped-def]
+    uuids = uuid_utils.uuid4_many(10_000)
+    keys = dict.fromkeys(uuids)
+    stdlib = [uuid_compat.UUID(int=u.int) for u in uuids]
+    benchmark(lambda: [keys[u] for u in stdlib])
+
+
+def test_format_many(benchmark) -> None:  # type: ignore[no-untyped-def]
+    packed = uuid_utils.uuid4_bytes(1000)
+    benchmark(lambda: uuid_utils.format_many(packed))
+
+
 def test_uuid_from_bytes(benchmark) -> None:  # type: ignore[no-untyped-def]
     hex_bytes = bytes.fromhex("a8098c1af86e11dabd1a00112444be1e")
     benchmark(lambda: uuid_utils.UUID(bytes=hex_bytes))
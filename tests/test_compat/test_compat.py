@@ -1,5 +1,8 @@
+import pickle
 import uuid
 
+import pytest
+import uuid_utils
 from uuid_utils.compat import (
     MAX,
     NAMESPACE_DNS,
@@ -7,18 +10,26 @@ from uuid_utils.compat import (
     NAMESPACE_URL,
     NAMESPACE_X500,
     NIL,
+    namespace_cache_info,
     uuid1,
+    uuid1_many,
     uuid3,
     uuid4,
+    uuid4_many,
     uuid5,
+    uuid5_many,
     uuid6,
+    uuid6_many,
     uuid7,
+    uuid7_many,
     uuid8,
+    uuid8_many,
 )
 
 
 def assert_stdlib_uuid(value: uuid.UUID, version: int) -> None:
     assert type(value) is uuid.UUID
+    assert value.is_safe is uuid.SafeUUID.unknown
     assert value.version == version
     assert value.variant == uuid.RFC_4122
 
@@ -74,3 +85,72 @@ def test_uuid7() -> None:
 
 def test_uuid8() -> None:
     assert_stdlib_uuid(uuid8(0x123456789ABC, 0xDEF, 0x3FFFFFFFFFFFFFFF), 8)
+
+
+def test_uuid4_many() -> None:
+    uuids = uuid4_many(10)
+    assert len(set(uuids)) == 10
+    for value in uuids:
+        assert_stdlib_uuid(value, 4)
+
+
+def test_uuid5_many() -> None:
+    names = ["python.org", b"python.org", "example.com"]
+    uuids = uuid5_many(NAMESPACE_DNS, names)
+    assert uuids == [uuid.uuid5(uuid.NAMESPACE_DNS, name) for name in names]  # type: ignore[arg-type]
+    for value in uuids:
+        assert_stdlib_uuid(value, 5)
+
+
+def test_uuid7_many() -> None:
+    uuids = uuid7_many(10)
+    assert uuids == sorted(uuids)
+    for value in uuids:
+        assert_stdlib_uuid(value, 7)
+
+
+@pytest.mark.parametrize(
+    "many, version", [(uuid1_many, 1), (uuid6_many, 6), (uuid8_many, 8)]
+)
+def test_many(many, version) -> None:  # type: ignore[no-untyped-def]
+    uuids = many(10)
+    assert len(set(uuids)) == 10
+    for value in uuids:
+        assert_stdlib_uuid(value, version)
+
+
+def test_stdlib_uuid_behaves_like_stdlib() -> None:
+    result = uuid4()
+    expected = uuid.UUID(int=result.int)
+    assert result == expected
+    assert hash(result) == hash(expected)
+    assert str(result) == str(expected)
+    assert pickle.loads(pickle.dumps(result)) == expected
+
+    with pytest.raises(TypeError):
+        result.int = 0  # type: ignore[misc]
+
+
+def test_stdlib_namespace() -> None:
+    assert uuid_utils.uuid3(uuid.NAMESPACE_DNS, "python.org") == uuid_utils.uuid3(
+        uuid_utils.NAMESPACE_DNS, "python.org"
+    )
+    assert uuid_utils.uuid5(uuid.NAMESPACE_URL, "python.org") == uuid_utils.uuid5(
+        uuid_utils.NAMESPACE_URL, "python.org"
+    )
+
+    with pytest.raises(TypeError):
+        uuid5(None, "python.org")  # type: ignore[arg-type]
+
+
+def test_namespace_cache_info() -> None:
+    namespace = uuid.UUID(int=uuid.NAMESPACE_DNS.int)
+    before = namespace_cache_info()
+    expected = uuid.uuid5(namespace, "python.org")
+    for _ in range(3):
+        assert uuid5(namespace, "python.org") == expected
+
+    after = namespace_cache_info()
+    assert after.misses == before.misses + 1
+    assert after.hits == before.hits + 2
+    assert after.maxsize > 0
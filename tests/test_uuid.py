@@ -1,8 +1,13 @@
 import copy
+import io
 import os
 import pickle
+import subprocess
 import sys
 import time
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID as StdlibUUID
 from uuid import SafeUUID, getnode
 
 import pytest
@@ -31,6 +36,12 @@ def test_uuid_from_hex() -> None:
     with pytest.raises(ValueError):
         uuid_utils.UUID("0-0-0-0-0")
 
+    assert uuid_utils.UUID.from_str(str(uuid)) == uuid
+    assert uuid_utils.UUID.from_str(uuid.urn) == uuid
+
+    with pytest.raises(ValueError):
+        uuid_utils.UUID.from_str("0-0-0-0-0")
+
 
 def test_uuid_from_bytes() -> None:
     uuid = uuid_utils.UUID(
@@ -41,6 +52,15 @@ def test_uuid_from_bytes() -> None:
     with pytest.raises(ValueError):
         uuid_utils.UUID(bytes=b"\xa8\t\x8c\x1a\xf8n\x11")
 
+    assert uuid_utils.UUID.from_bytes(uuid.bytes) == uuid
+    assert uuid_utils.UUID(bytes_le=uuid.bytes_le) == uuid
+
+    with pytest.raises(ValueError, match="bytes is not a 16-char string"):
+        uuid_utils.UUID.from_bytes(bytes(17))
+
+    with pytest.raises(ValueError, match="bytes_le is not a 16-char string"):
+        uuid_utils.UUID(bytes_le=bytes(15))
+
 
 def test_uuid_from_bytes_le() -> None:
     uuid = uuid_utils.UUID(
@@ -71,6 +91,29 @@ def test_uuid_setattr() -> None:
         uuid.int = 123  # type: ignore[misc]  # ty: ignore[invalid-assignment]
 
 
+@pytest.mark.parametrize("value", [0, 1, (1 << 61) - 1, 1 << 61, (1 << 128) - 1])
+def test_uuid_hash_matches_stdlib(value: int) -> None:
+    assert hash(uuid_utils.UUID(int=value)) == hash(StdlibUUID(int=value))
+
+
+def test_uuid_compare_with_stdlib() -> None:
+    uuid = uuid_utils.uuid4()
+    stdlib = StdlibUUID(int=uuid.int)
+    assert uuid == stdlib
+    assert stdlib == uuid
+    assert uuid != StdlibUUID(int=uuid.int ^ 1)
+    assert uuid_utils.NIL < stdlib < uuid_utils.MAX
+    assert StdlibUUID(int=0) <= uuid <= StdlibUUID(int=(1 << 128) - 1)
+
+    assert {uuid: "native"}[stdlib] == "native"
+    assert {stdlib, uuid} == {uuid}
+
+    assert uuid != str(uuid)
+    assert uuid != uuid.int
+    with pytest.raises(TypeError):
+        uuid < str(uuid)  # type: ignore[operator]  # noqa: B015
+
+
 def test_uuid1() -> None:
     uuid = uuid_utils.uuid1()
     assert isinstance(uuid, uuid_utils.UUID)
@@ -101,6 +144,83 @@ def test_uuid5(name: str) -> None:
     assert isinstance(uuid, uuid_utils.UUID)
 
 
+@pytest.mark.parametrize("name", [bytearray(b"python.org"), memoryview(b"python.org")])
+def test_uuid_bytes_like_name(name: bytearray | memoryview) -> None:
+    namespace = uuid_utils.NAMESPACE_DNS
+    expected = uuid_utils.uuid5(namespace, b"python.org")
+
+    assert uuid_utils.uuid5(namespace, name) == expected  # type: ignore[arg-type]
+    md5 = uuid_utils.uuid3(namespace, b"python.org")
+    assert uuid_utils.uuid3(namespace, name) == md5  # type: ignore[arg-type]
+    assert uuid_utils.NameHasher(namespace)(name) == expected
+    assert uuid_utils.uuid5_many(namespace, [name, "python.org"]) == [expected] * 2
+
+    with pytest.raises(TypeError):
+        uuid_utils.uuid5(namespace, 1)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("version", [3, 5])
+def test_name_hasher(version: int) -> None:
+    generate = getattr(uuid_utils, f"uuid{version}")
+    hasher = uuid_utils.NameHasher(uuid_utils.NAMESPACE_URL, version=version)  # type: ignore[arg-type]
+    assert hasher.namespace == uuid_utils.NAMESPACE_URL
+    assert hasher.version == version
+    assert repr(hasher) == (
+        f"NameHasher(UUID('6ba7b811-9dad-11d1-80b4-00c04fd430c8'), version={version})"
+    )
+
+    names = ["python.org", b"python.org", "", "\u00e9t\u00e9", "x" * 1000]
+    expected = [generate(uuid_utils.NAMESPACE_URL, name) for name in names]
+    assert [hasher(name) for name in names] == expected
+    assert hasher.many(names) == expected
+    assert hasher.many(iter(names)) == expected
+    assert hasher.many([]) == []
+
+    with pytest.raises(TypeError):
+        hasher(123)  # type: ignore[arg-type]
+
+    with pytest.raises(TypeError):
+        hasher.many(["python.org", 123])  # type: ignore[list-item]
+
+
+@pytest.mark.parametrize("version", [3, 5])
+@pytest.mark.parametrize("threads", [None, 1, 3, 16])
+def test_uuid_many_names(version: int, threads: Any) -> None:
+    generate = getattr(uuid_utils, f"uuid{version}")
+    names: list[str | bytes] = [f"name-{i}" for i in range(10_000)]
+    names[123] = b"bytes-name"
+    expected = [generate(uuid_utils.NAMESPACE_OID, name) for name in names]
+
+    uuids = getattr(uuid_utils, f"uuid{version}_many")(
+        uuid_utils.NAMESPACE_OID, names, threads=threads
+    )
+    assert uuids == expected
+
+    packed = getattr(uuid_utils, f"uuid{version}_bytes")(
+        uuid_utils.NAMESPACE_OID, iter(names), threads=threads
+    )
+    assert packed == b"".join(u.bytes for u in expected)
+
+    hasher = uuid_utils.NameHasher(uuid_utils.NAMESPACE_OID, version=version)  # type: ignore[arg-type]
+    assert hasher.many(names, threads=threads) == expected
+
+
+def test_uuid_many_names_invalid() -> None:
+    assert uuid_utils.uuid5_many(uuid_utils.NAMESPACE_DNS, []) == []
+    assert uuid_utils.uuid5_bytes(uuid_utils.NAMESPACE_DNS, []) == b""
+
+    with pytest.raises(ValueError):
+        uuid_utils.uuid5_many(uuid_utils.NAMESPACE_DNS, ["a"], threads=0)
+
+    with pytest.raises(TypeError):
+        uuid_utils.uuid5_many(uuid_utils.NAMESPACE_DNS, ["a", None])  # type: ignore[list-item]
+
+
+def test_name_hasher_invalid_version() -> None:
+    with pytest.raises(ValueError):
+        uuid_utils.NameHasher(uuid_utils.NAMESPACE_DNS, version=4)  # type: ignore[arg-type]
+
+
 def test_uuid6() -> None:
     uuid = uuid_utils.uuid6()
     assert isinstance(uuid, uuid_utils.UUID)
@@ -121,6 +241,31 @@ def test_uuid7() -> None:
     assert uuid.version == 7
 
 
+@pytest.mark.parametrize("version", [1, 6, 7])
+def test_uuid_with_timestamp(version: int) -> None:
+    generate = getattr(uuid_utils, f"uuid{version}")
+    uuid = generate(timestamp=1_500_000_000_123)
+    assert uuid.version == version
+    assert uuid.timestamp == 1_500_000_000_123
+
+    with pytest.raises(OverflowError):
+        generate(timestamp=2**63)
+
+
+@pytest.mark.parametrize("version", [1, 6, 7])
+def test_uuid_many_with_timestamp(version: int) -> None:
+    generate = getattr(uuid_utils, f"uuid{version}_many")
+    uuids = generate(100, timestamp=1_500_000_000_123)
+    assert len(set(uuids)) == 100
+    assert all(u.timestamp == 1_500_000_000_123 for u in uuids)
+    if version != 1:
+        assert uuids == sorted(uuids)
+
+    packed = getattr(uuid_utils, f"uuid{version}_bytes")(10, timestamp=1_000)
+    for i in range(0, len(packed), 16):
+        assert uuid_utils.UUID(bytes=packed[i : i + 16]).timestamp == 1_000
+
+
 def test_uuid8() -> None:
     uuid = uuid_utils.uuid8()
     assert isinstance(uuid, uuid_utils.UUID)
@@ -136,6 +281,516 @@ def test_uuid8() -> None:
     assert uuid.version == 8
 
 
+SCAN_TEXT = (
+    b"start a8098c1a-f86e-11da-bd1a-00112444be1e, "
+    b"{6BA7B810-9DAD-11D1-80B4-00C04FD430C8}\n"
+    b"not-a-uuid 0a8098c1a-f86e-11da-bd1a-00112444be1e "
+    b"a8098c1a-f86e-11da-bd1a-00112444be1ef "
+    b"a8098c1a-f86e-11da-bd1a-00112444be1 "
+    b"urn:uuid:00000000-0000-0000-0000-000000000000"
+)
+SCAN_EXPECTED = [
+    (6, uuid_utils.UUID("a8098c1a-f86e-11da-bd1a-00112444be1e")),
+    (45, uuid_utils.NAMESPACE_DNS),
+    (215, uuid_utils.NIL),
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 36, 37, 100, 1 << 20])
+def test_scan(chunk_size: int) -> None:
+    assert list(uuid_utils.scan(SCAN_TEXT, chunk_size=chunk_size)) == SCAN_EXPECTED
+    assert list(uuid_utils.scan(memoryview(SCAN_TEXT))) == SCAN_EXPECTED
+    assert (
+        list(uuid_utils.scan(io.BytesIO(SCAN_TEXT), chunk_size=chunk_size))
+        == SCAN_EXPECTED
+    )
+    text = io.StringIO(SCAN_TEXT.decode())
+    assert list(uuid_utils.scan(text, chunk_size=chunk_size)) == SCAN_EXPECTED
+
+    packed = b"".join(uuid_utils.scan(io.BytesIO(SCAN_TEXT), packed=True))
+    assert packed == b"".join(u.bytes for _, u in SCAN_EXPECTED)
+
+
+def test_scan_mmap(tmp_path: Any) -> None:
+    import mmap
+
+    path = tmp_path / "log.txt"
+    path.write_bytes(SCAN_TEXT * 1000)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        uuids = list(uuid_utils.scan(m, chunk_size=4096))
+    assert len(uuids) == 3000
+    assert uuids[3] == (len(SCAN_TEXT) + 6, SCAN_EXPECTED[0][1])
+
+
+def test_scan_invalid() -> None:
+    assert list(uuid_utils.scan(b"")) == []
+
+    with pytest.raises(TypeError):
+        uuid_utils.scan(123)  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError):
+        uuid_utils.scan(b"", chunk_size=0)
+
+
+def test_uuid_set() -> None:
+    uuids = uuid_utils.uuid4_many(1000) + [uuid_utils.NIL]
+    uuid_set = uuid_utils.UUIDSet(uuids)
+
+    assert len(uuid_set) == 1001
+    assert set(uuid_set) == set(uuids)
+    assert uuids[0] in uuid_set
+    assert str(uuids[1]) in uuid_set
+    assert uuids[2].hex in uuid_set
+    assert uuids[3].bytes in uuid_set
+    assert uuid_utils.NIL in uuid_set
+    assert uuid_utils.uuid4() not in uuid_set
+    assert "not a uuid" not in uuid_set
+    assert 123 not in uuid_set
+
+    uuid_set.add(uuids[0])
+    assert len(uuid_set) == 1001
+    uuid_set.discard(uuid_utils.NIL)
+    uuid_set.remove(str(uuids[0]))
+    assert uuids[0] not in uuid_set
+    assert uuid_utils.NIL not in uuid_set
+    assert len(uuid_set) == 999
+    assert set(uuid_set) == set(uuids[1:-1])
+
+    with pytest.raises(KeyError):
+        uuid_set.remove(uuids[0])
+
+    with pytest.raises(ValueError):
+        uuid_set.add("not a uuid")
+
+    with pytest.raises(TypeError):
+        uuid_set.add(123)  # type: ignore[arg-type]
+
+    uuid_set.clear()
+    assert len(uuid_set) == 0
+    assert list(uuid_set) == []
+
+
+def test_uuid_set_bulk() -> None:
+    packed = uuid_utils.uuid7_bytes(2000)
+    uuids = [uuid_utils.UUID(bytes=packed[i : i + 16]) for i in range(0, 32000, 16)]
+    uuid_set = uuid_utils.UUIDSet(packed[: 16 * 1000])
+
+    uuid_set.update(uuids[1000:1500], packed[16 * 1500 :])
+    assert set(uuid_set) == set(uuids)
+    assert sorted(uuid_utils.UUIDSet(uuid_set.to_bytes())) == uuids
+
+    other = uuid_utils.UUIDSet(uuids[500:])
+    assert set(uuid_set.difference(packed[16 * 500 :])) == set(uuids[:500])
+    assert set(uuid_set.difference(other)) == set(uuids[:500])
+    assert set(uuid_set.intersection(packed[: 16 * 500])) == set(uuids[:500])
+    assert set(uuid_set.intersection(other)) == set(uuids[500:])
+    assert set(uuid_set.intersection(uuid_set)) == set(uuids)
+
+    uuid_set.difference_update(uuids[:100])
+    uuid_set.intersection_update(packed[: 16 * 200])
+    assert set(uuid_set) == set(uuids[100:200])
+    uuid_set.difference_update(uuid_set)
+    assert len(uuid_set) == 0
+
+    with pytest.raises(ValueError):
+        uuid_utils.UUIDSet(bytes(17))
+
+
+def test_uuid_set_changed_during_iteration() -> None:
+    uuid_set = uuid_utils.UUIDSet(uuid_utils.uuid4_many(10))
+    with pytest.raises(RuntimeError):
+        for uuid in uuid_set:
+            uuid_set.discard(uuid)
+
+
+def test_uuid_set_update_from_own_iterator() -> None:
+    uuids = uuid_utils.uuid4_many(10)
+    uuid_set = uuid_utils.UUIDSet(uuids)
+    uuid_set.difference_update(u for u in uuid_set if u in uuids[:5])
+    assert sorted(uuid_set) == sorted(uuids[5:])
+    uuid_set.update(str(u) for u in uuid_set)
+    assert len(uuid_set) == 5
+    uuid_set.intersection_update(u for u in uuid_set if u != uuids[5])
+    assert sorted(uuid_set) == sorted(uuids[6:])
+
+
+def test_uuid_set_add_existing_during_iteration() -> None:
+    # Every size up to a few resizes, so one of them is at the load limit.
+    for n in range(1, 100):
+        uuids = uuid_utils.uuid4_many(n)
+        uuid_set = uuid_utils.UUIDSet(uuids)
+        seen = []
+        for uuid in uuid_set:
+            uuid_set.add(uuids[0])
+            seen.append(uuid)
+        assert sorted(seen) == sorted(uuids)
+
+
+@pytest.mark.parametrize("version", [6, 7])
+def test_sorted_uuid_index(version: int) -> None:
+    timestamps = [1_700_000_000_000 + i * 10 for i in range(100)]
+    generate = uuid_utils.uuid6 if version == 6 else uuid_utils.uuid7
+    uuids = [generate(timestamp=ts) for ts in reversed(timestamps)]
+    index = uuid_utils.SortedUUIDIndex(uuids[:50], version=version)
+    index.update(b"".join(u.bytes for u in uuids[50:]), uuids[:10])
+
+    assert index.version == version
+    assert len(index) == 100
+    assert list(index) == sorted(uuids)
+    assert [u.timestamp for u in index] == timestamps
+    assert index[0] == min(uuids)
+    assert index[-1] == max(uuids)
+    assert uuids[0] in index
+    assert str(uuids[1]) in index
+    assert uuid_utils.uuid4() not in index
+
+    start, end = timestamps[10], timestamps[20]
+    expected = [u for u in sorted(uuids) if start <= u.timestamp < end]
+    assert len(expected) == 10
+    assert index.range(start, end) == expected
+    assert index.range(start + 1, end) == expected[1:]
+    assert index.range_bytes(start, end) == b"".join(u.bytes for u in expected)
+    assert index.count(start, end) == 10
+    assert index.count(end, start) == 0
+    assert index.count(start) == 90
+    assert index.count(end=start) == 10
+    assert index.count() == 100
+    assert index.to_bytes() == b"".join(u.bytes for u in sorted(uuids))
+
+    new = generate(timestamp=timestamps[-1] + 1)
+    index.add(new)
+    assert index[-1] == new
+
+    with pytest.raises(IndexError):
+        index[101]
+
+
+def test_sorted_uuid_index_invalid() -> None:
+    with pytest.raises(ValueError):
+        uuid_utils.SortedUUIDIndex(version=4)  # type: ignore[arg-type]
+
+    with pytest.raises(OverflowError):
+        uuid_utils.SortedUUIDIndex().range(2**48)
+
+    index = uuid_utils.SortedUUIDIndex([uuid_utils.uuid7()])
+    for other in (uuid_utils.uuid4(), uuid_utils.uuid1(), uuid_utils.uuid6()):
+        with pytest.raises(ValueError):
+            index.add(other)
+        with pytest.raises(ValueError):
+            index.update([uuid_utils.uuid7(), other])
+        with pytest.raises(ValueError):
+            uuid_utils.SortedUUIDIndex([other])
+    assert len(index) == 1
+
+    with pytest.raises(ValueError):
+        index.update(uuid_utils.SortedUUIDIndex(version=6))
+
+    # A bulk load that fails partway adds none of its UUIDs.
+    with pytest.raises(ValueError):
+        index.update([uuid_utils.uuid7(), "not a uuid"])
+    assert len(index) == 1
+
+    index.update(iter(index))
+    index.update(str(u) for u in index)
+    assert len(index) == 1
+
+
+@pytest.mark.parametrize("version", [6, 7])
+def test_uuid_bounds(version: int) -> None:
+    start, end = 1_700_000_000_000, 1_700_000_000_005
+    if version == 6:
+        bounds, generate = uuid_utils.uuid6_bounds, uuid_utils.uuid6
+    else:
+        bounds, generate = uuid_utils.uuid7_bounds, uuid_utils.uuid7
+    lo, hi = bounds(start, end)
+
+    assert lo.version == hi.version == version
+    assert lo.variant == hi.variant == uuid_utils.RFC_4122
+    assert lo.timestamp == start
+    assert hi.timestamp == end
+    for timestamp in range(start, end + 1):
+        assert lo <= generate(timestamp=timestamp) <= hi
+    assert not lo <= generate(timestamp=start - 1) <= hi
+    assert not lo <= generate(timestamp=end + 1) <= hi
+
+    assert bounds(start) == (lo, bounds(start, start)[1])
+    assert bounds(start)[1] < bounds(start + 1)[0]
+
+    with pytest.raises(ValueError):
+        bounds(end, start)
+
+
+def test_uuid7_bounds_layout() -> None:
+    assert uuid_utils.uuid7_bounds(1_700_000_000_000) == (
+        uuid_utils.UUID("018bcfe5-6800-7000-8000-000000000000"),
+        uuid_utils.UUID("018bcfe5-6800-7fff-bfff-ffffffffffff"),
+    )
+    lo, hi = uuid_utils.uuid6_bounds(0)
+    assert hi.time - lo.time == 9_999
+
+    with pytest.raises(OverflowError):
+        uuid_utils.uuid7_bounds(2**48)
+
+
+def test_uuid1_many() -> None:
+    uuids = uuid_utils.uuid1_many(100, node=getnode(), clock_seq=123)
+    assert len(uuids) == len(set(uuids)) == 100
+    assert all(u.version == 1 and u.clock_seq == 123 for u in uuids)
+    assert all(u.node == getnode() for u in uuids)
+
+
+def test_uuid4_many() -> None:
+    uuids = uuid_utils.uuid4_many(1000)
+    assert len(uuids) == len(set(uuids)) == 1000
+    assert all(isinstance(u, uuid_utils.UUID) and u.version == 4 for u in uuids)
+    assert uuid_utils.uuid4_many(0) == []
+
+
+def test_uuid6_many() -> None:
+    uuids = uuid_utils.uuid6_many(100, clock_seq=1234)
+    assert len(set(uuids)) == 100
+    assert uuids == sorted(uuids)
+    assert all(u.version == 6 and u.clock_seq == 1234 for u in uuids)
+
+
+@pytest.mark.parametrize("version", [1, 6])
+def test_uuid_many_batches_do_not_overlap(version: int) -> None:
+    # Each batch runs ahead of the clock by one tick per UUID, which the
+    # next batch and single UUIDs must skip over.
+    generate = getattr(uuid_utils, f"uuid{version}")
+    generate_many = getattr(uuid_utils, f"uuid{version}_many")
+    first = generate_many(100_000, node=1, clock_seq=1234)
+    second = generate_many(100_000, node=1, clock_seq=1234)
+    single = [generate(node=1, clock_seq=1234) for _ in range(100)]
+    assert len(set(first) | set(second) | set(single)) == 200_100
+    assert max(first, key=lambda u: u.time).time < min(u.time for u in second)
+
+
+def test_uuid7_many_is_monotonic() -> None:
+    uuids = uuid_utils.uuid7_many(10_000)
+    assert all(u.version == 7 for u in uuids)
+    assert all(a < b for a, b in zip(uuids, uuids[1:]))
+
+
+def test_uuid8_many() -> None:
+    uuids = uuid_utils.uuid8_many(100)
+    assert len(set(uuids)) == 100
+    assert all(u.version == 8 for u in uuids)
+
+
+@pytest.mark.parametrize("version", [1, 4, 6, 7, 8])
+def test_uuid_bytes(version: int) -> None:
+    generate = getattr(uuid_utils, f"uuid{version}_bytes")
+    data = generate(100)
+    assert isinstance(data, bytes)
+    assert len(data) == 1600
+
+    uuids = [uuid_utils.UUID(bytes=data[i : i + 16]) for i in range(0, 1600, 16)]
+    assert len(set(uuids)) == 100
+    assert all(u.version == version for u in uuids)
+    assert generate(0) == b""
+
+
+@pytest.mark.parametrize("version", [1, 4, 6, 7, 8])
+def test_uuid_into(version: int) -> None:
+    fill = getattr(uuid_utils, f"uuid{version}_into")
+    buffer = bytearray(160)
+    assert fill(buffer) == 10
+    uuids = [
+        uuid_utils.UUID(bytes=bytes(buffer[i : i + 16])) for i in range(0, 160, 16)
+    ]
+    assert all(u.version == version for u in uuids)
+
+    view = memoryview(buffer)[16:48]
+    assert fill(view) == 2
+
+
+def test_uuid7_into_is_monotonic() -> None:
+    buffer = bytearray(16 * 1000)
+    uuid_utils.uuid7_into(buffer)
+    chunks = [bytes(buffer[i : i + 16]) for i in range(0, len(buffer), 16)]
+    assert chunks == sorted(chunks)
+    assert len(set(chunks)) == 1000
+
+
+def test_uuid_into_invalid_buffer() -> None:
+    with pytest.raises(ValueError):
+        uuid_utils.uuid4_into(bytearray(17))
+
+    with pytest.raises(TypeError):
+        uuid_utils.uuid4_into(bytes(16))
+
+
+PARSE_FORMS = [
+    "a8098c1a-f86e-11da-bd1a-00112444be1e",
+    "a8098c1af86e11dabd1a00112444be1e",
+    "{a8098c1a-f86e-11da-bd1a-00112444be1e}",
+    "urn:uuid:a8098c1a-f86e-11da-bd1a-00112444be1e",
+    b"a8098c1a-f86e-11da-bd1a-00112444be1e",
+]
+
+
+def test_parse_many() -> None:
+    expected = uuid_utils.UUID("a8098c1a-f86e-11da-bd1a-00112444be1e")
+    assert uuid_utils.parse_many(PARSE_FORMS) == [expected] * len(PARSE_FORMS)
+    assert uuid_utils.parse_many(iter(PARSE_FORMS[:2])) == [expected] * 2
+    assert uuid_utils.parse_many([]) == []
+
+
+def test_parse_many_errors() -> None:
+    values = ["a8098c1a-f86e-11da-bd1a-00112444be1e", "0-0-0-0-0"]
+    expected = uuid_utils.UUID(values[0])
+
+    with pytest.raises(ValueError, match="index 1"):
+        uuid_utils.parse_many(values)
+
+    assert uuid_utils.parse_many(values, errors="none") == [expected, None]
+
+    packed, mask = uuid_utils.parse_many(values, errors="mask")
+    assert packed == expected.bytes + bytes(16)
+    assert mask == b"\x01\x00"
+
+    with pytest.raises(ValueError):
+        uuid_utils.parse_many(values, errors="ignore")  # type: ignore[call-overload]
+
+    with pytest.raises(TypeError):
+        uuid_utils.parse_many([1], errors="none")  # type: ignore[list-item]
+
+
+FORMAT_STYLES = [
+    ("hyphenated", str),
+    ("simple", lambda u: u.hex),
+    ("urn", lambda u: u.urn),
+    ("braced", lambda u: f"{{{u}}}"),
+]
+
+
+@pytest.mark.parametrize("style, formatter", FORMAT_STYLES)
+def test_format_many(style: Any, formatter: Callable[[Any], str]) -> None:
+    uuids = uuid_utils.uuid4_many(10)
+    expected = [formatter(u) for u in uuids]
+    packed = b"".join(u.bytes for u in uuids)
+
+    assert uuid_utils.format_many(uuids, style) == expected
+    assert uuid_utils.format_many(packed, style) == expected
+    assert uuid_utils.format_many(packed, style, as_bytes=True) == "".join(
+        expected
+    ).encode("ascii")
+
+
+def test_format_many_invalid() -> None:
+    with pytest.raises(ValueError):
+        uuid_utils.format_many([], "upper")  # type: ignore[call-overload]
+
+    with pytest.raises(ValueError):
+        uuid_utils.format_many(bytes(17))
+
+    with pytest.raises(TypeError):
+        uuid_utils.format_many(["a8098c1a-f86e-11da-bd1a-00112444be1e"])  # type: ignore[list-item]
+
+
+@pytest.mark.parametrize("v7_method", ["counter", "random", "precision"])
+def test_generator(v7_method: Any) -> None:
+    generator = uuid_utils.Generator(v7_method=v7_method)
+    assert generator.v7_method == v7_method
+    assert generator.uuid4().version == 4
+    assert generator.uuid7().version == 7
+    assert all(u.version == 4 for u in generator.uuid4_many(10))
+
+    uuids = [generator.uuid7() for _ in range(1000)]
+    uuids += generator.uuid7_many(1000)
+    uuids.append(generator.uuid7())
+    assert all(a < b for a, b in zip(uuids, uuids[1:]))
+    assert abs(uuids[-1].timestamp - time.time() * 1000) < 10_000
+
+
+def test_generator_v7_precision() -> None:
+    generator = uuid_utils.Generator(v7_method="precision")
+    before = time.time_ns()
+    uuid = generator.uuid7()
+    after = time.time_ns()
+    fraction = (uuid.int >> 64) & 0xFFF
+    millis = uuid.timestamp + fraction / 4096
+    assert before / 1_000_000 - 1 / 4096 <= millis <= after / 1_000_000
+
+
+def test_generator_clock() -> None:
+    now = 1_500_000_000_123_456_789
+    generator = uuid_utils.Generator(clock=lambda: now)
+    uuids = [generator.uuid7(), *generator.uuid7_many(10), generator.uuid7()]
+    assert all(u.timestamp == 1_500_000_000_123 for u in uuids)
+    assert uuids == sorted(uuids)
+
+    uuid = generator.uuid7(timestamp=1_600_000_000_000)
+    assert uuid.timestamp == 1_600_000_000_000
+    assert all(
+        u.timestamp == 1_700_000_000_000
+        for u in generator.uuid7_many(10, timestamp=1_700_000_000_000)
+    )
+
+    # Backfills neither follow nor hold back the generator's own clock.
+    assert generator.uuid7(timestamp=1_000).timestamp == 1_000
+    assert all(u.timestamp == 1_000 for u in generator.uuid7_many(10, timestamp=1_000))
+    assert generator.uuid7().timestamp == 1_500_000_000_123
+    assert generator.uuid7() > uuids[-1]
+
+
+def test_generator_fast_rng() -> None:
+    generator = uuid_utils.Generator(rng="fast")
+    assert generator.rng == "fast"
+    assert uuid_utils.Generator().rng == "secure"
+
+    uuids = [generator.uuid4(), generator.uuid7(), generator.uuid8()]
+    assert [u.version for u in uuids] == [4, 7, 8]
+    assert all(u.variant == uuid_utils.RFC_4122 for u in uuids)
+    assert len(set(generator.uuid4_many(1000) + generator.uuid8_many(1000))) == 2000
+
+
+def test_generator_seed() -> None:
+    def generate(generator: uuid_utils.Generator) -> list[uuid_utils.UUID]:
+        return [
+            generator.uuid4(),
+            *generator.uuid4_many(10),
+            generator.uuid8(),
+            *generator.uuid8_many(10),
+            generator.uuid7(timestamp=1_500_000_000_000),
+        ]
+
+    first = generate(uuid_utils.Generator(rng="fast", seed=42))
+    assert generate(uuid_utils.Generator(rng="fast", seed=42)) == first
+    assert generate(uuid_utils.Generator(rng="fast", seed=43)) != first
+
+    with pytest.raises(ValueError):
+        uuid_utils.Generator(seed=42)
+
+    with pytest.raises(ValueError):
+        uuid_utils.Generator(rng="xoshiro")  # type: ignore[arg-type]
+
+
+def test_generator_invalid_v7_method() -> None:
+    with pytest.raises(ValueError):
+        uuid_utils.Generator(v7_method="timestamp")  # type: ignore[arg-type]
+
+
+def test_generator_threads() -> None:
+    import threading
+
+    results: list[list[uuid_utils.UUID]] = []
+
+    def worker() -> None:
+        generator = uuid_utils.Generator()
+        results.append([generator.uuid7() for _ in range(1000)])
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(result == sorted(result) for result in results)
+    assert len({u for result in results for u in result}) == 4000
+
+
 def test_uuid_comparisons() -> None:
     uuid_1 = uuid_utils.uuid8(0, 0, 1)
     uuid_2 = uuid_utils.uuid8(0, 0, 2)
@@ -229,9 +884,92 @@ def test_copy() -> None:
     assert copy.deepcopy(uuid) == uuid
 
 
+def test_uuid_buffer() -> None:
+    uuid = uuid_utils.uuid4()
+    view = memoryview(uuid)
+    assert view.readonly
+    assert view.nbytes == 16
+    assert view.tobytes() == bytes(uuid) == uuid.bytes
+    assert memoryview(uuid_utils.CachedUUID(int=uuid.int)) == view
+
+    buffer = bytearray(40)
+    buffer[4:20] = uuid
+    assert buffer[4:20] == uuid.bytes
+    assert uuid.write_to(buffer, 20) == 36
+    assert buffer[20:36] == uuid.bytes
+    assert uuid.write_to(memoryview(buffer)[24:]) == 16
+    assert buffer[24:40] == uuid.bytes
+
+    with pytest.raises(ValueError):
+        uuid.write_to(buffer, 25)
+
+    with pytest.raises(TypeError):
+        uuid.write_to(bytes(16))
+
+    with pytest.raises(OverflowError):
+        uuid.write_to(buffer, -1)
+
+
+def test_cached_uuid() -> None:
+    hex = "a8098c1a-f86e-11da-bd1a-00112444be1e"
+    uuid = uuid_utils.UUID(hex)
+    cached = uuid_utils.CachedUUID(hex)
+
+    assert isinstance(cached, uuid_utils.UUID)
+    assert cached == uuid
+    assert hash(cached) == hash(uuid)
+    assert str(cached) == str(uuid)
+    assert cached.hex == uuid.hex
+    assert cached.bytes == uuid.bytes
+    assert cached.urn == uuid.urn
+    assert cached.bytes_le == uuid.bytes_le
+    assert str(cached) is str(cached)
+    assert cached.hex is cached.hex
+    assert cached.urn is cached.urn
+    assert cached.bytes is cached.bytes
+    assert cached.bytes_le is cached.bytes_le
+    assert uuid_utils.CachedUUID(int=uuid.int) == uuid
+
+    assert type(pickle.loads(pickle.dumps(cached))) is uuid_utils.CachedUUID
+    assert copy.deepcopy(cached) is cached
+    assert copy.copy(cached) == cached
+    assert uuid_utils.uuid5(cached, "name") == uuid_utils.uuid5(uuid, "name")
+
+
+def test_uuid_free_list() -> None:
+    # Empty the free list, so that the UUIDs dropped below all fit on it.
+    held = [uuid_utils.uuid4() for _ in range(2048)]
+    uuids = [uuid_utils.uuid4() for _ in range(500)]
+
+    blocks = sys.getallocatedblocks()
+    uuids.clear()
+    # Without the free list, their 500 blocks would go back to the allocator.
+    assert blocks - sys.getallocatedblocks() < 100
+    assert len(held) == 2048
+
+
 def test_is_safe() -> None:
     assert uuid_utils.uuid1().is_safe is SafeUUID.unknown
     assert uuid_utils.uuid4().is_safe is SafeUUID.unknown
+    assert uuid_utils.SafeUUID is SafeUUID
+
+
+def test_import_is_lazy() -> None:
+    code = "import sys, uuid_utils; print(sorted(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = {line.rpartition("|")[2].strip() for line in result.stderr.splitlines()}
+    assert "uuid_utils._uuid_utils" in imported
+    assert "uuid" not in imported
+    assert "typing" not in imported
+    assert "collections.abc" not in imported
+    assert "'uuid_utils.compat'" not in result.stdout
+
+    assert uuid_utils.compat.uuid4().is_safe is SafeUUID.unknown
 
 
 def test_getnode() -> None:
@@ -240,6 +978,62 @@ def test_getnode() -> None:
     assert uuid_utils.getnode() == node
 
 
+def test_set_node() -> None:
+    try:
+        uuid_utils.set_node(0x0242AC110002)
+        assert uuid_utils.getnode() == 0x0242AC110002
+        assert uuid_utils.uuid1().node == 0x0242AC110002
+        assert uuid_utils.uuid6().node == 0x0242AC110002
+
+        uuid_utils.set_node(0)
+        assert uuid_utils.uuid1().node == 0
+
+        with pytest.raises(ValueError):
+            uuid_utils.set_node(1 << 48)
+    finally:
+        uuid_utils.set_node(None)
+
+    node = uuid_utils.warm_node()
+    assert node is not None
+    assert uuid_utils.getnode() == node
+
+
+def test_node_from_environment() -> None:
+    code = "import uuid_utils; print(uuid_utils.getnode(), uuid_utils.uuid1().node)"
+    env = {**os.environ, "UUID_UTILS_NODE": "02:42:ac:11:00:02"}
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True
+    )
+    assert result.stdout.split() == [str(0x0242AC110002)] * 2
+
+    env["UUID_UTILS_NODE"] = "not a mac"
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True
+    )
+    assert result.returncode != 0
+    assert "UUID_UTILS_NODE" in result.stderr
+
+
+def test_warm_node_in_background() -> None:
+    code = "import uuid_utils; print(uuid_utils.getnode())"
+    env = {**os.environ, "UUID_UTILS_WARM_NODE": "1"}
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True
+    )
+    assert 0 < int(result.stdout) < (1 << 48)
+
+
+def test_warm_node_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(uuid_utils, "warm_node", lambda **kwargs: calls.append(kwargs))
+    for value in ("0", "false", ""):
+        uuid_utils._node_from_environment({"UUID_UTILS_WARM_NODE": value})
+    assert calls == []
+
+    uuid_utils._node_from_environment({"UUID_UTILS_WARM_NODE": "1"})
+    assert calls == [{"background": True}]
+
+
 @pytest.mark.skipif(
     sys.platform in ("win32", "emscripten", "wasi"),
     reason="Does not run on Windows or WASM",
@@ -265,6 +1059,51 @@ def test_reseed_is_called_when_forking() -> None:
     assert next_parent_uuid != uuid_from_pipe
 
 
+@pytest.mark.skipif(
+    sys.platform in ("win32", "emscripten", "wasi"),
+    reason="Does not run on Windows or WASM",
+)
+def test_fast_generator_is_reseeded_when_forking() -> None:
+    generator = uuid_utils.Generator(rng="fast")
+    read_end, write_end = os.pipe()
+    generator.uuid4()
+
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        next_uuid_child = str(generator.uuid4())
+        with os.fdopen(write_end, "w") as write_pipe:
+            write_pipe.write(next_uuid_child)
+        os._exit(0)
+
+    os.close(write_end)
+    next_parent_uuid = generator.uuid4()
+    os.waitpid(pid, 0)
+    with os.fdopen(read_end) as read_pipe:
+        uuid_from_pipe = uuid_utils.UUID(read_pipe.read())
+
+    assert next_parent_uuid != uuid_from_pipe
+
+
+@pytest.mark.parametrize("size", [0, 16, 4096, 65536])
+def test_entropy_pool_size(size: int) -> None:
+    try:
+        uuid_utils.set_entropy_pool_size(size)
+        uuids = [uuid_utils.uuid4() for _ in range(1000)]
+        uuids += [uuid_utils.uuid8() for _ in range(1000)]
+        assert len(set(uuids)) == 2000
+        assert all(u.variant == uuid_utils.RFC_4122 for u in uuids)
+        assert len({uuid_utils._uuid4_int() for _ in range(1000)}) == 1000
+    finally:
+        uuid_utils.set_entropy_pool_size(4096)
+
+
+@pytest.mark.parametrize("size", [-16, 15, 2**21])
+def test_entropy_pool_size_invalid(size: int) -> None:
+    with pytest.raises((ValueError, OverflowError)):
+        uuid_utils.set_entropy_pool_size(size)
+
+
 def test_max_and_nil() -> None:
     assert uuid_utils.UUID("ffffffff-ffff-ffff-ffff-ffffffffffff") == uuid_utils.MAX
     assert uuid_utils.UUID("00000000-0000-0000-0000-000000000000") == uuid_utils.NIL